@@ -0,0 +1,160 @@
+"""
+Headless command line entry point.
+
+    python -m src.cli run config.json [--seed N] [--output-dir DIR] [--resume] [--quiet]
+    python -m src.cli sweep sweep.json [--workers N] [--output-dir DIR] [--quiet]
+    python -m src.cli bench [matrix.json] [--quick] [--output FILE] [--baseline FILE] [--threshold F]
+                            [--imports-only] [--import-budget SEC] [--quiet]
+
+The configuration file (.json or .toml) follows the schema of the saved
+simulation_config.json. A sweep file holds a "base_config" in that schema,
+a "grid" of dotted-path parameters to lists of values, and "seeds".
+A benchmark matrix file overrides keys of benchmark.DEFAULT_MATRIX.
+A configuration with an "island_config" section runs the island model.
+With a "checkpoint_config" section, SIGTERM stops the run after the current
+epoch and writes a checkpoint; rerun with --resume to continue it.
+Nothing here imports tkinter or matplotlib.
+"""
+import argparse
+import os
+import signal
+import sys
+
+from src.config.config_loader import config_from_dict, island_config_from_dict, load_config_dict
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Run genetic algorithm simulations without the UI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run a single simulation from a configuration file.")
+    run_parser.add_argument("config", help="Path to a .json or .toml simulation configuration.")
+    run_parser.add_argument("--seed", type=int, default=None, help="Override general_config.seed.")
+    run_parser.add_argument("--output-dir", default="results", help="Base directory for results (default: results).")
+    run_parser.add_argument("--resume", action="store_true",
+                            help="Continue from checkpoint_config.path if that checkpoint exists.")
+    run_parser.add_argument("--quiet", action="store_true", help="Do not print progress or the run summary.")
+    run_parser.set_defaults(handler=_run)
+
+    sweep_parser = subparsers.add_parser("sweep", help="Run a parameter grid x seeds across a process pool.")
+    sweep_parser.add_argument("spec", help="Path to a .json or .toml sweep specification.")
+    sweep_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores).")
+    sweep_parser.add_argument("--output-dir", default=None, help="Sweep directory; rerun with the same one to resume.")
+    sweep_parser.add_argument("--quiet", action="store_true", help="Do not print progress.")
+    sweep_parser.set_defaults(handler=_sweep)
+
+    bench_parser = subparsers.add_parser("bench", help="Benchmark the epoch loop and compare against a baseline.")
+    bench_parser.add_argument("matrix", nargs="?", default=None, help="Optional .json or .toml benchmark matrix.")
+    bench_parser.add_argument("--quick", action="store_true", help="Small dimensions and populations only.")
+    bench_parser.add_argument("--output", default="benchmarks/latest.json", help="Report file (default: benchmarks/latest.json).")
+    bench_parser.add_argument("--baseline", default=None, help="Report to compare against; regressions exit with status 1.")
+    bench_parser.add_argument("--threshold", type=float, default=None, help="Allowed epochs/sec slowdown fraction (default: 0.10).")
+    bench_parser.add_argument("--imports-only", action="store_true", help="Only check the startup import budget.")
+    bench_parser.add_argument("--import-budget", type=float, default=None,
+                              help="Allowed seconds to import each entry point (default: 0.5).")
+    bench_parser.add_argument("--quiet", action="store_true", help="Do not print progress.")
+    bench_parser.set_defaults(handler=_bench)
+
+    return parser
+
+
+def _run(args: argparse.Namespace) -> int:
+    from src.core.island import IslandModel
+    from src.core.simulation import Simulation
+
+    try:
+        config_dict = load_config_dict(args.config)
+        if args.seed is not None:
+            config_dict.setdefault("general_config", {})["seed"] = args.seed
+        simulation_config = config_from_dict(config_dict)
+        island_config = island_config_from_dict(config_dict)
+    except (OSError, ValueError, KeyError, AssertionError) as e:
+        print(f"Invalid configuration: {e!r}", file=sys.stderr)
+        return 2
+
+    if island_config is not None:
+        simulation = IslandModel(simulation_config, island_config, results_dir=args.output_dir, quiet=args.quiet)
+        simulation.start()
+    else:
+        simulation = Simulation(simulation_config, results_dir=args.output_dir, quiet=args.quiet)
+        # let a batch scheduler's SIGTERM end the run cleanly between epochs
+        signal.signal(signal.SIGTERM, lambda signum, frame: simulation.request_stop())
+
+        checkpoint_config = simulation_config.checkpoint_config
+        if args.resume and checkpoint_config is not None and os.path.exists(checkpoint_config.path):
+            simulation.resume(checkpoint_config.path)
+        else:
+            simulation.start()
+
+    if not args.quiet:
+        print(f"Best cost: {simulation.best_cost_history[-1]}")
+        print(f"Elapsed time: {simulation.elapsed_time:.2f} s")
+    return 0
+
+
+def _sweep(args: argparse.Namespace) -> int:
+    from src.core.sweep import ParameterSweep
+
+    try:
+        spec = load_config_dict(args.spec)
+        sweep = ParameterSweep.from_spec(spec, args.output_dir, args.workers, args.quiet)
+    except (OSError, ValueError, KeyError, AssertionError) as e:
+        print(f"Invalid sweep specification: {e!r}", file=sys.stderr)
+        return 2
+
+    histories_path = sweep.run()
+    if not args.quiet:
+        print(f"Aggregated histories: {histories_path}")
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    from src.core import benchmark
+
+    try:
+        matrix = dict(benchmark.QUICK_MATRIX if args.quick else benchmark.DEFAULT_MATRIX)
+        if args.matrix is not None:
+            matrix.update(load_config_dict(args.matrix))
+        baseline = benchmark.load_report(args.baseline) if args.baseline else None
+    except (OSError, ValueError) as e:
+        print(f"Invalid benchmark input: {e!r}", file=sys.stderr)
+        return 2
+
+    import_budget = benchmark.DEFAULT_IMPORT_BUDGET_SEC if args.import_budget is None else args.import_budget
+    imports = benchmark.measure_imports(import_budget)
+    for result in imports:
+        if result["violation"]:
+            details = result.get("error") or f"{result['seconds']:.3f} s, loads {result['heavy_modules'] or 'nothing heavy'}"
+            print(f"IMPORT BUDGET {result['module']}: {details}")
+    import_violations = any(result["violation"] for result in imports)
+    if args.imports_only:
+        return 1 if import_violations else 0
+
+    report = benchmark.run_benchmark(matrix, quiet=args.quiet)
+    report["imports"] = imports
+    benchmark.save_report(report, args.output)
+    if not args.quiet:
+        print(f"Benchmark report: {args.output}")
+
+    regressions = []
+    if baseline is not None:
+        threshold = benchmark.DEFAULT_THRESHOLD if args.threshold is None else args.threshold
+        regressions = benchmark.compare_to_baseline(report, baseline, threshold)
+    for regression in regressions:
+        if "error" in regression:
+            print(f"REGRESSION {regression['id']}: fails now, ran at {regression['baseline_epochs_per_sec']:.2f} "
+                  f"epochs/s in the baseline: {regression['error']}")
+            continue
+        print(f"REGRESSION {regression['id']}: {regression['epochs_per_sec']:.2f} epochs/s "
+              f"vs {regression['baseline_epochs_per_sec']:.2f} baseline ({regression['ratio']:.0%})")
+    return 1 if regressions or import_violations else 0
+
+
+def main(argv: list[str] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+class CheckpointConfig:
+    def __init__(self, path: str, every_epochs: int = None, every_seconds: float = None) -> None:
+        assert path
+        assert every_epochs is None or every_epochs > 0
+        assert every_seconds is None or every_seconds > 0
+        assert every_epochs is not None or every_seconds is not None
+
+        self.path = path
+        self.every_epochs = every_epochs
+        self.every_seconds = every_seconds
@@ -0,0 +1,196 @@
+import json
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict
+
+from src.config.checkpoint_config import CheckpointConfig
+from src.config.cost_function_config import CostFunctionConfig
+from src.config.crossing_config import CrossingConfig
+from src.config.evaluator_config import EvaluatorConfig
+from src.config.fitness_cache_config import FitnessCacheConfig
+from src.config.general_config import GeneralConfig
+from src.config.island_config import IslandConfig
+from src.config.inversion_config import InversionConfig
+from src.config.mutation_config import MutationConfig
+from src.config.results_config import ResultsConfig
+from src.config.selection_config import SelectionConfig
+from src.config.simulation_config import SimulationConfiguration
+from src.config.termination_config import TerminationConfig
+from src.core.cost_function import CostFunction
+from src.core.crossing import CrossingMethodType
+from src.core.evaluator import EvaluatorType
+from src.core.island import MigrationTopology
+from src.core.mutation import MutationMethodType
+from src.core.results_saver import ResultsFormat
+from src.core.selection import SelectionMethodType
+from src.core.unit import UnitFactory
+
+
+def load_config_dict(path: str) -> Dict[str, Any]:
+    """
+    Read a configuration file (.json or .toml) following the schema
+    written by results_saver.config_to_dict.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".toml":
+        import tomllib
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def config_from_dict(config: Dict[str, Any]) -> SimulationConfiguration:
+    """
+    Build a SimulationConfiguration from a dictionary shaped like config_to_dict's output.
+    Enum fields accept their str() form ("SelectionMethodType.BEST"), member name or display value.
+    Invalid values raise AssertionError, like the config classes themselves.
+    """
+    general = config["general_config"]
+    general_config = GeneralConfig(
+        int(general["population_size"]),
+        int(general["epochs_no"]),
+        int(general.get("chromosome_precision", 6)),
+        seed=general.get("seed")
+    )
+
+    cost = config["cost_function_config"]
+    cost_function_config = CostFunctionConfig(
+        int(cost["dimensions"]),
+        _parse_cost_function(cost["cost_function_name"]),
+        bool(cost.get("reference_backend", False))
+    )
+
+    lower_bounds, upper_bounds = cost_function_config.cost_func.suggested_bounds()
+    unit_factory = UnitFactory(lower_bounds, upper_bounds)
+
+    selection = config["selection_config"]
+    selection_config = SelectionConfig(
+        _parse_enum(SelectionMethodType, selection["selection_type"]),
+        int(selection["selection_percentage"]),
+        bool(selection.get("is_maximization", False)),
+        selection.get("tournament_size")
+    )
+
+    crossing = config["crossing_config"]
+    crossing_config = CrossingConfig(
+        _parse_enum(CrossingMethodType, crossing["crossing_type"]),
+        int(crossing["crossing_percentage"]),
+        unit_factory,
+        int(crossing.get("elite_count", 1)),
+        grain=crossing.get("grain_size")
+    )
+
+    mutation = config["mutation_config"]
+    mutation_config = MutationConfig(
+        unit_factory,
+        _parse_enum(MutationMethodType, mutation["mutation_type"]),
+        int(mutation["probability"]),
+        sigma=float(mutation.get("sigma", 0.1))
+    )
+
+    inversion_config = InversionConfig(unit_factory, int(config["inversion_config"]["probability"]))
+
+    evaluator_config = None
+    evaluator = config.get("evaluator_config")
+    if evaluator:
+        evaluator_config = EvaluatorConfig(
+            cost_function_config,
+            _parse_enum(EvaluatorType, evaluator.get("evaluator_type", "SERIAL")),
+            evaluator.get("workers"),
+            evaluator.get("chunk_size")
+        )
+
+    fitness_cache_config = None
+    cache = config.get("fitness_cache_config")
+    if cache:
+        fitness_cache_config = FitnessCacheConfig(
+            cache.get("max_entries", 100_000),
+            cache.get("max_bytes"),
+            bool(cache.get("round_to_precision", False))
+        )
+
+    results_config = None
+    results = config.get("results_config")
+    if results:
+        results_config = ResultsConfig(
+            bool(results.get("streaming", False)),
+            int(results.get("flush_every_rows", 100)),
+            results.get("flush_interval_sec", 5.0),
+            bool(results.get("keep_history", True)),
+            _parse_enum(ResultsFormat, results.get("results_format", "TEXT")),
+            bool(results.get("record_stage_timings", False)),
+            int(results.get("record_every", 1))
+        )
+
+    checkpoint_config = None
+    checkpoint = config.get("checkpoint_config")
+    if checkpoint:
+        checkpoint_config = CheckpointConfig(
+            checkpoint["path"],
+            checkpoint.get("every_epochs"),
+            checkpoint.get("every_seconds")
+        )
+
+    termination_config = None
+    termination = config.get("termination_config")
+    if termination:
+        termination_config = TerminationConfig(
+            termination.get("stagnation_epochs"),
+            termination.get("target_cost"),
+            float(termination.get("target_tolerance", 0.0)),
+            termination.get("max_evaluations"),
+            termination.get("max_seconds")
+        )
+
+    return SimulationConfiguration(
+        unit_factory,
+        cost_function_config,
+        crossing_config,
+        general_config,
+        inversion_config,
+        mutation_config,
+        selection_config,
+        evaluator_config=evaluator_config,
+        fitness_cache_config=fitness_cache_config,
+        results_config=results_config,
+        checkpoint_config=checkpoint_config,
+        termination_config=termination_config
+    )
+
+
+def island_config_from_dict(config: Dict[str, Any]) -> IslandConfig:
+    """IslandConfig from the optional "island_config" section, or None when it is absent"""
+    island = config.get("island_config")
+    if not island:
+        return None
+    # islands advance in lockstep between migrations, so one of them cannot stop early
+    assert not config.get("termination_config"), "termination_config is not supported together with island_config"
+    return IslandConfig(
+        int(island["islands_count"]),
+        int(island.get("migration_interval", 10)),
+        int(island.get("migrants_count", 1)),
+        _parse_enum(MigrationTopology, island.get("topology", "RING"))
+    )
+
+
+def _parse_enum(enum_class: type[Enum], text: str) -> Enum:
+    text = str(text)
+    member_name = text.split(".", 1)[1] if text.startswith(enum_class.__name__ + ".") else text
+    for member in enum_class:
+        if member_name in (member.name, member._name_) or text == member.value:
+            return member
+    raise AssertionError(f"Unknown {enum_class.__name__}: {text}")
+
+
+# class names written by older versions
+_LEGACY_COST_FUNCTION_NAMES = {"CEC2014_F3_Wrapper": "CEC2014_F3"}
+
+
+def _parse_cost_function(text: str) -> CostFunction:
+    # config_to_dict stores the implementing class name, e.g. "Rastrigin" or "CEC2014_F3"
+    text = _LEGACY_COST_FUNCTION_NAMES.get(text, text)
+    for member in CostFunction:
+        if text in (member.name, member._name_, member.class_name):
+            return member
+    raise AssertionError(f"Unknown cost function: {text}")
@@ -1,9 +1,13 @@
 from src.core.cost_function import CostFunction
 
 class CostFunctionConfig:
-    def __init__(self, dimensions: int, cost_function: CostFunction) -> None:
+    def __init__(self, dimensions: int, cost_function: CostFunction, reference_backend: bool = False) -> None:
         assert dimensions > 0
         assert cost_function is not None
-        if cost_function == CostFunction.CEC2014_F3: dimensions = 10
+        assert cost_function.supported_dimensions is None or dimensions in cost_function.supported_dimensions, \
+            f"{cost_function.name} supports {cost_function.supported_dimensions} dimensions, got {dimensions}"
+        assert not reference_backend or cost_function.has_reference
         self.dimensions = dimensions
-        self.cost_func = cost_function.func_class(dimensions)
\ No newline at end of file
+        self.reference_backend = reference_backend
+        func_class = cost_function.reference_class if reference_backend else cost_function.func_class
+        self.cost_func = func_class(dimensions)
\ No newline at end of file
@@ -8,7 +8,9 @@ class CrossingConfig:
         self.__crossing_type = crossing_type
         self.elite_count = elite_count
         self.probability = probability
-        self.crossing_func = self._get_crossing_implementation().cross
+        crossing = self._get_crossing_implementation()
+        self.crossing_func = crossing.cross
+        self.crossing_batch_func = crossing.cross_batch
         
         self.crossing_type = crossing_type
         self.grain = grain
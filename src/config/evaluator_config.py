@@ -0,0 +1,18 @@
+from src.config.cost_function_config import CostFunctionConfig
+from src.core.evaluator import EvaluatorType, create_evaluator
+
+
+class EvaluatorConfig:
+    def __init__(self, cost_function_config: CostFunctionConfig,
+                 evaluator_type: EvaluatorType = EvaluatorType.SERIAL,
+                 workers: int = None, chunk_size: int = None) -> None:
+        assert evaluator_type is not None
+        assert workers is None or workers > 0
+        assert chunk_size is None or chunk_size > 0
+
+        self.evaluator_type = evaluator_type
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+        self.evaluator = create_evaluator(evaluator_type, cost_function_config.cost_func, workers, chunk_size)
+        self.evaluate_func = self.evaluator.evaluate
\ No newline at end of file
@@ -0,0 +1,9 @@
+class FitnessCacheConfig:
+    def __init__(self, max_entries: int = 100_000, max_bytes: int = None, round_to_precision: bool = False) -> None:
+        assert max_entries is None or max_entries > 0
+        assert max_bytes is None or max_bytes > 0
+        assert max_entries is not None or max_bytes is not None
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.round_to_precision = round_to_precision
\ No newline at end of file
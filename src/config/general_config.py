@@ -1,9 +1,11 @@
 class GeneralConfig:
-    def __init__(self, population_size: int, epochs_no: int, chromosome_repr_precistion: int) -> None:
+    def __init__(self, population_size: int, epochs_no: int, chromosome_repr_precistion: int, seed: int = None) -> None:
         assert population_size > 0
         assert epochs_no > 0
         assert chromosome_repr_precistion > 0
+        assert seed is None or seed >= 0
         
         self.population_size = population_size
         self.epochs_no = epochs_no
-        self.repr_precision = chromosome_repr_precistion
\ No newline at end of file
+        self.repr_precision = chromosome_repr_precistion
+        self.seed = seed
\ No newline at end of file
@@ -7,7 +7,9 @@ class InversionConfig:
     def __init__(self, unit_factory: UnitFactory, probability: int):
         assert probability is not None and probability > 0 and probability < 100
         self.__probability = probability
-        self.inversion_func = StandardInversion(unit_factory, probability).invert
+        inversion = StandardInversion(unit_factory, probability)
+        self.inversion_func = inversion.invert
+        self.inversion_batch_func = inversion.invert_population
         
         # Public property for serialization
         self.probability = probability 
\ No newline at end of file
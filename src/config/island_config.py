@@ -0,0 +1,15 @@
+from src.core.island import MigrationTopology
+
+
+class IslandConfig:
+    def __init__(self, islands_count: int, migration_interval: int, migrants_count: int,
+                 topology: MigrationTopology = MigrationTopology.RING) -> None:
+        assert islands_count > 1
+        assert migration_interval > 0
+        assert migrants_count > 0
+        assert topology is not None
+
+        self.islands_count = islands_count
+        self.migration_interval = migration_interval
+        self.migrants_count = migrants_count
+        self.topology = topology
\ No newline at end of file
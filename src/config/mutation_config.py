@@ -1,10 +1,13 @@
+from typing import Sequence
+
 from src.core.mutation import AbstractMutation, MutationMethodType, UniformMutation, GaussianMutation
 from src.core.unit import UnitFactory
 
 
 class MutationConfig:
     def __init__(self, unit_factory: UnitFactory, mutation_type: MutationMethodType,
-                 probability: int, sigma: float = 0.1): 
+                 probability: int, sigma: float = 0.1,
+                 lower_bounds: Sequence[float] = None, upper_bounds: Sequence[float] = None): 
         assert mutation_type is not None
         assert 0 < probability < 100
 
@@ -12,15 +15,22 @@ class MutationConfig:
         self.__mutation_type = mutation_type
         self.__probability = probability
         self.__sigma = sigma
+        self.__lower_bounds = lower_bounds
+        self.__upper_bounds = upper_bounds
 
-        self.mutation_func = self._get_mutation_implementation().mutate
+        mutation = self._get_mutation_implementation()
+        self.mutation_func = mutation.mutate
+        self.mutation_batch_func = mutation.mutate_population
         
         self.mutation_type = mutation_type
         self.probability = probability
+        self.sigma = sigma
         
     def _get_mutation_implementation(self) -> AbstractMutation:
         match self.__mutation_type:
             case MutationMethodType.UNIFORM:
-                return UniformMutation(self.__probability, self.__unit_factory)
+                return UniformMutation(self.__probability, self.__unit_factory,
+                                       self.__lower_bounds, self.__upper_bounds)
             case MutationMethodType.GAUSSIAN:
-                return GaussianMutation(self.__probability, self.__unit_factory, sigma=self.__sigma)
\ No newline at end of file
+                return GaussianMutation(self.__probability, self.__unit_factory, sigma=self.__sigma,
+                                        lower_bounds=self.__lower_bounds, upper_bounds=self.__upper_bounds)
\ No newline at end of file
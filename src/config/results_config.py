@@ -0,0 +1,23 @@
+from src.core.results_saver import ResultsFormat
+
+
+class ResultsConfig:
+    def __init__(self, streaming: bool = False, flush_every_rows: int = 100, flush_interval_sec: float = 5.0,
+                 keep_history: bool = True, results_format: ResultsFormat = ResultsFormat.TEXT,
+                 record_stage_timings: bool = False, record_every: int = 1) -> None:
+        assert flush_every_rows > 0
+        assert record_every > 0
+        assert results_format is not None
+        # metrics are streamed as CSV rows; binary histories are written from memory at the end
+        assert not (streaming and results_format == ResultsFormat.BINARY)
+        assert flush_interval_sec is None or flush_interval_sec > 0
+        # without streaming the histories are the only copy of the metrics
+        assert streaming or keep_history
+
+        self.streaming = streaming
+        self.flush_every_rows = flush_every_rows
+        self.flush_interval_sec = flush_interval_sec
+        self.keep_history = keep_history
+        self.results_format = results_format
+        self.record_stage_timings = record_stage_timings
+        self.record_every = record_every
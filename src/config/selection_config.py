@@ -13,7 +13,9 @@ class SelectionConfig:
         self.selection_percentage = selection_percentage
         self.tournament_size = tournament_size
 
-        self.selection_func = self._get_selection_implementation().select
+        selection = self._get_selection_implementation()
+        self.selection_func = selection.select
+        self.selection_batch_func = selection.select_indices
 
     def _get_selection_implementation(self):
         match self.selection_type:
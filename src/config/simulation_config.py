@@ -1,10 +1,15 @@
+from src.config.checkpoint_config import CheckpointConfig
 from src.config.cost_function_config import CostFunctionConfig
 from src.config.general_config import GeneralConfig
 from src.config.crossing_config import CrossingConfig
+from src.config.evaluator_config import EvaluatorConfig
+from src.config.fitness_cache_config import FitnessCacheConfig
 from src.config.general_config import GeneralConfig
 from src.config.inversion_config import InversionConfig
 from src.config.mutation_config import MutationConfig
+from src.config.results_config import ResultsConfig
 from src.config.selection_config import SelectionConfig
+from src.config.termination_config import TerminationConfig
 from src.core.unit import UnitFactory
 
 
@@ -17,7 +22,12 @@ class SimulationConfiguration:
         general_config: GeneralConfig,
         inversion_config: InversionConfig,
         mutation_config: MutationConfig,
-        selection_config: SelectionConfig) -> None:
+        selection_config: SelectionConfig,
+        evaluator_config: EvaluatorConfig = None,
+        fitness_cache_config: FitnessCacheConfig = None,
+        results_config: ResultsConfig = None,
+        checkpoint_config: CheckpointConfig = None,
+        termination_config: TerminationConfig = None) -> None:
 
         self.unit_factory = unit_factory
         self.cost_function_config = cost_function_config
@@ -26,3 +36,8 @@ class SimulationConfiguration:
         self.inversion_config = inversion_config
         self.mutation_config = mutation_config
         self.selection_config = selection_config
+        self.evaluator_config = evaluator_config or EvaluatorConfig(cost_function_config)
+        self.fitness_cache_config = fitness_cache_config
+        self.results_config = results_config or ResultsConfig()
+        self.checkpoint_config = checkpoint_config
+        self.termination_config = termination_config
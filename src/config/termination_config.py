@@ -0,0 +1,13 @@
+class TerminationConfig:
+    def __init__(self, stagnation_epochs: int = None, target_cost: float = None, target_tolerance: float = 0.0,
+                 max_evaluations: int = None, max_seconds: float = None) -> None:
+        assert stagnation_epochs is None or stagnation_epochs > 0
+        assert target_tolerance >= 0
+        assert max_evaluations is None or max_evaluations > 0
+        assert max_seconds is None or max_seconds > 0
+
+        self.stagnation_epochs = stagnation_epochs
+        self.target_cost = target_cost
+        self.target_tolerance = target_tolerance
+        self.max_evaluations = max_evaluations
+        self.max_seconds = max_seconds
@@ -0,0 +1,231 @@
+import itertools
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.core.cost_function import CostFunction
+from src.core.crossing import CrossingMethodType
+from src.core.mutation import MutationMethodType
+from src.core.selection import SelectionMethodType
+
+# Slowdowns beyond this fraction of the baseline's epochs/sec are reported as regressions
+DEFAULT_THRESHOLD = 0.10
+
+# Entry points that must start without loading any cost function backend or plotting library
+IMPORT_CHECKS = ("src.cli", "src.core.simulation", "src.config.config_loader", "src.ui.simulation_ui")
+HEAVY_MODULES = ("benchmark_functions", "opfunu", "matplotlib", "scipy")
+DEFAULT_IMPORT_BUDGET_SEC = 0.5
+# the probes import 'src' the way the entry points do, whatever the caller's working directory
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_IMPORT_PROBE = (
+    "import json, sys, time\n"
+    "started = time.perf_counter()\n"
+    "import {module}\n"
+    "seconds = time.perf_counter() - started\n"
+    "print(json.dumps({{'seconds': seconds, 'heavy_modules': [m for m in {heavy!r} if m in sys.modules]}}))\n"
+)
+
+DEFAULT_MATRIX = {
+    # one basic, one hybrid and one composition function stand in for the CEC2014 suite
+    "cost_functions": [member.class_name for member in CostFunction if not member._name_.startswith("CEC2014")]
+                      + ["CEC2014_F1", "CEC2014_F17", "CEC2014_F30"],
+    "dimensions": [2, 100, 1000],
+    "population_sizes": [100, 10_000, 50_000],
+    "crossing_types": [member.name for member in CrossingMethodType],
+    "mutation_types": [member.name for member in MutationMethodType],
+    "selection_types": [member.name for member in SelectionMethodType],
+    "epochs": 5,
+    "repeats": 1,
+    "seed": 0
+}
+
+QUICK_MATRIX = {
+    **DEFAULT_MATRIX,
+    "dimensions": [2, 30],
+    "population_sizes": [100, 1000]
+}
+
+
+def benchmark_cases(matrix: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Cases for a benchmark matrix.
+    Every cost function x dimension x population size runs with the first listed operators;
+    every other crossing, mutation and selection type runs once per dimension x population size
+    on the first cost function. The full operator product would multiply the run time
+    without telling much more about the epoch loop.
+    """
+    default_operators = {
+        "crossing_type": matrix["crossing_types"][0],
+        "mutation_type": matrix["mutation_types"][0],
+        "selection_type": matrix["selection_types"][0]
+    }
+    sizes = list(itertools.product(matrix["dimensions"], matrix["population_sizes"]))
+
+    cases = []
+    for cost_function, (dimensions, population_size) in itertools.product(matrix["cost_functions"], sizes):
+        cases.append({"cost_function": cost_function, "dimensions": dimensions,
+                      "population_size": population_size, **default_operators})
+
+    for key, values in (("crossing_type", matrix["crossing_types"]),
+                        ("mutation_type", matrix["mutation_types"]),
+                        ("selection_type", matrix["selection_types"])):
+        for value in values[1:]:
+            for dimensions, population_size in sizes:
+                cases.append({"cost_function": matrix["cost_functions"][0], "dimensions": dimensions,
+                              "population_size": population_size, **default_operators, key: value})
+    return cases
+
+
+def case_id(case: Dict[str, Any]) -> str:
+    return (f"{case['cost_function']}|d={case['dimensions']}|n={case['population_size']}|"
+            f"{case['crossing_type']}|{case['mutation_type']}|{case['selection_type']}")
+
+
+def case_config(case: Dict[str, Any], epochs: int, seed: int) -> Dict[str, Any]:
+    """Simulation configuration (config_to_dict schema) for one case"""
+    return {
+        "general_config": {"population_size": case["population_size"], "epochs_no": epochs,
+                           "chromosome_precision": 6, "seed": seed},
+        "cost_function_config": {"dimensions": case["dimensions"], "cost_function_name": case["cost_function"]},
+        "selection_config": {"selection_type": case["selection_type"], "selection_percentage": 50,
+                             "is_maximization": False, "tournament_size": 3},
+        "crossing_config": {"crossing_type": case["crossing_type"], "crossing_percentage": 80, "elite_count": 1},
+        "mutation_config": {"mutation_type": case["mutation_type"], "probability": 20},
+        "inversion_config": {"probability": 10}
+    }
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(config_dict: Dict[str, Any], repeats: int) -> Dict[str, Any]:
+    """
+    Time the epoch loop of one case (no results are saved).
+    Runs in a fresh worker process, so the peak RSS belongs to this case alone.
+    """
+    from src.config.config_loader import config_from_dict
+    from src.core.simulation import Simulation
+
+    config = config_from_dict(config_dict)
+    epochs = config.general_config.epochs_no
+    best_time, evaluations = None, 0
+    for _ in range(repeats):
+        simulation = Simulation(config, quiet=True)
+        started = time.perf_counter()
+        simulation.initialize()
+        for _ in range(epochs):
+            simulation.run_epoch()
+        simulation.finish()
+        elapsed = time.perf_counter() - started
+        if best_time is None or elapsed < best_time:
+            best_time, evaluations = elapsed, simulation.cost_evaluations
+
+    return {
+        "elapsed_time": best_time,
+        "epochs_per_sec": epochs / best_time,
+        "evaluations_per_sec": evaluations / best_time,
+        "peak_rss_mb": _peak_rss_mb()
+    }
+
+
+def run_benchmark(matrix: Dict[str, Any], quiet: bool = False) -> Dict[str, Any]:
+    """Run every case of 'matrix' one after another, each in its own process"""
+    matrix = {**DEFAULT_MATRIX, **matrix}
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": {"python": platform.python_version(), "numpy": np.__version__,
+                    "platform": platform.platform(), "processor": platform.processor()},
+        "matrix": matrix,
+        "cases": []
+    }
+
+    cases = benchmark_cases(matrix)
+    for index, case in enumerate(cases, start=1):
+        record = {"id": case_id(case), **case}
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                config = case_config(case, matrix["epochs"], matrix["seed"])
+                record.update(pool.submit(run_case, config, matrix["repeats"]).result())
+        except Exception:
+            # e.g. CEC2014 functions only exist for a few dimensions
+            record["error"] = traceback.format_exc(limit=1).strip().splitlines()[-1]
+        report["cases"].append(record)
+
+        if not quiet:
+            if "error" in record:
+                print(f"[{index}/{len(cases)}] {record['id']}: {record['error']}")
+            else:
+                print(f"[{index}/{len(cases)}] {record['id']}: {record['epochs_per_sec']:.2f} epochs/s, "
+                      f"{record['evaluations_per_sec']:.0f} evals/s, {record['peak_rss_mb']:.0f} MB")
+    return report
+
+
+def measure_imports(budget_sec: float = DEFAULT_IMPORT_BUDGET_SEC) -> List[Dict[str, Any]]:
+    """
+    Import every IMPORT_CHECKS module in a fresh interpreter and record how long it took
+    and which HEAVY_MODULES it loaded. Entries over the budget or loading a heavy module
+    are marked as violations.
+    """
+    results = []
+    for module in IMPORT_CHECKS:
+        probe = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+        completed = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, cwd=_PROJECT_ROOT)
+        if completed.returncode != 0:
+            error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "import failed"
+            results.append({"module": module, "error": error, "violation": True})
+            continue
+
+        result = {"module": module, **json.loads(completed.stdout)}
+        result["violation"] = bool(result["heavy_modules"]) or result["seconds"] > budget_sec
+        results.append(result)
+    return results
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any],
+                        threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Cases whose epochs/sec dropped more than 'threshold' (a fraction) below the baseline,
+    and cases that ran in the baseline but fail now (with their 'error' and no ratio).
+    Cases missing from either report, or that failed in the baseline, are ignored.
+    """
+    baseline_cases = {case["id"]: case for case in baseline["cases"] if "error" not in case}
+    regressions = []
+    for case in report["cases"]:
+        reference = baseline_cases.get(case["id"])
+        if reference is None:
+            continue
+        if "error" in case:
+            regressions.append({"id": case["id"], "baseline_epochs_per_sec": reference["epochs_per_sec"],
+                                "epochs_per_sec": None, "ratio": None, "error": case["error"]})
+            continue
+        ratio = case["epochs_per_sec"] / reference["epochs_per_sec"]
+        if ratio < 1.0 - threshold:
+            regressions.append({"id": case["id"], "baseline_epochs_per_sec": reference["epochs_per_sec"],
+                                "epochs_per_sec": case["epochs_per_sec"], "ratio": ratio})
+    return regressions
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
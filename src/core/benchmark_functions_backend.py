@@ -0,0 +1,9 @@
+"""
+Reference backend: the benchmark_functions package's own implementations,
+evaluated point by point. Optional - only needed with
+CostFunctionConfig(..., reference_backend=True) or to cross-check
+native_cost_functions. Imported on first use because it pulls in scipy.
+"""
+from benchmark_functions import Ackley, Hyperellipsoid, Hypersphere, Rastrigin, Rosenbrock
+
+__all__ = ["Ackley", "Hyperellipsoid", "Hypersphere", "Rastrigin", "Rosenbrock"]
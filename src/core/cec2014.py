@@ -0,0 +1,343 @@
+"""
+CEC2014 benchmark suite (F1-F30), evaluated on whole (n, dims) batches.
+Formulas, shift vectors, rotation matrices and shuffles follow opfunu's cec2014
+module, which stays the data source and the reference implementation
+(opfunu_backend). Each data file is converted once to .npy under CACHE_DIR and
+memory-mapped, so every process on the machine shares the same pages and
+pickled functions only carry their dimension count.
+"""
+import functools
+import importlib.util
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from src.core.native_cost_functions import NativeCostFunction
+
+SUPPORTED_DIMENSIONS = (10, 20, 30, 50, 100)
+CACHE_DIR = Path(os.environ.get("GA_CEC2014_CACHE", Path.home() / ".cache" / "ga-simulation" / "cec2014"))
+
+
+def _opfunu_data_dir() -> Path:
+    # find_spec locates the package without importing it (opfunu pulls in matplotlib)
+    spec = importlib.util.find_spec("opfunu")
+    if spec is None:
+        raise ImportError("opfunu is needed once to build the CEC2014 data cache")
+    return Path(spec.submodule_search_locations[0]) / "cec_based" / "data_2014"
+
+
+@functools.lru_cache(maxsize=None)
+def load_data(name: str) -> np.ndarray:
+    """
+    Read-only memory map of one opfunu data file, e.g. "M_1_D10".
+    The first use on a machine parses the text file and stores it as .npy in CACHE_DIR;
+    every later load in any process only maps that file.
+    """
+    path = CACHE_DIR / f"{name}.npy"
+    if not path.exists():
+        data = np.genfromtxt(_opfunu_data_dir() / f"{name}.txt", dtype=float)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return np.load(path, mmap_mode="r")
+
+
+def _shift(number: int, dims: int) -> np.ndarray:
+    if number <= 22:
+        return load_data(f"shift_data_{number}").reshape(-1)[:dims]
+    # composition functions keep one shift row per component
+    return load_data(f"shift_data_{number}")[:, :dims]
+
+
+def _rotation(number: int, dims: int) -> np.ndarray:
+    return load_data(f"M_{number}_D{dims}")[:, :dims]
+
+
+def _shuffle(number: int, dims: int) -> np.ndarray:
+    return load_data(f"shuffle_data_{number}_D{dims}").reshape(-1)[:dims].astype(np.intp) - 1
+
+
+# Basic functions; every one maps each row of z to a cost
+
+def _elliptic(z):
+    weights = 10.0 ** (6.0 * np.arange(z.shape[1]) / (z.shape[1] - 1))
+    return (z ** 2) @ weights
+
+
+def _bent_cigar(z):
+    return z[:, 0] ** 2 + 1e6 * np.sum(z[:, 1:] ** 2, axis=1)
+
+
+def _discus(z):
+    return 1e6 * z[:, 0] ** 2 + np.sum(z[:, 1:] ** 2, axis=1)
+
+
+def _rosenbrock(z):
+    # shifted by one so the optimum sits at the origin
+    z = z + 1.0
+    head, tail = z[:, :-1], z[:, 1:]
+    return np.sum(100.0 * (head ** 2 - tail) ** 2 + (head - 1.0) ** 2, axis=1)
+
+
+def _ackley(z):
+    dims = z.shape[1]
+    part1 = np.sum(z ** 2, axis=1)
+    part2 = np.sum(np.cos(2.0 * np.pi * z), axis=1)
+    return -20.0 * np.exp(-0.2 * np.sqrt(part1 / dims)) - np.exp(part2 / dims) + 20.0 + np.e
+
+
+_WEIERSTRASS_A = 0.5 ** np.arange(21)
+_WEIERSTRASS_B = 3.0 ** np.arange(21)
+
+
+def _weierstrass(z):
+    total = np.zeros(z.shape[0])
+    for a_k, b_k in zip(_WEIERSTRASS_A, _WEIERSTRASS_B):
+        total += a_k * np.sum(np.cos(2.0 * np.pi * b_k * (z + 0.5)), axis=1)
+    return total - z.shape[1] * np.sum(_WEIERSTRASS_A * np.cos(np.pi * _WEIERSTRASS_B))
+
+
+def _weierstrass_norm(z):
+    return _weierstrass(z) - _weierstrass(np.zeros((1, z.shape[1])))
+
+
+def _griewank(z):
+    divisors = np.sqrt(np.arange(1, z.shape[1] + 1))
+    return np.sum(z ** 2, axis=1) / 4000.0 - np.prod(np.cos(z / divisors), axis=1) + 1.0
+
+
+def _rastrigin(z):
+    return np.sum(z ** 2 - 10.0 * np.cos(2.0 * np.pi * z) + 10.0, axis=1)
+
+
+def _modified_schwefel(z):
+    dims = z.shape[1]
+    z = z + 4.209687462275036e+002
+    remainder = np.fmod(np.abs(z), 500.0)
+    above = -(500.0 + remainder) * np.sin(np.sqrt(500.0 - remainder)) + ((z - 500.0) / 100.0) ** 2 / dims
+    below = -(-500.0 + remainder) * np.sin(np.sqrt(500.0 - remainder)) + ((z + 500.0) / 100.0) ** 2 / dims
+    inside = -z * np.sin(np.sqrt(np.abs(z)))
+    terms = np.where(z > 500.0, above, np.where(z < -500.0, below, inside))
+    return np.sum(terms, axis=1) + 4.189828872724338e+002 * dims
+
+
+def _katsuura(z):
+    dims = z.shape[1]
+    total = np.zeros_like(z)
+    for j in range(1, 33):
+        scaled = 2.0 ** j * z
+        total += np.abs(scaled - np.round(scaled)) / 2.0 ** j
+    factors = (1.0 + np.arange(1, dims + 1) * total) ** (10.0 / dims ** 1.2)
+    return (np.prod(factors, axis=1) - 1.0) * 10.0 / dims ** 2
+
+
+def _happy_cat(z):
+    z = z - 1.0
+    dims = z.shape[1]
+    sum_z, sum_sq = np.sum(z, axis=1), np.sum(z ** 2, axis=1)
+    return np.abs(sum_sq - dims) ** 0.25 + (0.5 * sum_sq + sum_z) / dims + 0.5
+
+
+def _hgbat(z):
+    z = z - 1.0
+    dims = z.shape[1]
+    sum_z, sum_sq = np.sum(z, axis=1), np.sum(z ** 2, axis=1)
+    return np.abs(sum_sq ** 2 - sum_z ** 2) ** 0.5 + (0.5 * sum_sq + sum_z) / dims + 0.5
+
+
+def _expanded_griewank_rosenbrock(z):
+    # every coordinate paired with the next one, the last with the first
+    z = z + 1.0
+    following = np.roll(z, -1, axis=1)
+    temp = 100.0 * (z * z - following) ** 2 + (z - 1.0) ** 2
+    return np.sum(temp ** 2 / 4000.0 - np.cos(temp) + 1.0, axis=1)
+
+
+def _expanded_scaffer_f6(z):
+    squares = z ** 2 + np.roll(z, -1, axis=1) ** 2
+    return np.sum(0.5 + (np.sin(np.sqrt(squares)) ** 2 - 0.5) / (1.0 + 0.001 * squares) ** 2, axis=1)
+
+
+# F1-F16: basic function and the factor the shifted point is scaled by before rotation
+_SIMPLE = {
+    1: (_elliptic, 1.0),
+    2: (_bent_cigar, 1.0),
+    3: (_discus, 1.0),
+    4: (_rosenbrock, 2.048 / 100),
+    5: (_ackley, 1.0),
+    6: (_weierstrass_norm, 0.5 / 100),
+    7: (_griewank, 600.0 / 100),
+    8: (_rastrigin, 5.12 / 100),
+    9: (_rastrigin, 5.12 / 100),
+    10: (_modified_schwefel, 1000.0 / 100),
+    11: (_modified_schwefel, 1000.0 / 100),
+    12: (_katsuura, 5.0 / 100),
+    13: (_happy_cat, 5.0 / 100),
+    14: (_hgbat, 5.0 / 100),
+    15: (_expanded_griewank_rosenbrock, 5.0 / 100),
+    16: (_expanded_scaffer_f6, 1.0)
+}
+_UNROTATED = (8, 10)
+
+# F17-F22: share of the dimensions and basic function for every part of the shuffled, rotated point
+_HYBRID = {
+    17: ((0.3, 0.3, 0.4), (_modified_schwefel, _rastrigin, _elliptic)),
+    18: ((0.3, 0.3, 0.4), (_bent_cigar, _hgbat, _rastrigin)),
+    19: ((0.2, 0.2, 0.3, 0.3), (_griewank, _weierstrass, _rosenbrock, _expanded_scaffer_f6)),
+    20: ((0.2, 0.2, 0.3, 0.3), (_hgbat, _discus, _expanded_griewank_rosenbrock, _rastrigin)),
+    21: ((0.1, 0.2, 0.2, 0.2, 0.3), (_expanded_scaffer_f6, _hgbat, _rosenbrock, _modified_schwefel, _elliptic)),
+    22: ((0.1, 0.2, 0.2, 0.2, 0.3), (_katsuura, _happy_cat, _expanded_griewank_rosenbrock, _modified_schwefel, _ackley))
+}
+
+# F23-F30: sigma, lambda and (function, rotation) per component.
+# The rotation is "block" (the component's rows of this function's matrix),
+# "own" (the component function's default matrix) or "raw": opfunu evaluates
+# F23's elliptic components on the unshifted, unrotated point, kept as is.
+_COMPOSITION = {
+    23: ((10, 20, 30, 40, 50), (1.0, 1e-6, 1e-26, 1e-6, 1e-6),
+         ((4, "block"), (1, "raw"), (2, "block"), (3, "block"), (1, "raw"))),
+    24: ((20, 20, 20), (1.0, 1.0, 1.0), ((10, "own"), (9, "own"), (14, "own"))),
+    25: ((10, 30, 50), (0.25, 1.0, 1e-7), ((11, "own"), (9, "own"), (1, "own"))),
+    26: ((10, 10, 10, 10, 10), (0.25, 1.0, 1e-7, 2.5, 10.0),
+         ((11, "own"), (13, "own"), (1, "own"), (6, "own"), (7, "own"))),
+    27: ((10, 10, 10, 20, 20), (10.0, 10.0, 2.5, 25.0, 1e-6),
+         ((14, "own"), (9, "own"), (11, "own"), (6, "own"), (1, "own"))),
+    28: ((10, 20, 30, 40, 50), (2.5, 10.0, 2.5, 5e-4, 1e-6),
+         ((15, "block"), (13, "block"), (11, "block"), (16, "block"), (1, "block"))),
+    29: ((10, 30, 50), (1.0, 1.0, 1.0), ((17, "own"), (18, "own"), (19, "own"))),
+    30: ((10, 30, 50), (1.0, 1.0, 1.0), ((20, "block"), (21, "block"), (22, "block")))
+}
+
+
+def _simple(number, points, shift, rotation):
+    basic, scale = _SIMPLE[number]
+    z = scale * (points - shift)
+    return basic(z if rotation is None else z @ rotation.T)
+
+
+def _hybrid(number, points, shift, rotation, shuffle):
+    fractions, basics = _HYBRID[number]
+    dims = points.shape[1]
+    z = (points - shift)[:, shuffle] @ rotation.T
+
+    costs, start = np.zeros(points.shape[0]), 0
+    for index, (fraction, basic) in enumerate(zip(fractions, basics)):
+        stop = dims if index == len(basics) - 1 else start + int(np.ceil(fraction * dims))
+        costs += basic(z[:, start:stop])
+        start = stop
+    return costs
+
+
+class CEC2014Function(NativeCostFunction):
+    """
+    One CEC2014 function; subclasses only set _NUMBER.
+    Every point of a batch is shifted and rotated with a single matrix product
+    (one per component for the composition functions).
+    """
+    _LOWER_BOUND = -100.0
+    _UPPER_BOUND = 100.0
+    _NUMBER = None
+
+    def __init__(self, n_dimensions: int = 10, opposite: bool = False) -> None:
+        if n_dimensions not in SUPPORTED_DIMENSIONS:
+            raise ValueError(f"CEC2014 functions support {SUPPORTED_DIMENSIONS} dimensions, got {n_dimensions}")
+        super().__init__(n_dimensions, opposite)
+        self.bias = 100.0 * self._NUMBER
+        self._components = self._load_components()
+
+    def __reduce__(self):
+        # the data is memory-mapped from the shared cache, so only the arguments are pickled
+        return self.__class__, (self._n_dimensions, self.opposite)
+
+    def _load_components(self):
+        """(shift, callable) per component; a single one for F1-F22"""
+        number, dims = self._NUMBER, self._n_dimensions
+        if number in _SIMPLE:
+            shift = _shift(number, dims)
+            rotation = None if number in _UNROTATED else _rotation(number, dims)
+            return [(shift, functools.partial(_simple, number, shift=shift, rotation=rotation))]
+        if number in _HYBRID:
+            shift = _shift(number, dims)
+            evaluate = functools.partial(_hybrid, number, shift=shift, rotation=_rotation(number, dims),
+                                         shuffle=_shuffle(number, dims))
+            return [(shift, evaluate)]
+
+        shifts = _shift(number, dims)
+        components = []
+        for index, (component, rotation_kind) in enumerate(_COMPOSITION[number][2]):
+            shift = shifts[index]
+            if rotation_kind == "raw":
+                evaluate = _SIMPLE[component][0]
+            elif component in _HYBRID:
+                rotation = (_rotation(number, dims)[index * dims:(index + 1) * dims] if rotation_kind == "block"
+                            else _rotation(component, dims))
+                evaluate = functools.partial(_hybrid, component, shift=shift, rotation=rotation,
+                                             shuffle=_shuffle(number, dims))
+            else:
+                if component in _UNROTATED:
+                    rotation = None
+                elif rotation_kind == "block":
+                    rotation = _rotation(number, dims)[index * dims:(index + 1) * dims]
+                else:
+                    rotation = _rotation(component, dims)
+                evaluate = functools.partial(_simple, component, shift=shift, rotation=rotation)
+            components.append((shift, evaluate))
+        return components
+
+    def _evaluate(self, matrix):
+        if self._NUMBER not in _COMPOSITION:
+            return self._components[0][1](matrix) + self.bias
+
+        sigmas, lambdas, _ = _COMPOSITION[self._NUMBER]
+        dims = matrix.shape[1]
+        costs = np.empty((len(self._components), matrix.shape[0]))
+        weights = np.empty_like(costs)
+        for index, (shift, evaluate) in enumerate(self._components):
+            costs[index] = lambdas[index] * evaluate(matrix) + 100.0 * index
+            distance = np.sum((matrix - shift) ** 2, axis=1)
+            with np.errstate(divide="ignore"):
+                weight = np.sqrt(1.0 / distance) * np.exp(-distance / (2.0 * dims * sigmas[index] ** 2))
+            # a point exactly on a component's optimum takes that component's value
+            weights[index] = np.where(distance == 0.0, 1e99, weight)
+        weights /= np.sum(weights, axis=0)
+        return np.sum(weights * costs, axis=0) + self.bias
+
+
+class CEC2014_F1(CEC2014Function): _NUMBER = 1
+class CEC2014_F2(CEC2014Function): _NUMBER = 2
+class CEC2014_F3(CEC2014Function): _NUMBER = 3
+class CEC2014_F4(CEC2014Function): _NUMBER = 4
+class CEC2014_F5(CEC2014Function): _NUMBER = 5
+class CEC2014_F6(CEC2014Function): _NUMBER = 6
+class CEC2014_F7(CEC2014Function): _NUMBER = 7
+class CEC2014_F8(CEC2014Function): _NUMBER = 8
+class CEC2014_F9(CEC2014Function): _NUMBER = 9
+class CEC2014_F10(CEC2014Function): _NUMBER = 10
+class CEC2014_F11(CEC2014Function): _NUMBER = 11
+class CEC2014_F12(CEC2014Function): _NUMBER = 12
+class CEC2014_F13(CEC2014Function): _NUMBER = 13
+class CEC2014_F14(CEC2014Function): _NUMBER = 14
+class CEC2014_F15(CEC2014Function): _NUMBER = 15
+class CEC2014_F16(CEC2014Function): _NUMBER = 16
+class CEC2014_F17(CEC2014Function): _NUMBER = 17
+class CEC2014_F18(CEC2014Function): _NUMBER = 18
+class CEC2014_F19(CEC2014Function): _NUMBER = 19
+class CEC2014_F20(CEC2014Function): _NUMBER = 20
+class CEC2014_F21(CEC2014Function): _NUMBER = 21
+class CEC2014_F22(CEC2014Function): _NUMBER = 22
+class CEC2014_F23(CEC2014Function): _NUMBER = 23
+class CEC2014_F24(CEC2014Function): _NUMBER = 24
+class CEC2014_F25(CEC2014Function): _NUMBER = 25
+class CEC2014_F26(CEC2014Function): _NUMBER = 26
+class CEC2014_F27(CEC2014Function): _NUMBER = 27
+class CEC2014_F28(CEC2014Function): _NUMBER = 28
+class CEC2014_F29(CEC2014Function): _NUMBER = 29
+class CEC2014_F30(CEC2014Function): _NUMBER = 30
@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+
+CHECKPOINT_VERSION = 2
+
+
+def save_checkpoint(path: str, arrays: Dict[str, np.ndarray], meta: Dict[str, Any]) -> None:
+    """
+    Write 'arrays' and the JSON-serializable 'meta' to a single .npz file.
+    The file is written next to 'path' under a temporary name and renamed over it,
+    so a crash mid-write leaves the previous checkpoint intact.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"version": CHECKPOINT_VERSION, **meta}
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, meta=np.array(json.dumps(meta)), **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str) -> tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Read a checkpoint written by save_checkpoint, returns (arrays, meta)"""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        arrays = {name: data[name] for name in data.files if name != "meta"}
+
+    assert meta.get("version") == CHECKPOINT_VERSION, f"Unsupported checkpoint version: {meta.get('version')}"
+    return arrays, meta
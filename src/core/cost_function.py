@@ -1,32 +1,93 @@
+import importlib
 from enum import Enum
-import benchmark_functions as bf
-from opfunu.cec_based.cec2014 import F32014
 
+import numpy as np
 
-class CEC2014_F3_Wrapper:
-    def __init__(self, dimensions: int):
-        self.dimensions = dimensions
-        self.func_obj = F32014(ndim=dimensions)
 
-    def __call__(self, x):
-        return self.func_obj.evaluate(x)
+def evaluate_batch(cost_func, matrix) -> np.ndarray:
+    """
+    Score every row of a (n, dims) matrix.
+    Uses the function's vectorized 'evaluate_batch' when it has one,
+    otherwise falls back to calling it once per row.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    batch_func = getattr(cost_func, "evaluate_batch", None)
+    if batch_func is not None:
+        return batch_func(matrix)
+    return np.fromiter((cost_func(row) for row in matrix), dtype=np.float64, count=matrix.shape[0])
 
-    def suggested_bounds(self):
-        return [-100] * self.dimensions, [100] * self.dimensions
+
+_NATIVE = "src.core.native_cost_functions"
+_BENCHMARK_FUNCTIONS_BACKEND = "src.core.benchmark_functions_backend"
+_CEC2014 = "src.core.cec2014"
+_OPFUNU_BACKEND = "src.core.opfunu_backend"
 
 
 class CostFunction(Enum):
-    RASTRIGIN = ("Rastrigin", bf.Rastrigin)
-    ROSENBROCK = ("Rosenbrock", bf.Rosenbrock)
-    ACKLEY = ("Ackley", bf.Ackley)
-    HYPERSPHERE = ("Hypersphere", bf.Hypersphere)
-    HYPERELLIPSOID = ("Hyperellipsoid", bf.Hyperellipsoid)
-    CEC2014_F3 = ("CEC2014 - F3 Shifted Rotated High Conditioned Elliptic Function", CEC2014_F3_Wrapper)
+    """
+    Registry of the available cost functions: (display name, class name, module, reference module).
+    The implementing module is only imported when 'func_class' is first used,
+    so listing or parsing cost functions does not load any backend.
+    The optional reference module holds an independent implementation of the same function.
+    """
+    RASTRIGIN = ("Rastrigin", "Rastrigin", _NATIVE, _BENCHMARK_FUNCTIONS_BACKEND)
+    ROSENBROCK = ("Rosenbrock", "Rosenbrock", _NATIVE, _BENCHMARK_FUNCTIONS_BACKEND)
+    ACKLEY = ("Ackley", "Ackley", _NATIVE, _BENCHMARK_FUNCTIONS_BACKEND)
+    HYPERSPHERE = ("Hypersphere", "Hypersphere", _NATIVE, _BENCHMARK_FUNCTIONS_BACKEND)
+    HYPERELLIPSOID = ("Hyperellipsoid", "Hyperellipsoid", _NATIVE, _BENCHMARK_FUNCTIONS_BACKEND)
+    CEC2014_F1 = ("CEC2014 - F1 Rotated High Conditioned Elliptic Function", "CEC2014_F1", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F2 = ("CEC2014 - F2 Rotated Bent Cigar Function", "CEC2014_F2", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F3 = ("CEC2014 - F3 Rotated Discus Function", "CEC2014_F3", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F4 = ("CEC2014 - F4 Shifted and Rotated Rosenbrock's Function", "CEC2014_F4", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F5 = ("CEC2014 - F5 Shifted and Rotated Ackley's Function", "CEC2014_F5", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F6 = ("CEC2014 - F6 Shifted and Rotated Weierstrass Function", "CEC2014_F6", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F7 = ("CEC2014 - F7 Shifted and Rotated Griewank's Function", "CEC2014_F7", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F8 = ("CEC2014 - F8 Shifted Rastrigin's Function", "CEC2014_F8", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F9 = ("CEC2014 - F9 Shifted and Rotated Rastrigin's Function", "CEC2014_F9", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F10 = ("CEC2014 - F10 Shifted Schwefel's Function", "CEC2014_F10", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F11 = ("CEC2014 - F11 Shifted and Rotated Schwefel's Function", "CEC2014_F11", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F12 = ("CEC2014 - F12 Shifted and Rotated Katsuura Function", "CEC2014_F12", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F13 = ("CEC2014 - F13 Shifted and Rotated HappyCat Function", "CEC2014_F13", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F14 = ("CEC2014 - F14 Shifted and Rotated HGBat Function", "CEC2014_F14", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F15 = ("CEC2014 - F15 Shifted and Rotated Expanded Griewank's plus Rosenbrock's Function", "CEC2014_F15", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F16 = ("CEC2014 - F16 Shifted and Rotated Expanded Scaffer's F6 Function", "CEC2014_F16", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F17 = ("CEC2014 - F17 Hybrid Function 1", "CEC2014_F17", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F18 = ("CEC2014 - F18 Hybrid Function 2", "CEC2014_F18", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F19 = ("CEC2014 - F19 Hybrid Function 3", "CEC2014_F19", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F20 = ("CEC2014 - F20 Hybrid Function 4", "CEC2014_F20", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F21 = ("CEC2014 - F21 Hybrid Function 5", "CEC2014_F21", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F22 = ("CEC2014 - F22 Hybrid Function 6", "CEC2014_F22", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F23 = ("CEC2014 - F23 Composition Function 1", "CEC2014_F23", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F24 = ("CEC2014 - F24 Composition Function 2", "CEC2014_F24", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F25 = ("CEC2014 - F25 Composition Function 3", "CEC2014_F25", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F26 = ("CEC2014 - F26 Composition Function 4", "CEC2014_F26", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F27 = ("CEC2014 - F27 Composition Function 5", "CEC2014_F27", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F28 = ("CEC2014 - F28 Composition Function 6", "CEC2014_F28", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F29 = ("CEC2014 - F29 Composition Function 7", "CEC2014_F29", _CEC2014, _OPFUNU_BACKEND)
+    CEC2014_F30 = ("CEC2014 - F30 Composition Function 8", "CEC2014_F30", _CEC2014, _OPFUNU_BACKEND)
 
     @property
     def name(self):
         return self.value[0]
 
+    @property
+    def class_name(self):
+        return self.value[1]
+
     @property
     def func_class(self):
-        return self.value[1]
\ No newline at end of file
+        return getattr(importlib.import_module(self.value[2]), self.value[1])
+
+    @property
+    def supported_dimensions(self):
+        """Dimension counts the function is defined for, or None when any count works"""
+        return getattr(importlib.import_module(self.value[2]), "SUPPORTED_DIMENSIONS", None)
+
+    @property
+    def has_reference(self):
+        return self.value[3] is not None
+
+    @property
+    def reference_class(self):
+        assert self.has_reference, f"{self.name} has no reference implementation"
+        return getattr(importlib.import_module(self.value[3]), self.value[1])
@@ -1,7 +1,10 @@
 from src.core.unit import Unit
 from abc import ABC, abstractmethod
 from enum import Enum
-import random
+
+import numpy as np
+
+from src.core.random_service import default_service
 
 class CrossingMethodType(Enum):
     LINEAR = "Linear"
@@ -11,18 +14,48 @@ class CrossingMethodType(Enum):
     MEAN = "Mean"
 
 class AbstractCrossing(ABC):
+    children_count = 2
+
     def __init__(self, probability: int):
         self.probability = probability
 
     def cross(self, parent1: Unit, parent2: Unit) -> tuple[Unit, Unit]:
-        if random.randint(1, 100) <= self.probability:
+        if default_service().blocks("crossing").randint(1, 100) <= self.probability:
             return self._perform_cross(parent1, parent2)
         else:
             return parent1, parent2
 
+    def cross_batch(self, genes: np.ndarray, first_parents: np.ndarray, second_parents: np.ndarray,
+                    rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cross many parent pairs at once. Row i of 'first_parents' and 'second_parents'
+        holds the gene matrix indices of one pair.
+
+        Returns a (pairs, children_count, dims) block of candidates and the mask of
+        pairs that passed the probability check. Pairs that did not cross keep their
+        parents in slots 0 and 1 as their only candidates; remaining slots are unused.
+        """
+        pairs = first_parents.shape[0]
+        x = genes[first_parents]
+        y = genes[second_parents]
+        crossed = rng.integers(1, 101, size=pairs) <= self.probability
+
+        candidates = np.empty((pairs, self.children_count, genes.shape[1]))
+        candidates[:, 0::2] = x[:, np.newaxis]
+        candidates[:, 1::2] = y[:, np.newaxis]
+
+        if crossed.any():
+            candidates[crossed] = self._perform_cross_batch(x[crossed], y[crossed], rng)
+        return candidates, crossed
+
     @abstractmethod
     def _perform_cross(self, parent1: Unit, parent2: Unit) -> tuple[Unit, Unit]:
         pass
+
+    @abstractmethod
+    def _perform_cross_batch(self, x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Children of row-aligned parent matrices, shaped (pairs, children_count, dims)"""
+        pass
     
 class ArithmeticCrossing(AbstractCrossing):
     def __init__(self, probability: int, alpha: float = 0.5):
@@ -44,7 +77,13 @@ class ArithmeticCrossing(AbstractCrossing):
 
         return Unit(real_values=child1), Unit(real_values=child2)
 
+    def _perform_cross_batch(self, x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        a = self.alpha
+        return np.stack((a * x + (1 - a) * y, a * y + (1 - a) * x), axis=1)
+
 class LinearCrossing(AbstractCrossing):
+    children_count = 3
+
     def __init__(self, probability: int):
         super().__init__(probability)
 
@@ -58,6 +97,9 @@ class LinearCrossing(AbstractCrossing):
 
         return [Unit(real_values=Z), Unit(real_values=V), Unit(real_values=W)]
 
+    def _perform_cross_batch(self, x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        return np.stack((0.5 * x + 0.5 * y, 1.5 * x - 0.5 * y, -0.5 * x + 1.5 * y), axis=1)
+
 class AlphaBlendCrossing(AbstractCrossing):
     def __init__(self, probability: int, alpha: float = 0.5):
         super().__init__(probability)
@@ -66,6 +108,7 @@ class AlphaBlendCrossing(AbstractCrossing):
     def _perform_cross(self, parent1: Unit, parent2: Unit):
         child1 = []
         child2 = []
+        random_blocks = default_service().blocks("crossing")
 
         for x, y in zip(parent1.real_values, parent2.real_values):
             d = abs(x - y)
@@ -73,14 +116,17 @@ class AlphaBlendCrossing(AbstractCrossing):
             low = min(x, y) - self.alpha * d
             high = max(x, y) + self.alpha * d
 
-            c1 = random.uniform(low, high)
-            c2 = random.uniform(low, high)
+            c1 = random_blocks.uniform(low, high)
+            c2 = random_blocks.uniform(low, high)
 
             child1.append(c1)
             child2.append(c2)
 
         return Unit(real_values=child1), Unit(real_values=child2)
 
+    def _perform_cross_batch(self, x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        return _blend_batch(x, y, self.alpha, self.alpha, rng)
+
 class AlphaBetaBlendCrossing(AbstractCrossing):
     def __init__(self, probability: int, alpha: float = 0.3, beta: float = 0.7):
         super().__init__(probability)
@@ -90,6 +136,7 @@ class AlphaBetaBlendCrossing(AbstractCrossing):
     def _perform_cross(self, parent1: Unit, parent2: Unit):
         child1 = []
         child2 = []
+        random_blocks = default_service().blocks("crossing")
 
         for x, y in zip(parent1.real_values, parent2.real_values):
             d = abs(x - y)
@@ -97,15 +144,29 @@ class AlphaBetaBlendCrossing(AbstractCrossing):
             low = min(x, y) - self.alpha * d
             high = max(x, y) + self.beta * d
 
-            c1 = random.uniform(low, high)
-            c2 = random.uniform(low, high)
+            c1 = random_blocks.uniform(low, high)
+            c2 = random_blocks.uniform(low, high)
 
             child1.append(c1)
             child2.append(c2)
 
         return Unit(real_values=child1), Unit(real_values=child2)
 
+    def _perform_cross_batch(self, x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        return _blend_batch(x, y, self.alpha, self.beta, rng)
+
 class MeanCrossing(AbstractCrossing):
     def _perform_cross(self, parent1: Unit, parent2: Unit):
         mean_values = [(x + y) / 2 for x, y in zip(parent1.real_values, parent2.real_values)]
-        return Unit(real_values=mean_values), Unit(real_values=mean_values)
\ No newline at end of file
+        return Unit(real_values=mean_values), Unit(real_values=mean_values)
+
+    def _perform_cross_batch(self, x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        mean_values = (x + y) / 2
+        return np.stack((mean_values, mean_values), axis=1)
+
+def _blend_batch(x: np.ndarray, y: np.ndarray, alpha: float, beta: float, rng: np.random.Generator) -> np.ndarray:
+    """Two children per pair drawn uniformly from [min - alpha*d, max + beta*d] per gene"""
+    d = np.abs(x - y)
+    low = np.minimum(x, y) - alpha * d
+    high = np.maximum(x, y) + beta * d
+    return rng.uniform(low[:, np.newaxis], high[:, np.newaxis], size=(x.shape[0], 2, x.shape[1]))
\ No newline at end of file
@@ -0,0 +1,165 @@
+import atexit
+import os
+import pickle
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.core.cost_function import evaluate_batch
+
+
+class EvaluatorType(Enum):
+    SERIAL = "Serial"
+    THREAD_POOL = "Thread Pool"
+    PROCESS_POOL = "Process Pool"
+
+
+class AbstractEvaluator(ABC):
+    """Scores a (n, dims) gene matrix with a cost function, returning costs in row order."""
+
+    def __init__(self, cost_func) -> None:
+        self.cost_func = cost_func
+
+    @abstractmethod
+    def evaluate(self, matrix) -> np.ndarray:
+        pass
+
+    def close(self) -> None:
+        """Release resources held by this evaluator (shared pools stay alive)"""
+        pass
+
+
+class SerialEvaluator(AbstractEvaluator):
+    def evaluate(self, matrix) -> np.ndarray:
+        return evaluate_batch(self.cost_func, matrix)
+
+
+class _PooledEvaluator(AbstractEvaluator):
+    def __init__(self, cost_func, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(cost_func)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def _chunks(self, rows: int) -> list[tuple[int, int]]:
+        chunk_size = self.chunk_size or -(-rows // self.workers)
+        return [(start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)]
+
+
+class ThreadPoolEvaluator(_PooledEvaluator):
+    """Pays off when the cost function spends its time in GIL-releasing NumPy kernels."""
+
+    def evaluate(self, matrix) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float64)
+        chunks = self._chunks(matrix.shape[0])
+        if len(chunks) <= 1:
+            return evaluate_batch(self.cost_func, matrix)
+
+        pool = _get_pool(ThreadPoolExecutor, self.workers)
+        results = pool.map(lambda bounds: evaluate_batch(self.cost_func, matrix[bounds[0]:bounds[1]]), chunks)
+        return np.concatenate(list(results))
+
+
+class ProcessPoolEvaluator(_PooledEvaluator):
+    """
+    Genes are copied once per call into a shared memory block that workers map,
+    so only chunk bounds travel through the pool. The cost function is pickled
+    once per evaluator and unpickled once per worker.
+    """
+
+    def __init__(self, cost_func, workers: int = None, chunk_size: int = None) -> None:
+        super().__init__(cost_func, workers, chunk_size)
+        self._token = uuid.uuid4().hex
+        self._payload = pickle.dumps(cost_func)
+        self._shared_memory = None
+        self._finalizer = None
+
+    def evaluate(self, matrix) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float64)
+        chunks = self._chunks(matrix.shape[0])
+        if len(chunks) <= 1:
+            return evaluate_batch(self.cost_func, matrix)
+
+        block = self._reserve(matrix.nbytes)
+        np.ndarray(matrix.shape, dtype=np.float64, buffer=block.buf)[:] = matrix
+
+        pool = _get_pool(ProcessPoolExecutor, self.workers)
+        futures = [
+            pool.submit(_evaluate_shared_chunk, block.name, matrix.shape, start, stop, self._token, self._payload)
+            for start, stop in chunks
+        ]
+        return np.concatenate([future.result() for future in futures])
+
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._shared_memory = None
+
+    def _reserve(self, nbytes: int) -> shared_memory.SharedMemory:
+        """Shared block of at least 'nbytes', reused across calls and regrown when too small"""
+        if self._shared_memory is None or self._shared_memory.size < nbytes:
+            self.close()
+            self._shared_memory = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            self._finalizer = weakref.finalize(self, _release_shared_memory, self._shared_memory)
+        return self._shared_memory
+
+
+def create_evaluator(evaluator_type: EvaluatorType, cost_func, workers: int = None,
+                     chunk_size: int = None) -> AbstractEvaluator:
+    match evaluator_type:
+        case EvaluatorType.SERIAL:
+            return SerialEvaluator(cost_func)
+        case EvaluatorType.THREAD_POOL:
+            return ThreadPoolEvaluator(cost_func, workers, chunk_size)
+        case EvaluatorType.PROCESS_POOL:
+            return ProcessPoolEvaluator(cost_func, workers, chunk_size)
+
+
+# Pools are shared by every evaluator in the process, so workers survive across epochs and runs
+_pools: dict[tuple[type, int], Executor] = {}
+
+
+def _get_pool(executor_class: type, workers: int) -> Executor:
+    key = (executor_class, workers)
+    if key not in _pools:
+        _pools[key] = executor_class(max_workers=workers)
+    return _pools[key]
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    """Stop every shared worker pool"""
+    for pool in _pools.values():
+        pool.shutdown(wait=True, cancel_futures=True)
+    _pools.clear()
+
+
+def _release_shared_memory(block: shared_memory.SharedMemory) -> None:
+    block.close()
+    block.unlink()
+
+
+# Worker-side state: the attached block and the unpickled cost functions
+_attached_block = None
+_worker_cost_functions = {}
+
+
+def _evaluate_shared_chunk(name: str, shape: tuple, start: int, stop: int, token: str, payload: bytes) -> np.ndarray:
+    global _attached_block
+    if _attached_block is None or _attached_block.name != name:
+        if _attached_block is not None:
+            _attached_block.close()
+        _attached_block = shared_memory.SharedMemory(name=name)
+
+    cost_func = _worker_cost_functions.get(token)
+    if cost_func is None:
+        _worker_cost_functions.clear()
+        cost_func = _worker_cost_functions[token] = pickle.loads(payload)
+
+    genes = np.ndarray(shape, dtype=np.float64, buffer=_attached_block.buf)
+    return evaluate_batch(cost_func, genes[start:stop])
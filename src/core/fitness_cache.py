@@ -0,0 +1,104 @@
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+# Rough per-entry bookkeeping cost (dict slot, key object, boxed float) on top of the key bytes
+_ENTRY_OVERHEAD_BYTES = 120
+
+
+class FitnessCache:
+    """
+    Memoizes costs in front of a batch cost function.
+    Rows are keyed by their raw float64 bytes, or by their values rounded to
+    'precision' decimal places when it is given. The least recently used entries
+    are evicted once 'max_entries' or the approximate 'max_bytes' is exceeded.
+    """
+
+    def __init__(self, evaluate_func: Callable[[np.ndarray], np.ndarray],
+                 max_entries: int = None, max_bytes: int = None, precision: int = None) -> None:
+        assert max_entries is None or max_entries > 0
+        assert max_bytes is None or max_bytes > 0
+
+        self._evaluate_func = evaluate_func
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.precision = precision
+
+        self._entries: OrderedDict[bytes, float] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, matrix) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float64)
+        keys = self._keys(matrix)
+        costs = np.empty(matrix.shape[0])
+
+        # rows missing from the cache, deduplicated within the batch
+        missing: dict[bytes, list[int]] = {}
+        for i, key in enumerate(keys):
+            cost = self._entries.get(key)
+            if cost is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                self._entries.move_to_end(key)
+                costs[i] = cost
+                self.hits += 1
+
+        if missing:
+            first_rows = [rows[0] for rows in missing.values()]
+            new_costs = self._evaluate_func(matrix[first_rows]).tolist()
+            for (key, rows), cost in zip(missing.items(), new_costs):
+                costs[rows] = cost
+                self._store(key, cost)
+            self.misses += len(first_rows)
+            self.hits += sum(len(rows) - 1 for rows in missing.values())
+        return costs
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self._entries),
+            "approx_bytes": self._bytes
+        }
+
+    def entries(self) -> tuple[np.ndarray, np.ndarray]:
+        """Keys as float64 rows (rounded when 'precision' is set) and their costs, least recently used first"""
+        if not self._entries:
+            return np.empty((0, 0)), np.empty(0)
+        keys = np.frombuffer(b"".join(self._entries), dtype=np.float64).reshape(len(self._entries), -1)
+        return keys, np.fromiter(self._entries.values(), dtype=np.float64, count=len(self._entries))
+
+    def restore(self, keys: np.ndarray, costs: np.ndarray) -> None:
+        """Replace the contents with entries returned by 'entries'"""
+        self.clear()
+        for row, cost in zip(np.ascontiguousarray(keys, dtype=np.float64), costs.tolist()):
+            self._store(row.tobytes(), cost)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, matrix: np.ndarray) -> list[bytes]:
+        if self.precision is not None:
+            # adding 0.0 folds -0.0 into 0.0 so both round to the same key
+            matrix = np.round(matrix, self.precision) + 0.0
+        matrix = np.ascontiguousarray(matrix)
+        return [row.tobytes() for row in matrix]
+
+    def _store(self, key: bytes, cost: float) -> None:
+        self._entries[key] = cost
+        self._bytes += len(key) + _ENTRY_OVERHEAD_BYTES
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._bytes -= len(evicted_key) + _ENTRY_OVERHEAD_BYTES
\ No newline at end of file
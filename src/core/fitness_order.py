@@ -0,0 +1,71 @@
+import numpy as np
+
+
+class FitnessOrder:
+    """
+    Ranking of one evaluated cost vector, shared by everything that needs the
+    best or worst individuals of the same epoch. Nothing is sorted up front:
+    top(k) and bottom(k) partition in O(n) and only order the k picked entries,
+    and the longest ordered prefix is kept for later, shorter requests.
+    Ties go to the lower index, also at the k-th place, so top(k) always
+    equals the first k entries of a stable argsort.
+    """
+
+    def __init__(self, costs: np.ndarray, maximize: bool) -> None:
+        self._keys = -costs if maximize else np.array(costs)
+        self._best = None
+        self._top = np.empty(0, dtype=np.intp)
+
+    @property
+    def size(self) -> int:
+        return self._keys.shape[0]
+
+    def best(self) -> int:
+        """Index of the best cost"""
+        if self._best is None:
+            self._best = int(self._top[0]) if self._top.size else int(np.argmin(self._keys))
+        return self._best
+
+    def top(self, k: int, ordered: bool = True) -> np.ndarray:
+        """Indices of the 'k' best costs, best first unless 'ordered' is False"""
+        k = min(k, self.size)
+        if k <= self._top.shape[0]:
+            return self._top[:k]
+
+        picked = _smallest(self._keys, k)
+        if not ordered:
+            return picked
+        self._top = picked[np.argsort(self._keys[picked], kind="stable")]
+        return self._top
+
+    def bottom(self, k: int) -> np.ndarray:
+        """Indices of the 'k' worst costs, worst first"""
+        k = min(k, self.size)
+        picked = _smallest(-self._keys, k)
+        return picked[np.argsort(-self._keys[picked], kind="stable")]
+
+
+def top_k(keys: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the 'k' smallest keys, smallest first"""
+    picked = _smallest(keys, min(k, keys.shape[0]))
+    return picked[np.argsort(keys[picked], kind="stable")]
+
+
+def _smallest(keys: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the 'k' smallest keys in increasing position order (not ordered by key).
+    Keys equal to the k-th smallest are taken lowest position first; NaN keys count as largest.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= keys.shape[0]:
+        return np.arange(keys.shape[0])
+
+    # argpartition alone would pick arbitrary positions among keys tied with the k-th one
+    kth = np.partition(keys, k - 1)[k - 1]
+    if np.isnan(kth):
+        below, tied = ~np.isnan(keys), np.isnan(keys)
+    else:
+        below, tied = keys < kth, keys == kth
+    below = np.flatnonzero(below)
+    return np.sort(np.concatenate((below, np.flatnonzero(tied)[:k - below.shape[0]])))
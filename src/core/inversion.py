@@ -1,4 +1,6 @@
-import random
+import numpy as np
+
+from src.core.random_service import default_service
 from src.core.unit import Unit, UnitFactory
 
 class StandardInversion:
@@ -13,7 +15,8 @@ class StandardInversion:
         with given probability (as a percentage 1-99).
         """
         # Probability check
-        if random.random() >= self.probability / 100:
+        random_blocks = default_service().blocks("inversion")
+        if random_blocks.random() >= self.probability / 100:
             return unit
 
         chromosome = unit.real_values.copy()
@@ -22,8 +25,35 @@ class StandardInversion:
             return unit
 
         # Choose random subsequence to invert
-        left = random.randint(0, length - 2)
-        right = random.randint(left + 1, length - 1)
+        left = random_blocks.randint(0, length - 2)
+        right = random_blocks.randint(left + 1, length - 1)
         chromosome[left:right+1] = chromosome[left:right+1][::-1]
 
-        return Unit(real_values=chromosome, cost=unit.cost)
\ No newline at end of file
+        # the reordered chromosome needs a new cost
+        return Unit(real_values=chromosome, cost=None)
+
+    def invert_population(self, genes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Invert a randomly chosen subsequence in every row of a (size, dims) gene matrix
+        that passes the probability check, in place.
+        Segment bounds follow the same distribution as 'invert'.
+        Returns the mask of inverted rows.
+        """
+        size, length = genes.shape
+        inverted = rng.random(size) < self.probability / 100
+        if length < 2:
+            return np.zeros(size, dtype=bool)
+
+        rows = np.flatnonzero(inverted)
+        if rows.size == 0:
+            return inverted
+
+        left = rng.integers(0, length - 1, size=rows.size)[:, np.newaxis]
+        right = rng.integers(left + 1, length)
+
+        # inside [left, right] position i takes the gene from left + right - i
+        positions = np.arange(length)
+        in_segment = (positions >= left) & (positions <= right)
+        source = np.where(in_segment, left + right - positions, positions)
+        genes[rows] = np.take_along_axis(genes[rows], source, axis=1)
+        return inverted
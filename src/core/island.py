@@ -0,0 +1,232 @@
+import copy
+import multiprocessing
+import queue
+import time
+from enum import Enum
+from typing import Any, Dict, TYPE_CHECKING
+
+import numpy as np
+
+from src.config.simulation_config import SimulationConfiguration
+from src.core.evaluator import shutdown_pools
+from src.core.population import Population
+from src.core.results_saver import SimulationResultsSaver, config_to_dict
+
+if TYPE_CHECKING:
+    from src.config.island_config import IslandConfig
+
+
+class MigrationTopology(Enum):
+    RING = "Ring"
+    RANDOM = "Random"
+
+
+def migration_targets(topology: MigrationTopology, islands_count: int, migration_round: int,
+                      topology_seed: int) -> np.ndarray:
+    """
+    targets[i] is the island receiving island i's emigrants in the given round.
+    RANDOM draws a fresh single cycle through all islands every round, so every
+    island sends and receives exactly one group; all islands derive the same cycle.
+    """
+    if topology == MigrationTopology.RING:
+        return (np.arange(islands_count) + 1) % islands_count
+
+    order = np.random.default_rng([topology_seed, migration_round]).permutation(islands_count)
+    targets = np.empty(islands_count, dtype=np.intp)
+    targets[order] = np.roll(order, -1)
+    return targets
+
+
+def _run_island(index: int, config_dict: Dict[str, Any], migration: Dict[str, Any],
+                inboxes: list, results: multiprocessing.Queue) -> None:
+    """Island process: the regular epoch pipeline with a migration step every 'interval' epochs"""
+    from src.config.config_loader import config_from_dict
+
+    simulation_config = config_from_dict(config_dict)
+    try:
+        _evolve_island(index, simulation_config, migration, inboxes, results)
+    finally:
+        # the island exits without running atexit hooks, so its evaluator pools must be stopped here
+        simulation_config.evaluator_config.evaluator.close()
+        shutdown_pools()
+
+
+def _evolve_island(index: int, simulation_config: SimulationConfiguration, migration: Dict[str, Any],
+                   inboxes: list, results: multiprocessing.Queue) -> None:
+    from src.core.simulation import Simulation
+
+    simulation = Simulation(simulation_config, quiet=True)
+    epochs = simulation_config.general_config.epochs_no
+    interval = migration["interval"]
+    early_arrivals = {}
+
+    simulation.initialize()
+    for epoch in range(1, epochs + 1):
+        simulation.evaluate_population()
+
+        if epoch % interval == 0 and epoch < epochs:
+            migration_round = epoch // interval
+            targets = migration_targets(migration["topology"], len(inboxes), migration_round, migration["topology_seed"])
+            emigrants = simulation.best_individuals(migration["migrants_count"])
+            inboxes[targets[index]].put((migration_round, emigrants.genes, emigrants.costs))
+
+            # a fast neighbour may already have sent the next round's group
+            while migration_round not in early_arrivals:
+                message_round, genes, costs = inboxes[index].get()
+                early_arrivals[message_round] = Population(genes, costs)
+            simulation.replace_worst(early_arrivals.pop(migration_round))
+
+        simulation.evolve()
+    simulation.finish()
+
+    best = simulation.best_individuals(1)
+    results.put((index, {
+        "history_epochs": simulation.history_epochs.tolist(),
+        "best_cost_history": list(simulation.best_cost_history),
+        "avg_cost_history": list(simulation.avg_cost_history),
+        "std_cost_history": list(simulation.std_cost_history),
+        "best_genes": best.genes[0],
+        "best_cost": float(best.costs[0]),
+        "cost_evaluations": simulation.cost_evaluations,
+        "elapsed_time": simulation.elapsed_time
+    }))
+
+
+class IslandModel:
+    """
+    Runs 'islands_count' copies of the regular pipeline in separate processes.
+    Every 'migration_interval' epochs each island sends copies of its best
+    'migrants_count' individuals to its neighbour, which replace the neighbour's worst ones.
+    Each island evolves a full population of general_config.population_size.
+    Every island runs all epochs_no epochs: a termination_config is rejected,
+    because an island that stopped early would leave its neighbours waiting for migrants.
+    """
+
+    def __init__(self, simulation_config: SimulationConfiguration, island_config: "IslandConfig",
+                 results_dir: str = "results", quiet: bool = False) -> None:
+        assert simulation_config.termination_config is None, \
+            "termination_config is not supported together with island_config"
+        self._config = simulation_config
+        self._island_config = island_config
+        self._results_dir = results_dir
+        self._quiet = quiet
+        self._is_maximim_case = simulation_config.selection_config.is_maxim_case
+
+        self.island_results = []
+        self.history_epochs = []
+        self.best_cost_history = []
+        self.avg_cost_history = []
+        self.std_cost_history = []
+        self.best_genes = None
+        self.best_cost = None
+        self.cost_evaluations = 0
+        self.elapsed_time = None
+        self.results_dir = None
+
+    def start(self) -> None:
+        start_time = time.time()
+        islands_count = self._island_config.islands_count
+
+        # independent, reproducible streams for every island and for the random topology
+        seed_sequences = np.random.SeedSequence(self._config.general_config.seed).spawn(islands_count + 1)
+        island_seeds = [int(sequence.generate_state(1)[0]) for sequence in seed_sequences[:islands_count]]
+        migration = {
+            "interval": self._island_config.migration_interval,
+            "migrants_count": self._island_config.migrants_count,
+            "topology": self._island_config.topology,
+            "topology_seed": int(seed_sequences[-1].generate_state(1)[0])
+        }
+
+        base_config = config_to_dict(self._config)
+        context = multiprocessing.get_context()
+        inboxes = [context.Queue() for _ in range(islands_count)]
+        results = context.Queue()
+        processes = []
+        for index in range(islands_count):
+            island_config = copy.deepcopy(base_config)
+            island_config["general_config"]["seed"] = island_seeds[index]
+            # not daemonic: islands may start their own evaluator pools; the finally below reaps them
+            process = context.Process(target=_run_island, args=(index, island_config, migration, inboxes, results))
+            process.start()
+            processes.append(process)
+
+        try:
+            self.island_results = self._collect(processes, results)
+        finally:
+            for process in processes:
+                process.join(timeout=5.0)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+        self._aggregate()
+        self.elapsed_time = time.time() - start_time
+        self._save_results()
+
+    def _collect(self, processes: list, results: multiprocessing.Queue) -> list:
+        collected = {}
+        while len(collected) < len(processes):
+            try:
+                index, result = results.get(timeout=1.0)
+                collected[index] = result
+            except queue.Empty:
+                failed = [i for i, process in enumerate(processes)
+                          if i not in collected and process.exitcode not in (None, 0)]
+                if failed:
+                    raise RuntimeError(f"Island process(es) {failed} terminated abnormally")
+        return [collected[index] for index in range(len(processes))]
+
+    def _aggregate(self) -> None:
+        best = np.array([result["best_cost_history"] for result in self.island_results])
+        avg = np.array([result["avg_cost_history"] for result in self.island_results])
+        std = np.array([result["std_cost_history"] for result in self.island_results])
+        size = self._config.general_config.population_size
+        total = size * len(self.island_results)
+
+        # pooled statistics over all islands, which all have the same population size
+        mean = avg.mean(axis=0)
+        within = ((size - 1) * std ** 2).sum(axis=0)
+        between = (size * (avg - mean) ** 2).sum(axis=0)
+        pooled_std = np.sqrt((within + between) / (total - 1)) if total > 1 else np.zeros_like(mean)
+
+        # every island records the same epochs, as they all share one results_config
+        self.history_epochs = self.island_results[0]["history_epochs"]
+        self.best_cost_history = (best.max(axis=0) if self._is_maximim_case else best.min(axis=0)).tolist()
+        self.avg_cost_history = mean.tolist()
+        self.std_cost_history = pooled_std.tolist()
+        self.cost_evaluations = sum(result["cost_evaluations"] for result in self.island_results)
+
+        best_costs = [result["best_cost"] for result in self.island_results]
+        best_island = int(np.argmax(best_costs) if self._is_maximim_case else np.argmin(best_costs))
+        self.best_genes = self.island_results[best_island]["best_genes"]
+        self.best_cost = best_costs[best_island]
+
+    def _save_results(self) -> None:
+        try:
+            saver = SimulationResultsSaver(self._results_dir)
+            config_dict = config_to_dict(self._config)
+            config_dict["island_config"] = {
+                "islands_count": self._island_config.islands_count,
+                "migration_interval": self._island_config.migration_interval,
+                "migrants_count": self._island_config.migrants_count,
+                "topology": str(self._island_config.topology)
+            }
+            saver.save_simulation_config(config_dict)
+            saver.save_metrics(self.best_cost_history, self.avg_cost_history, self.std_cost_history,
+                               epochs=self.history_epochs)
+            saver.save_additional_info({
+                "elapsed_time": self.elapsed_time,
+                "population_size": self._config.general_config.population_size,
+                "islands_count": self._island_config.islands_count,
+                "dimensions": self._config.cost_function_config.dimensions,
+                "epochs": self._config.general_config.epochs_no,
+                "final_best_cost": self.best_cost,
+                "best_unit_parameters": self.best_genes,
+                "cost_evaluations": self.cost_evaluations,
+                "island_final_best_costs": [result["best_cost"] for result in self.island_results]
+            })
+            self.results_dir = saver.get_simulation_dir()
+            if not self._quiet:
+                print(f"Results saved to: {self.results_dir}")
+        except Exception as e:
+            print(f"Error saving results: {e}")
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class MetricHistory:
+    """
+    Best/average/deviation per recorded epoch, kept in preallocated float64 arrays.
+    'epochs' holds the 1-based epoch number of every recorded row, so strided
+    histories still line up with the epochs they came from.
+    With 'keep_all' False only the latest row is kept.
+    """
+
+    def __init__(self, capacity: int, keep_all: bool = True) -> None:
+        assert capacity > 0
+        self._keep_all = keep_all
+        capacity = capacity if keep_all else 1
+
+        self._epochs = np.zeros(capacity, dtype=np.int64)
+        self._best = np.empty(capacity, dtype=np.float64)
+        self._avg = np.empty(capacity, dtype=np.float64)
+        self._std = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, epoch: int, best_cost: float, avg_cost: float, deviation: float) -> None:
+        if not self._keep_all:
+            self._size = 0
+        elif self._size == self._epochs.shape[0]:
+            self._grow()
+
+        index = self._size
+        self._epochs[index] = epoch
+        self._best[index] = best_cost
+        self._avg[index] = avg_cost
+        self._std[index] = deviation
+        self._size += 1
+
+    def restore(self, epochs: np.ndarray, best: np.ndarray, avg: np.ndarray, std: np.ndarray) -> None:
+        """Replace the contents, e.g. with histories loaded from a checkpoint"""
+        self._size = 0
+        for row in zip(epochs.tolist(), best.tolist(), avg.tolist(), std.tolist()):
+            self.append(*row)
+
+    @property
+    def epochs(self) -> np.ndarray:
+        return self._epochs[:self._size]
+
+    @property
+    def best(self) -> np.ndarray:
+        return self._best[:self._size]
+
+    @property
+    def avg(self) -> np.ndarray:
+        return self._avg[:self._size]
+
+    @property
+    def std(self) -> np.ndarray:
+        return self._std[:self._size]
+
+    def _grow(self) -> None:
+        # only reached when a resumed run is given more epochs than it was sized for
+        capacity = 2 * self._epochs.shape[0]
+        self._epochs = np.resize(self._epochs, capacity)
+        self._best = np.resize(self._best, capacity)
+        self._avg = np.resize(self._avg, capacity)
+        self._std = np.resize(self._std, capacity)
@@ -1,40 +1,88 @@
 from src.core.unit import Unit, UnitFactory
 from abc import ABC, abstractmethod
 from enum import Enum
-import random
+from typing import Sequence
+
+import numpy as np
+
+from src.core.random_service import default_service
 
 class MutationMethodType(Enum):
     UNIFORM = "Uniform"
     GAUSSIAN = "Gaussian"
 
 class AbstractMutation(ABC):
-    def __init__(self, probability: float, unit_factory: UnitFactory):
+    def __init__(self, probability: float, unit_factory: UnitFactory,
+                 lower_bounds: Sequence[float] = None, upper_bounds: Sequence[float] = None):
         self.probability = probability
         self.unit_factory = unit_factory
+        self.lower_bounds = lower_bounds
+        self.upper_bounds = upper_bounds
 
     @abstractmethod
     def mutate(self, unit: Unit) -> Unit:
         pass
+
+    def mutate_population(self, genes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Mutate a (size, dims) gene matrix in place.
+        Each gene is picked independently with the configured probability.
+        Returns the mask of rows that had at least one gene mutated.
+        """
+        lower, upper = self._bounds(genes.shape[1])
+        mask = rng.random(genes.shape) < self.probability / 100
+        rows, cols = np.nonzero(mask)
+        if rows.size:
+            genes[rows, cols] = self._mutate_genes(genes[rows, cols], lower[cols], upper[cols], rng)
+        return mask.any(axis=1)
+
+    @abstractmethod
+    def _mutate_genes(self, values: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                      rng: np.random.Generator) -> np.ndarray:
+        """New values for the picked genes, given their own bounds"""
+        pass
+
+    def _bounds(self, dimension: int) -> tuple[np.ndarray, np.ndarray]:
+        lower, upper = self.unit_factory.bounds(dimension)
+        if self.lower_bounds is not None:
+            lower = np.broadcast_to(np.asarray(self.lower_bounds, dtype=np.float64), (dimension,))
+        if self.upper_bounds is not None:
+            upper = np.broadcast_to(np.asarray(self.upper_bounds, dtype=np.float64), (dimension,))
+        return lower, upper
     
 class UniformMutation(AbstractMutation):
     def mutate(self, unit: Unit) -> Unit:
         new_values = unit.real_values.copy()
+        lower, upper = self._bounds(len(new_values))
+        random_blocks = default_service().blocks("mutation")
+        mutated = False
         for i in range(len(new_values)):
-            if random.random() < self.probability / 100:
-                new_values[i] = random.uniform(self.unit_factory._lower_bound,
-                                               self.unit_factory._upper_bound)
-        return Unit(real_values=new_values, cost=unit.cost)
+            if random_blocks.random() < self.probability / 100:
+                new_values[i] = random_blocks.uniform(lower[i], upper[i])
+                mutated = True
+        # the old cost no longer describes changed genes
+        return Unit(real_values=new_values, cost=None if mutated else unit.cost)
+
+    def _mutate_genes(self, values, lower, upper, rng):
+        return rng.uniform(lower, upper)
 
 class GaussianMutation(AbstractMutation):
-    def __init__(self, probability: float, unit_factory: UnitFactory, sigma: float):
-        super().__init__(probability, unit_factory)
+    def __init__(self, probability: float, unit_factory: UnitFactory, sigma: float,
+                 lower_bounds: Sequence[float] = None, upper_bounds: Sequence[float] = None):
+        super().__init__(probability, unit_factory, lower_bounds, upper_bounds)
         self.sigma = sigma 
 
     def mutate(self, unit: Unit) -> Unit:
         new_values = unit.real_values.copy()
+        lower, upper = self._bounds(len(new_values))
+        random_blocks = default_service().blocks("mutation")
+        mutated = False
         for i in range(len(new_values)):
-            if random.random() < self.probability / 100:
-                new_values[i] += random.gauss(0, self.sigma)
-                new_values[i] = max(self.unit_factory._lower_bound,
-                                    min(self.unit_factory._upper_bound, new_values[i]))
-        return Unit(real_values=new_values, cost=unit.cost)
\ No newline at end of file
+            if random_blocks.random() < self.probability / 100:
+                new_values[i] += random_blocks.gauss(0, self.sigma)
+                new_values[i] = max(lower[i], min(upper[i], new_values[i]))
+                mutated = True
+        return Unit(real_values=new_values, cost=None if mutated else unit.cost)
+
+    def _mutate_genes(self, values, lower, upper, rng):
+        return np.clip(values + rng.normal(0, self.sigma, size=values.shape), lower, upper)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+NumPy implementations of the built-in benchmark functions.
+Same formulas, bounds and 'opposite' flag as the benchmark_functions package
+(kept as the reference backend in benchmark_functions_backend), but every
+function accepts either a single point or an (n, dims) batch.
+"""
+from abc import ABC, abstractmethod
+from math import e, pi
+
+import numpy as np
+
+
+class NativeCostFunction(ABC):
+    _LOWER_BOUND = None
+    _UPPER_BOUND = None
+
+    def __init__(self, n_dimensions: int = 2, opposite: bool = False) -> None:
+        assert n_dimensions > 0
+        self._n_dimensions = n_dimensions
+        self.opposite = opposite
+
+    def __call__(self, point):
+        """Cost of one point (returns a float) or of every row of an (n, dims) batch (returns an array)"""
+        points = np.asarray(point, dtype=np.float64)
+        if points.ndim == 1:
+            return float(self.evaluate_batch(points[np.newaxis, :])[0])
+        return self.evaluate_batch(points)
+
+    def evaluate_batch(self, matrix: np.ndarray) -> np.ndarray:
+        matrix = np.asarray(matrix, dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[1] != self._n_dimensions:
+            raise ValueError(f"Expected points with {self._n_dimensions} dimensions, got shape {matrix.shape}")
+        costs = self._evaluate(matrix)
+        return -costs if self.opposite else costs
+
+    def suggested_bounds(self):
+        return [self._LOWER_BOUND] * self._n_dimensions, [self._UPPER_BOUND] * self._n_dimensions
+
+    @abstractmethod
+    def _evaluate(self, matrix: np.ndarray) -> np.ndarray:
+        """Costs of every row of a validated (n, dims) matrix, before 'opposite' is applied"""
+        pass
+
+
+class Rastrigin(NativeCostFunction):
+    _LOWER_BOUND = -5.12
+    _UPPER_BOUND = 5.12
+
+    def _evaluate(self, matrix):
+        return np.sum(matrix ** 2 - 10.0 * np.cos(2.0 * pi * matrix), axis=1) + 10.0 * matrix.shape[1]
+
+
+class Rosenbrock(NativeCostFunction):
+    _LOWER_BOUND = -2.048
+    _UPPER_BOUND = 2.048
+
+    def _evaluate(self, matrix):
+        head, tail = matrix[:, :-1], matrix[:, 1:]
+        return np.sum(100.0 * (tail - head ** 2) ** 2 + (1.0 - head) ** 2, axis=1)
+
+
+class Ackley(NativeCostFunction):
+    _LOWER_BOUND = -32.768
+    _UPPER_BOUND = 32.768
+
+    def __init__(self, n_dimensions: int = 2, a: float = 20, b: float = 0.2, c: float = 2 * pi,
+                 opposite: bool = False) -> None:
+        super().__init__(n_dimensions, opposite)
+        self.a = a
+        self.b = b
+        self.c = c
+
+    def _evaluate(self, matrix):
+        dims = matrix.shape[1]
+        part1 = np.sum(matrix ** 2, axis=1)
+        part2 = np.sum(np.cos(self.c * matrix), axis=1)
+        return -self.a * np.exp(-self.b * np.sqrt(part1 / dims)) - np.exp(part2 / dims) + self.a + e
+
+
+class Hypersphere(NativeCostFunction):
+    _LOWER_BOUND = -5.0
+    _UPPER_BOUND = 5.0
+
+    def _evaluate(self, matrix):
+        return np.sum(matrix ** 2, axis=1)
+
+
+class Hyperellipsoid(NativeCostFunction):
+    _LOWER_BOUND = -65.536
+    _UPPER_BOUND = 65.536
+
+    def _evaluate(self, matrix):
+        # x_j^2 appears in the nested sum once for every i >= j
+        weights = np.arange(matrix.shape[1], 0, -1, dtype=np.float64)
+        return (matrix ** 2) @ weights
@@ -0,0 +1,27 @@
+"""
+Reference backend for the CEC2014 suite: opfunu's own implementations,
+evaluated point by point. Optional - only needed with
+CostFunctionConfig(..., reference_backend=True) or to cross-check cec2014.
+Imported on first use because opfunu pulls in matplotlib.
+"""
+import numpy as np
+from opfunu.cec_based import cec2014
+
+
+class _OpfunuFunction:
+    _NUMBER = None
+
+    def __init__(self, n_dimensions: int = 10) -> None:
+        self._n_dimensions = n_dimensions
+        self.func_obj = getattr(cec2014, f"F{self._NUMBER}2014")(ndim=n_dimensions)
+
+    def __call__(self, point):
+        return float(self.func_obj.evaluate(np.asarray(point, dtype=np.float64)))
+
+    def suggested_bounds(self):
+        return [-100.0] * self._n_dimensions, [100.0] * self._n_dimensions
+
+
+# same class names as src.core.cec2014, so CostFunction can look them up in either module
+for _number in range(1, 31):
+    globals()[f"CEC2014_F{_number}"] = type(f"CEC2014_F{_number}", (_OpfunuFunction,), {"_NUMBER": _number})
@@ -0,0 +1,105 @@
+from typing import Iterator, Sequence
+
+import numpy as np
+
+from src.core.unit import Unit
+
+
+class Population:
+    """
+    Contiguous storage for a whole population.
+    All genes live in one (size, dimensions) float64 array and all costs in a
+    parallel float64 vector. 'valid' flags the individuals whose cost matches
+    their current genes; invalid costs are NaN.
+    """
+
+    def __init__(self, genes: np.ndarray, costs: np.ndarray = None, valid: np.ndarray = None) -> None:
+        genes = np.ascontiguousarray(genes, dtype=np.float64)
+        assert genes.ndim == 2
+
+        if costs is None:
+            costs = np.full(genes.shape[0], np.nan)
+        costs = np.ascontiguousarray(costs, dtype=np.float64)
+        assert costs.shape == (genes.shape[0],)
+
+        if valid is None:
+            valid = ~np.isnan(costs)
+        valid = np.array(valid, dtype=bool)
+        assert valid.shape == costs.shape
+
+        self.genes = genes
+        self.costs = costs
+        self.valid = valid
+
+    @classmethod
+    def random(cls, size: int, lower_bounds: Sequence[float], upper_bounds: Sequence[float],
+               rng: np.random.Generator) -> "Population":
+        """Draw 'size' individuals uniformly within per-dimension bounds"""
+        lower_bounds = np.asarray(lower_bounds, dtype=np.float64)
+        upper_bounds = np.asarray(upper_bounds, dtype=np.float64)
+        genes = rng.uniform(lower_bounds, upper_bounds, size=(size, lower_bounds.shape[0]))
+        return cls(genes)
+
+    @classmethod
+    def from_units(cls, units: Sequence[Unit]) -> "Population":
+        """Pack a list of units into a new population (values are copied)"""
+        genes = np.array([unit.real_values for unit in units], dtype=np.float64)
+        costs = np.array([np.nan if unit.cost is None else unit.cost for unit in units], dtype=np.float64)
+        return cls(genes, costs)
+
+    @classmethod
+    def concatenate(cls, populations: Sequence["Population"]) -> "Population":
+        """Stack populations into a new one, in the given order"""
+        genes = np.concatenate([population.genes for population in populations])
+        costs = np.concatenate([population.costs for population in populations])
+        valid = np.concatenate([population.valid for population in populations])
+        return cls(genes, costs, valid)
+
+    @property
+    def size(self) -> int:
+        return self.genes.shape[0]
+
+    @property
+    def dimensions(self) -> int:
+        return self.genes.shape[1]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Unit:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("population index out of range")
+        return Unit.view(self.genes, self.costs, index)
+
+    def __iter__(self) -> Iterator[Unit]:
+        for index in range(self.size):
+            yield Unit.view(self.genes, self.costs, index)
+
+    def units(self) -> list[Unit]:
+        """Unit views over every individual, in storage order"""
+        return list(self)
+
+    def take(self, indices) -> "Population":
+        """New population made of copies of the given rows"""
+        return Population(self.genes[indices], self.costs[indices], self.valid[indices])
+
+    def invalid_indices(self) -> np.ndarray:
+        """Indices of individuals that need their cost (re)calculated"""
+        return np.flatnonzero(~self.valid)
+
+    def invalidate(self, mask: np.ndarray) -> None:
+        """Mark individuals whose genes changed as needing evaluation"""
+        self.valid[mask] = False
+        self.costs[mask] = np.nan
+
+    def set_costs(self, indices: np.ndarray, costs: np.ndarray) -> None:
+        self.costs[indices] = costs
+        self.valid[indices] = True
+
+    def best_index(self, is_maximization: bool) -> int:
+        return int(np.argmax(self.costs) if is_maximization else np.argmin(self.costs))
+
+    def __repr__(self) -> str:
+        return f"Population(size={self.size}, dimensions={self.dimensions})"
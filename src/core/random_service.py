@@ -0,0 +1,130 @@
+"""
+Random number generation shared by the operators.
+A RandomService splits one seed with SeedSequence into an independent
+numpy Generator per stream, so a change in how one operator draws
+does not shift the numbers any other operator sees. Batch operators
+take the stream's Generator directly; per-unit code draws scalars from
+RandomBlocks, which hands them out of pre-generated blocks.
+"""
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+STREAMS = ("population", "selection", "pairing", "crossing", "mutation", "inversion")
+DEFAULT_BLOCK_SIZE = 4096
+
+
+class RandomBlocks:
+    """
+    Scalar draws with the 'random' module's interface, served from blocks of
+    uniforms and standard normals that are refilled in bulk from 'generator'.
+    """
+
+    def __init__(self, generator: np.random.Generator, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        assert block_size > 0
+        self._generator = generator
+        self._block_size = block_size
+        self._uniforms = np.empty(0)
+        self._uniform_index = 0
+        self._normals = np.empty(0)
+        self._normal_index = 0
+
+    def random(self) -> float:
+        """Uniform float in [0, 1)"""
+        if self._uniform_index == self._uniforms.shape[0]:
+            self._uniforms = self._generator.random(self._block_size)
+            self._uniform_index = 0
+        value = self._uniforms[self._uniform_index]
+        self._uniform_index += 1
+        return float(value)
+
+    def uniform(self, low: float, high: float) -> float:
+        return low + (high - low) * self.random()
+
+    def gauss(self, mu: float = 0.0, sigma: float = 1.0) -> float:
+        if self._normal_index == self._normals.shape[0]:
+            self._normals = self._generator.standard_normal(self._block_size)
+            self._normal_index = 0
+        value = self._normals[self._normal_index]
+        self._normal_index += 1
+        return mu + sigma * float(value)
+
+    def randint(self, low: int, high: int) -> int:
+        """Integer in [low, high], both ends included"""
+        assert low <= high
+        return low + min(int(self.random() * (high - low + 1)), high - low)
+
+    def sample(self, population: Sequence, k: int) -> List:
+        """'k' distinct elements of 'population' in random order (partial Fisher-Yates)"""
+        assert 0 <= k <= len(population)
+        pool = list(population)
+        for i in range(k):
+            j = self.randint(i, len(pool) - 1)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def state(self) -> Dict[str, Any]:
+        """Values drawn from the generator but not handed out yet"""
+        return {"uniforms": self._uniforms[self._uniform_index:].tolist(),
+                "normals": self._normals[self._normal_index:].tolist()}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        self._uniforms = np.asarray(state["uniforms"], dtype=np.float64)
+        self._uniform_index = 0
+        self._normals = np.asarray(state["normals"], dtype=np.float64)
+        self._normal_index = 0
+
+
+class RandomService:
+    """
+    One independent Generator (and its RandomBlocks) per name in STREAMS,
+    all derived from a single seed. The same seed always reproduces every stream.
+    """
+
+    def __init__(self, seed=None, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self._block_size = block_size
+        children = self.seed_sequence.spawn(len(STREAMS))
+        self._generators = {name: np.random.Generator(np.random.PCG64(child)) for name, child in zip(STREAMS, children)}
+        self._blocks = {}
+
+    def generator(self, stream: str) -> np.random.Generator:
+        return self._generators[stream]
+
+    def blocks(self, stream: str) -> RandomBlocks:
+        if stream not in self._blocks:
+            self._blocks[stream] = RandomBlocks(self._generators[stream], self._block_size)
+        return self._blocks[stream]
+
+    def spawn(self, count: int) -> List["RandomService"]:
+        """'count' services independent of this one and of each other"""
+        return [RandomService(child, self._block_size) for child in self.seed_sequence.spawn(count)]
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-serializable state of every stream, including buffered values"""
+        return {
+            "generators": {name: generator.bit_generator.state for name, generator in self._generators.items()},
+            "blocks": {name: blocks.state() for name, blocks in self._blocks.items()}
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        assert set(state["generators"]) == set(STREAMS), "Random state does not match the configured streams"
+        for name, generator_state in state["generators"].items():
+            self._generators[name].bit_generator.state = generator_state
+        self._blocks = {}
+        for name, blocks_state in state["blocks"].items():
+            self.blocks(name).restore(blocks_state)
+
+
+_default_service = RandomService()
+
+
+def default_service() -> RandomService:
+    """Process-wide service used by the per-unit operator methods"""
+    return _default_service
+
+
+def seed(value=None) -> None:
+    """Reseed the process-wide service, like random.seed for the per-unit operator methods"""
+    global _default_service
+    _default_service = RandomService(value)
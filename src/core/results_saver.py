@@ -1,13 +1,26 @@
 import os
 import json
 import csv
+import tempfile
+import time
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, List, TYPE_CHECKING
 
-from src.config.simulation_config import SimulationConfiguration
+import numpy as np
 
-def config_to_dict(simulation_config: SimulationConfiguration) -> Dict[str, Any]:
+from src.core.stage_timer import STAGES
+
+if TYPE_CHECKING:
+    from src.config.simulation_config import SimulationConfiguration
+
+
+class ResultsFormat(Enum):
+    TEXT = "Text"
+    BINARY = "Binary"
+
+def config_to_dict(simulation_config: "SimulationConfiguration") -> Dict[str, Any]:
     """
     Convert SimulationConfiguration object to dictionary for serialization.
     
@@ -21,12 +34,14 @@ def config_to_dict(simulation_config: SimulationConfiguration) -> Dict[str, Any]
         "general_config": {
             "population_size": simulation_config.general_config.population_size,
             "epochs_no": simulation_config.general_config.epochs_no,
-            "chromosome_precision": simulation_config.general_config.repr_precision
+            "chromosome_precision": simulation_config.general_config.repr_precision,
+            "seed": simulation_config.general_config.seed
         },
         "cost_function_config": {
             "dimensions": simulation_config.cost_function_config.dimensions,
             "cost_function_name": simulation_config.cost_function_config.cost_func.__class__.__name__,
-            "suggested_bounds": list(simulation_config.cost_function_config.cost_func.suggested_bounds())
+            "suggested_bounds": list(simulation_config.cost_function_config.cost_func.suggested_bounds()),
+            "reference_backend": simulation_config.cost_function_config.reference_backend
         },
         "selection_config": {
             "selection_type": str(simulation_config.selection_config.selection_type),
@@ -42,14 +57,133 @@ def config_to_dict(simulation_config: SimulationConfiguration) -> Dict[str, Any]
         },
         "mutation_config": {
             "mutation_type": str(simulation_config.mutation_config.mutation_type),
-            "probability": simulation_config.mutation_config.probability
+            "probability": simulation_config.mutation_config.probability,
+            "sigma": simulation_config.mutation_config.sigma
         },
         "inversion_config": {
             "probability": simulation_config.inversion_config.probability
-        }
+        },
+        "evaluator_config": {
+            "evaluator_type": str(simulation_config.evaluator_config.evaluator_type),
+            "workers": simulation_config.evaluator_config.workers,
+            "chunk_size": simulation_config.evaluator_config.chunk_size
+        },
+        "fitness_cache_config": _fitness_cache_config_to_dict(simulation_config),
+        "results_config": {
+            "streaming": simulation_config.results_config.streaming,
+            "flush_every_rows": simulation_config.results_config.flush_every_rows,
+            "flush_interval_sec": simulation_config.results_config.flush_interval_sec,
+            "keep_history": simulation_config.results_config.keep_history,
+            "results_format": str(simulation_config.results_config.results_format),
+            "record_stage_timings": simulation_config.results_config.record_stage_timings,
+            "record_every": simulation_config.results_config.record_every
+        },
+        "checkpoint_config": _checkpoint_config_to_dict(simulation_config),
+        "termination_config": _termination_config_to_dict(simulation_config)
+    }
+
+
+def _fitness_cache_config_to_dict(simulation_config: "SimulationConfiguration") -> Dict[str, Any]:
+    cache_config = simulation_config.fitness_cache_config
+    if cache_config is None:
+        return None
+    return {
+        "max_entries": cache_config.max_entries,
+        "max_bytes": cache_config.max_bytes,
+        "round_to_precision": cache_config.round_to_precision
+    }
+
+
+def _checkpoint_config_to_dict(simulation_config: "SimulationConfiguration") -> Dict[str, Any]:
+    checkpoint_config = simulation_config.checkpoint_config
+    if checkpoint_config is None:
+        return None
+    return {
+        "path": checkpoint_config.path,
+        "every_epochs": checkpoint_config.every_epochs,
+        "every_seconds": checkpoint_config.every_seconds
+    }
+
+
+def _termination_config_to_dict(simulation_config: "SimulationConfiguration") -> Dict[str, Any]:
+    termination_config = simulation_config.termination_config
+    if termination_config is None:
+        return None
+    return {
+        "stagnation_epochs": termination_config.stagnation_epochs,
+        "target_cost": termination_config.target_cost,
+        "target_tolerance": termination_config.target_tolerance,
+        "max_evaluations": termination_config.max_evaluations,
+        "max_seconds": termination_config.max_seconds
     }
 
 
+METRICS_HEADER = ['epoch', 'best_cost', 'avg_cost', 'deviation']
+
+
+def _atomic_write_json(path: Path, data: Any) -> None:
+    """Write JSON through a temporary file and rename it, so readers never see a half-written file"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class MetricsStreamWriter:
+    """
+    Appends metric rows to results.csv while the simulation runs.
+    Rows are buffered and written out every 'flush_every_rows' rows or
+    'flush_interval_sec' seconds, whichever comes first, so a crashed run
+    keeps everything up to the last flush.
+    """
+
+    def __init__(self, path: Path, flush_every_rows: int = 100, flush_interval_sec: float = 5.0):
+        self.path = path
+        self.flush_every_rows = flush_every_rows
+        self.flush_interval_sec = flush_interval_sec
+        self.rows_written = 0
+
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(METRICS_HEADER)
+        self._file.flush()
+
+    def write_row(self, epoch: int, best_cost: float, avg_cost: float, deviation: float) -> None:
+        self._buffer.append([epoch, best_cost, avg_cost, deviation])
+
+        if len(self._buffer) >= self.flush_every_rows:
+            self.flush()
+        elif self.flush_interval_sec is not None and time.monotonic() - self._last_flush >= self.flush_interval_sec:
+            self.flush()
+
+    def flush(self) -> None:
+        self._writer.writerows(self._buffer)
+        self.rows_written += len(self._buffer)
+        self._buffer.clear()
+        self._file.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "MetricsStreamWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
 class SimulationResultsSaver:
     """
     Responsible for saving simulation results to files.
@@ -90,7 +224,7 @@ class SimulationResultsSaver:
             json.dump(serializable_config, f, indent=4)
     
     def save_metrics(self, best_costs: list[float], avg_costs: list[float], 
-                     deviations: list[float], filename: str = "results.csv"):
+                     deviations: list[float], filename: str = "results.csv", epochs: list[int] = None):
         """
         Save simulation metrics to CSV file.
         Each epoch has one row with: epoch, best_cost, avg_cost, deviation
@@ -100,6 +234,7 @@ class SimulationResultsSaver:
             avg_costs: List of average costs per epoch
             deviations: List of standard deviations per epoch
             filename: Name of the CSV file
+            epochs: Epoch number of every entry, when not every epoch was recorded
         """
         metrics_path = self.simulation_dir / filename
         
@@ -107,20 +242,51 @@ class SimulationResultsSaver:
             writer = csv.writer(f)
             
             # Write header
-            writer.writerow(['epoch', 'best_cost', 'avg_cost', 'deviation'])
+            writer.writerow(METRICS_HEADER)
             
             # Write data rows
-            for epoch in range(len(best_costs)):
+            for index in range(len(best_costs)):
                 writer.writerow([
-                    epoch + 1,
-                    best_costs[epoch],
-                    avg_costs[epoch],
-                    deviations[epoch]
+                    epochs[index] if epochs is not None else index + 1,
+                    best_costs[index],
+                    avg_costs[index],
+                    deviations[index]
                 ])
     
+    def save_stage_timings(self, rows: List[List[float]], filename: str = "stage_timings.csv"):
+        """
+        Save per-epoch stage timings to CSV, one row for every epoch run.
+        Each row has: epoch, seconds spent in every stage, cost function evaluations
+        
+        Args:
+            rows: StageTimer.rows
+            filename: Name of the CSV file
+        """
+        timings_path = self.simulation_dir / filename
+        
+        with open(timings_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['epoch', *(f'{stage}_sec' for stage in STAGES), 'evaluations'])
+            for row in rows:
+                writer.writerow([int(row[0]), *row[1:-1], int(row[-1])])
+
+    def open_metrics_stream(self, flush_every_rows: int = 100, flush_interval_sec: float = 5.0,
+                            filename: str = "results.csv") -> MetricsStreamWriter:
+        """
+        Start results.csv now and return a writer that appends one row per epoch.
+        The same file format as save_metrics; the caller must close the writer.
+        
+        Args:
+            flush_every_rows: Write buffered rows out after this many rows
+            flush_interval_sec: ...or after this many seconds since the last flush (None disables it)
+            filename: Name of the CSV file
+        """
+        return MetricsStreamWriter(self.simulation_dir / filename, flush_every_rows, flush_interval_sec)
+
     def save_additional_info(self, info: Dict[str, Any], filename: str = "additional_info.json"):
         """
         Save additional information (e.g., elapsed time, final best unit).
+        The file is replaced atomically, so it is either complete or absent.
         
         Args:
             info: Dictionary with additional information
@@ -130,8 +296,7 @@ class SimulationResultsSaver:
         
         serializable_info = self._make_serializable(info)
         
-        with open(info_path, 'w') as f:
-            json.dump(serializable_info, f, indent=4)
+        _atomic_write_json(info_path, serializable_info)
     
     def _make_serializable(self, obj: Any) -> Any:
         """
@@ -143,6 +308,10 @@ class SimulationResultsSaver:
             return [self._make_serializable(item) for item in obj]
         elif isinstance(obj, Path):
             return str(obj)
+        elif isinstance(obj, np.ndarray):
+            return obj.tolist()
+        elif isinstance(obj, np.generic):
+            return obj.item()
         elif hasattr(obj, '__dict__'):
             # Custom objects - convert to dict representation
             return self._make_serializable(obj.__dict__)
@@ -160,31 +329,120 @@ class SimulationResultsSaver:
         """
         return self.simulation_dir
     
-    def save_results(self, simulation, config_dict: Dict[str, Any]):
+    def save_results(self, simulation, config_dict: Dict[str, Any], results_format: ResultsFormat = ResultsFormat.TEXT):
         """
         Complete save operation - saves config, metrics, and additional info.
         
         Args:
             simulation: The Simulation object
             config_dict: Configuration as dictionary
+            results_format: TEXT writes results.csv, BINARY writes .npy arrays (see save_binary_arrays)
         """
         # Save configuration
         self.save_simulation_config(config_dict)
         
+        if results_format == ResultsFormat.BINARY:
+            arrays = self.save_binary_arrays(simulation)
+            self.save_run_summary(simulation, {"results_format": str(results_format), "arrays": arrays})
+            return
+
         # Save metrics
         self.save_metrics(
             best_costs=simulation.best_cost_history,
             avg_costs=simulation.avg_cost_history,
-            deviations=simulation.std_cost_history
+            deviations=simulation.std_cost_history,
+            epochs=simulation.history_epochs
         )
         
         # Save additional info
+        self.save_run_summary(simulation)
+
+    def save_binary_arrays(self, simulation) -> Dict[str, Any]:
+        """
+        Save the histories, the final population and the best unit as raw float64 .npy files,
+        which keep every bit of the values and can be memory-mapped by load_binary_results.
+        
+        Args:
+            simulation: The Simulation object
+            
+        Returns:
+            Dictionary of array name -> file name, shape and dtype, stored in additional_info.json
+        """
+        population = simulation._population
+        arrays = {
+            "history_epochs": np.asarray(simulation.history_epochs, dtype=np.int64),
+            "best_cost_history": np.asarray(simulation.best_cost_history, dtype=np.float64),
+            "avg_cost_history": np.asarray(simulation.avg_cost_history, dtype=np.float64),
+            "std_cost_history": np.asarray(simulation.std_cost_history, dtype=np.float64)
+        }
+        if population is not None and population.size > 0:
+            arrays["population_genes"] = population.genes
+            arrays["population_costs"] = population.costs
+            arrays["best_unit_parameters"] = population.genes[population.best_index(simulation._is_maximim_case)]
+
+        header = {}
+        for name, array in arrays.items():
+            filename = f"{name}.npy"
+            np.save(self.simulation_dir / filename, np.ascontiguousarray(array))
+            header[name] = {"file": filename, "shape": list(array.shape), "dtype": str(array.dtype)}
+        return header
+
+    def save_run_summary(self, simulation, extra_info: Dict[str, Any] = None):
+        """
+        Save additional_info.json for a finished simulation.
+        Used on its own when the metrics were already streamed during the run.
+        
+        Args:
+            simulation: The Simulation object
+            extra_info: Additional entries appended to the file
+        """
+        population = simulation._population
+        best_unit_parameters = None
+        if population is not None and population.size > 0:
+            best_index = population.best_index(simulation._is_maximim_case)
+            best_unit_parameters = population.genes[best_index].tolist()
+
         additional_info = {
             "elapsed_time": simulation.elapsed_time,
             "population_size": simulation._population_size,
             "dimensions": simulation._dimesions,
             "epochs": simulation._epochs_number,
-            "final_best_cost": simulation.best_cost_history[-1] if simulation.best_cost_history else None,
-            "best_unit_parameters": simulation._population[0].real_values if simulation._population else None
+            "epochs_completed": simulation.epochs_completed,
+            "cancelled": simulation.cancelled,
+            "stop_reason": simulation.stop_reason.value if simulation.stop_reason is not None else None,
+            "final_best_cost": simulation.best_cost_history[-1] if len(simulation.best_cost_history) else None,
+            "best_unit_parameters": best_unit_parameters,
+            "cost_evaluations": simulation.cost_evaluations,
+            "evaluations_saved": simulation.evaluations_saved,
+            "fitness_cache": simulation.fitness_cache.stats() if simulation.fitness_cache is not None else None,
+            "stage_times": simulation.stage_timer.totals() if simulation.stage_timer.enabled else None
         }
+        if extra_info:
+            additional_info.update(extra_info)
         self.save_additional_info(additional_info)
+
+
+def load_binary_results(simulation_dir, mmap: bool = True) -> Dict[str, Any]:
+    """
+    Load a run saved with ResultsFormat.BINARY.
+    With 'mmap' the arrays are read-only memory maps, so only the bytes actually
+    indexed are read from disk - handy when scanning many runs.
+    
+    Args:
+        simulation_dir: The run's results folder
+        mmap: Memory-map the arrays instead of reading them into memory
+        
+    Returns:
+        Dictionary with "config", "info" and one entry per saved array
+    """
+    simulation_dir = Path(simulation_dir)
+    with open(simulation_dir / "simulation_config.json") as f:
+        config = json.load(f)
+    with open(simulation_dir / "additional_info.json") as f:
+        info = json.load(f)
+
+    assert "arrays" in info, f"{simulation_dir} was not saved in the binary format"
+    results = {"config": config, "info": info}
+    for name, entry in info["arrays"].items():
+        results[name] = np.load(simulation_dir / entry["file"], mmap_mode='r' if mmap else None)
+    return results
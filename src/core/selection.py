@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
 from enum import Enum
-import random
 from typing import List
 
+import numpy as np
+
+from src.core.fitness_order import FitnessOrder
+from src.core.random_service import default_service
 from src.core.unit import Unit
 
 
@@ -20,14 +23,31 @@ class SelectionMethod(ABC):
         """Select individuals from the population."""
         pass
 
+    @abstractmethod
+    def select_indices(self, costs: np.ndarray, num: int, rng: np.random.Generator,
+                       order: FitnessOrder = None) -> np.ndarray:
+        """
+        Select individuals given the population cost vector, returning their indices.
+        'order' is the caller's ranking of the same costs, for methods that rank.
+        """
+        pass
+
 class BestSelection(SelectionMethod):
     def select(self, population, num):
         return sorted(population, key=lambda ind: ind.cost, reverse=self._is_maximization)[:num]
 
+    def select_indices(self, costs, num, rng, order=None):
+        """Indices of the 'num' best costs, in no particular order"""
+        if order is None:
+            order = FitnessOrder(costs, self._is_maximization)
+        return order.top(num, ordered=False)
+
 class RouletteWheelSelection(SelectionMethod):
     def select(self, population, num):
         if self._is_maximization:
-            scores = [ind.cost for ind in population]
+            # negative costs would get negative weights; shift them so the lowest weighs zero
+            lowest = min(0.0, min(ind.cost for ind in population))
+            scores = [ind.cost - lowest for ind in population]
         else:
             # For minimization, flip costs to convert to maximization on [costs]
             max_cost = max(ind.cost for ind in population)
@@ -38,11 +58,12 @@ class RouletteWheelSelection(SelectionMethod):
             else:
                 scores = [max_cost - ind.cost + 1e-9 for ind in population]
         total_score = sum(scores)
+        random_blocks = default_service().blocks("selection")
         if total_score == 0:
-            return random.sample(population, num)
+            return random_blocks.sample(population, num)
         selected = []
         for _ in range(num):
-            pick = random.uniform(0, total_score)
+            pick = random_blocks.uniform(0, total_score)
             current = 0
             for ind, score in zip(population, scores):
                 current += score
@@ -51,6 +72,27 @@ class RouletteWheelSelection(SelectionMethod):
                     break
         return selected
 
+    def select_indices(self, costs, num, rng, order=None):
+        if self._is_maximization:
+            # negative weights would make the cumulative sum non-monotonic for searchsorted
+            scores = costs - min(0.0, costs.min())
+        else:
+            # For minimization, flip costs to convert to maximization on [costs]
+            max_cost = costs.max()
+            min_cost = costs.min()
+            if max_cost == min_cost:
+                scores = np.ones_like(costs)
+            else:
+                scores = max_cost - costs + 1e-9
+        cumulative = np.cumsum(scores)
+        total_score = cumulative[-1]
+        if total_score == 0:
+            return rng.choice(costs.shape[0], num, replace=False)
+        picks = rng.uniform(0, total_score, size=num)
+        # first individual whose cumulative score reaches the pick
+        selected = np.searchsorted(cumulative, picks, side='left')
+        return np.minimum(selected, costs.shape[0] - 1)
+
 class TournamentSelection(SelectionMethod):
     def __init__(self, tournament_size=3, is_maximization: bool = True):
         super().__init__(is_maximization)
@@ -59,6 +101,7 @@ class TournamentSelection(SelectionMethod):
     def select(self, population, num):
         population_pool = population[:]
         selected = []
+        random_blocks = default_service().blocks("selection")
         
         tournaments_count = len(population) // self.tournament_size
         plus_one = 1 if len(population) % self.tournament_size > 0 else 0
@@ -66,7 +109,7 @@ class TournamentSelection(SelectionMethod):
 
         while len(selected) < tournaments_count and population_pool:
             k = min(self.tournament_size, len(population_pool))
-            contenders = random.sample(population_pool, k)
+            contenders = random_blocks.sample(population_pool, k)
             if self._is_maximization:
                 winner = max(contenders, key=lambda ind: ind.cost)
             else:
@@ -74,3 +117,53 @@ class TournamentSelection(SelectionMethod):
             selected.append(winner)
             population_pool.remove(winner)
         return selected
+
+    def select_indices(self, costs, num, rng, order=None):
+        """
+        The tournaments of 'select': ceil(n / tournament_size) of them, each with
+        'tournament_size' distinct contenders drawn from everyone who has not won
+        yet, earlier losers included. Only the winner matters, and the winner is
+        the best contender, so each tournament just draws the smallest of k
+        distinct positions in the ranking of its pool. Equal costs rank by index.
+        """
+        size = costs.shape[0]
+        tournaments_count = -(-size // self.tournament_size)
+        if order is None:
+            order = FitnessOrder(costs, self._is_maximization)
+
+        # every tournament removes its winner, so tournament t draws from size - t individuals
+        pool_sizes = size - np.arange(tournaments_count)
+        positions = _smallest_of_distinct(pool_sizes, np.minimum(self.tournament_size, pool_sizes), rng)
+
+        # tournament t's winner is at most t places below its pool position in the full ranking,
+        # so only that prefix of the shared ranking is needed
+        rounds = np.arange(tournaments_count)
+        ranked_count = int((positions + rounds).max()) + 1
+        # the pool is kept worst first, so popping a winner (usually near the best end) moves few entries
+        pool = order.top(ranked_count)[::-1].tolist()
+        pops = (ranked_count - 1 - rounds - positions).tolist()
+        return np.array([pool.pop(index) for index in pops], dtype=np.intp)
+
+
+def _smallest_of_distinct(pool_sizes: np.ndarray, counts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """
+    For every row, the smallest of counts[i] distinct positions drawn uniformly from
+    range(pool_sizes[i]), sampled by inverting P(smallest >= j) = C(m - j, k) / C(m, k)
+    with a binary search, so the cost does not depend on how close k is to m.
+    """
+    log_factorials = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, pool_sizes.max() + 1)))))
+    base = log_factorials[pool_sizes - counts] - log_factorials[pool_sizes]
+
+    def log_survival(j):
+        return log_factorials[pool_sizes - j] - log_factorials[pool_sizes - j - counts] + base
+
+    # 1 - random() lies in (0, 1], so its log is finite and P(smallest >= 0) = 1 always holds
+    log_u = np.log(1.0 - rng.random(pool_sizes.shape[0]))
+    low = np.zeros_like(pool_sizes)
+    high = pool_sizes - counts
+    while (low < high).any():
+        middle = (low + high + 1) // 2
+        reached = log_survival(middle) >= log_u
+        low = np.where(reached, middle, low)
+        high = np.where(reached, high, middle - 1)
+    return low
@@ -1,92 +1,376 @@
-from ast import List
+from enum import Enum
 from math import floor
-import random
+import threading
 import time
+from typing import Callable
+
+import numpy as np
+
 from src.config.simulation_config import SimulationConfiguration
+from src.core.checkpoint import load_checkpoint, save_checkpoint
+from src.core.fitness_cache import FitnessCache
+from src.core.fitness_order import FitnessOrder, top_k
+from src.core.metric_history import MetricHistory
+from src.core.population import Population
+from src.core.random_service import RandomService
 from src.core.results_saver import SimulationResultsSaver, config_to_dict
 from src.core.selection import SelectionMethodType
-from src.core.unit import Unit
+from src.core.stage_timer import StageTimer
+
+
+class TerminationReason(Enum):
+    EPOCHS = "epochs"
+    CANCELLED = "cancelled"
+    TARGET_COST = "target_cost"
+    STAGNATION = "stagnation"
+    MAX_EVALUATIONS = "max_evaluations"
+    MAX_SECONDS = "max_seconds"
+
+
+# Called after every evaluation with (epoch, total epochs, best, avg, std); 'epoch' is 1-based like
+# results.csv, and the final evaluation of the last generation reports total epochs + 1
+ProgressCallback = Callable[[int, int, float, float, float], None]
 
 
 class Simulation:
-    def __init__(self, simulation_config: SimulationConfiguration) -> None:
+    def __init__(self, simulation_config: SimulationConfiguration, results_dir: str = "results", quiet: bool = False,
+                 progress_callback: ProgressCallback = None) -> None:
         self._config = simulation_config
-
-        self._population = []
-        self.std_cost_history = []
-        self.best_cost_history = []
-        self.avg_cost_history = []
+        self._results_dir = results_dir
+        self._quiet = quiet
+        self._progress_callback = progress_callback
+        self._stop_requested = threading.Event()
+        self.cancelled = False
+        self.epochs_completed = 0
+        # TerminationReason that ended the run
+        self.stop_reason = None
+
+        self._population = None
+        # ranking of the evaluated population, shared by metrics, selection and migration
+        self._fitness_order = None
+        self._random = RandomService(self._config.general_config.seed)
         self.elapsed_time = None
+        self._start_time = None
+        self.results_dir = None
+        self._results_config = self._config.results_config
+        self._results_saver = None
+        self._metrics_stream = None
+        self._checkpoint_config = self._config.checkpoint_config
+        self._last_checkpoint_time = None
+        self.stage_timer = StageTimer(self._results_config.record_stage_timings)
+        self.cost_evaluations = 0
+        self.evaluations_saved = 0
         self._global_best_cost = None
+        self._evaluated_epochs = 0
+        self._last_improvement_epoch = 0
+        self._termination_config = self._config.termination_config
+
+        self._batch_cost_function = self._config.evaluator_config.evaluate_func
 
-        self._cost_function = self._config.cost_function_config.cost_func
+        self.fitness_cache = self._create_fitness_cache()
+        if self.fitness_cache is not None:
+            self._batch_cost_function = self.fitness_cache.evaluate
         self._population_size = self._config.general_config.population_size
         self._dimesions = self._config.cost_function_config.dimensions
         self._bounds = self._config.cost_function_config.cost_func.suggested_bounds()
         self._epochs_number = self._config.general_config.epochs_no 
 
+        # every 'record_every'-th epoch plus the final one
+        self._record_every = self._results_config.record_every
+        self._history = MetricHistory(self._epochs_number // self._record_every + 2, self._results_config.keep_history)
+
         self._unit_factory = simulation_config.unit_factory
 
         self._selection_num = self._calculate_selection_size()
-        self._selection_func = self._config.selection_config.selection_func
+        self._selection_batch_func = self._config.selection_config.selection_batch_func
 
         self._is_maximim_case = self._config.selection_config.is_maxim_case
 
         self._elite_units_count = self._config.crossing_config.elite_count
-        self._crossing_func = self._config.crossing_config.crossing_func
+        self._crossing_batch_func = self._config.crossing_config.crossing_batch_func
 
-        self._mutation_func = self._config.mutation_config.mutation_func
+        self._mutation_batch_func = self._config.mutation_config.mutation_batch_func
 
-        self._inversion_func = self._config.inversion_config.inversion_func
+        self._inversion_batch_func = self._config.inversion_config.inversion_batch_func
 
     def start(self):
-        start_time = time.time()
+        self._run()
+
+    def resume(self, checkpoint_path: str) -> None:
+        """
+        Continue a run from a checkpoint written by a simulation with the same configuration.
+        The remaining epochs produce exactly what the uninterrupted run would have.
+        """
+        self._run(checkpoint_path)
+
+    def _run(self, checkpoint_path: str = None) -> None:
+        try:
+            if checkpoint_path is None:
+                self.initialize()
+            else:
+                self._restore_checkpoint(checkpoint_path)
+
+            if self._results_config.streaming:
+                self._open_metrics_stream()
+
+            self.stop_reason = TerminationReason.EPOCHS
+            while self.epochs_completed < self._epochs_number:
+                # print(f'Epoch {self.epochs_completed + 1}')
+                if self._stop_requested.is_set():
+                    self.cancelled = True
+                    self.stop_reason = TerminationReason.CANCELLED
+                    break
+                self.run_epoch()
+                self.epochs_completed += 1
+                self._checkpoint_if_due()
+
+                reason = self._termination_reason()
+                if reason is not None:
+                    self.stop_reason = reason
+                    break
+
+            if self.cancelled and self._checkpoint_config is not None:
+                # a stopped (e.g. preempted) run can pick up from here
+                self.save_checkpoint(self._checkpoint_config.path)
+
+            self.finish()
+        finally:
+            # a crashed run keeps every streamed row
+            if self._metrics_stream is not None:
+                self._metrics_stream.close()
+
+        # Save simulation results
+        self._save_results()
+
+    @property
+    def best_cost_history(self) -> np.ndarray:
+        return self._history.best
+
+    @property
+    def avg_cost_history(self) -> np.ndarray:
+        return self._history.avg
+
+    @property
+    def std_cost_history(self) -> np.ndarray:
+        return self._history.std
+
+    @property
+    def history_epochs(self) -> np.ndarray:
+        """1-based epoch of every history entry (every epoch unless a recording stride is set)"""
+        return self._history.epochs
+
+    def request_stop(self) -> None:
+        """Ask a running 'start' to stop before the next epoch (safe to call from another thread)"""
+        self._stop_requested.set()
+
+    def initialize(self) -> None:
+        """Reset the clock and generate the initial population"""
+        self._start_time = time.time()
+        self._last_checkpoint_time = self._start_time
         
         # generate init values
         self._generate_init_population()
 
-        for epoch in range(self._epochs_number):
-            # print(f'Epoch {epoch + 1}')
-            
-            # calculate cost function for each from the population
-            self._calculate_costs()
+    def run_epoch(self) -> None:
+        self.evaluate_population()
+        self.evolve()
+
+    def evaluate_population(self) -> None:
+        # calculate cost function for units changed since last evaluation
+        self._calculate_costs()
 
-            # stuff for collecting metrics
+        # stuff for collecting metrics
+        with self.stage_timer.stage("metrics"):
             self._update_metrics()
 
-            # select elite units
-            # select units from population to cross
-            selected_units = self._selection_func(self._population, self._selection_num)
+    def evolve(self) -> None:
+        """Replace the (evaluated) population with the next generation"""
+        # select elite units
+        # select units from population to cross
+        with self.stage_timer.stage("selection"):
+            selected = self._selection_batch_func(self._population.costs, self._selection_num,
+                                                  self._random.generator("selection"), self._order())
 
-            # Extract the best elite units from selected_units
-            selected_units_sorted = sorted(selected_units, key=lambda ind: ind.cost, reverse=self._is_maximim_case) 
+            # Extract the best elite units from selected units
+            selected_costs = self._population.costs[selected]
+            elite_positions = top_k(-selected_costs if self._is_maximim_case else selected_costs,
+                                    self._elite_units_count)
 
-            elites = selected_units_sorted[:self._elite_units_count]
-            rest_selected = selected_units_sorted[self._elite_units_count:]
+            elites = self._population.take(selected[elite_positions])
+            rest_selected = np.delete(selected, elite_positions)
 
-            # cross selected units
+        # cross selected units
+        with self.stage_timer.stage("crossing"):
             crossed_units = self._cross_selected_units(rest_selected)
-            
-            # mutate crossed units
-            mutated_units = self._mutate_units(crossed_units)
-            mutated_units.extend(elites)
-
-            # inverse
-            self._population = self._inverse_units(mutated_units)
         
+        # mutate crossed units
+        with self.stage_timer.stage("mutation"):
+            self._mutate_units(crossed_units)
+        next_population = Population.concatenate([crossed_units, elites])
+
+        # inverse
+        with self.stage_timer.stage("inversion"):
+            self._inverse_units(next_population)
+        self._population = next_population
+        self._fitness_order = None
+        self.stage_timer.end_epoch(self._evaluated_epochs, self.cost_evaluations)
+
+    def finish(self) -> None:
+        """Evaluate the last generation and stop the clock"""
         self._calculate_costs()
-        self._update_metrics()
-        self.elapsed_time = time.time() - start_time
+        with self.stage_timer.stage("metrics"):
+            self._update_metrics(final=True)
+        self.stage_timer.end_epoch(self._evaluated_epochs, self.cost_evaluations)
+        self.elapsed_time = time.time() - self._start_time
+
+    def best_individuals(self, count: int) -> Population:
+        """Copies of the 'count' best evaluated individuals, best first"""
+        return self._population.take(self._order().top(count))
+
+    def replace_worst(self, incoming: Population) -> None:
+        """Overwrite the worst evaluated individuals with 'incoming' ones"""
+        worst = self._order().bottom(incoming.size)
+        self._population.genes[worst] = incoming.genes
+        self._population.costs[worst] = incoming.costs
+        self._population.valid[worst] = incoming.valid
+        self._fitness_order = None
+
+    def _order(self) -> FitnessOrder:
+        """Ranking of the current population, built on first use after every change"""
+        if self._fitness_order is None:
+            self._fitness_order = FitnessOrder(self._population.costs, self._is_maximim_case)
+        return self._fitness_order
+
+    def save_checkpoint(self, path: str) -> None:
+        """Write everything needed to continue this run bit-identically (between epochs only)"""
+        arrays = {
+            "genes": self._population.genes,
+            "costs": self._population.costs,
+            "valid": self._population.valid,
+            "history_epochs": self.history_epochs,
+            "best_cost_history": self.best_cost_history,
+            "avg_cost_history": self.avg_cost_history,
+            "std_cost_history": self.std_cost_history
+        }
+        if self.fitness_cache is not None:
+            # with round_to_precision a hit returns a nearby chromosome's cost, so the cache is part of the state
+            arrays["fitness_cache_keys"], arrays["fitness_cache_costs"] = self.fitness_cache.entries()
+        meta = {
+            "epochs_completed": self.epochs_completed,
+            "evaluated_epochs": self._evaluated_epochs,
+            "global_best_cost": self._global_best_cost,
+            "last_improvement_epoch": self._last_improvement_epoch,
+            "cost_evaluations": self.cost_evaluations,
+            "evaluations_saved": self.evaluations_saved,
+            "elapsed_time": time.time() - self._start_time,
+            "random_state": self._random.state(),
+            "fitness_cache_counts": [self.fitness_cache.hits, self.fitness_cache.misses]
+            if self.fitness_cache is not None else None
+        }
+        save_checkpoint(path, arrays, meta)
+        self._last_checkpoint_time = time.time()
+
+    def _restore_checkpoint(self, path: str) -> None:
+        arrays, meta = load_checkpoint(path)
+        assert arrays["genes"].shape == (self._population_size, self._dimesions), \
+            "Checkpoint population does not match the configured population size and dimensions"
+
+        self._population = Population(arrays["genes"], arrays["costs"], arrays["valid"])
+        self._fitness_order = None
+        self._history.restore(arrays["history_epochs"], arrays["best_cost_history"],
+                              arrays["avg_cost_history"], arrays["std_cost_history"])
+        self.epochs_completed = meta["epochs_completed"]
+        self._evaluated_epochs = meta["evaluated_epochs"]
+        self._global_best_cost = meta["global_best_cost"]
+        self._last_improvement_epoch = meta["last_improvement_epoch"]
+        self.cost_evaluations = meta["cost_evaluations"]
+        self.evaluations_saved = meta["evaluations_saved"]
+        self.stage_timer.restore(self.cost_evaluations)
+        self._random.restore(meta["random_state"])
+        if self.fitness_cache is not None and "fitness_cache_keys" in arrays:
+            self.fitness_cache.restore(arrays["fitness_cache_keys"], arrays["fitness_cache_costs"])
+            self.fitness_cache.hits, self.fitness_cache.misses = meta["fitness_cache_counts"]
+
+        # the clock keeps counting from where the checkpointed run was
+        self._start_time = time.time() - meta["elapsed_time"]
+        self._last_checkpoint_time = time.time()
+
+    def _termination_reason(self) -> "TerminationReason":
+        """The first early stop criterion met by the evaluated population, if any (checked between epochs)"""
+        termination = self._termination_config
+        if termination is None:
+            return None
+
+        if termination.target_cost is not None and \
+                abs(self._global_best_cost - termination.target_cost) <= termination.target_tolerance:
+            return TerminationReason.TARGET_COST
+        if termination.stagnation_epochs is not None and \
+                self._evaluated_epochs - 1 - self._last_improvement_epoch >= termination.stagnation_epochs:
+            return TerminationReason.STAGNATION
+        if termination.max_evaluations is not None and self.cost_evaluations >= termination.max_evaluations:
+            return TerminationReason.MAX_EVALUATIONS
+        if termination.max_seconds is not None and time.time() - self._start_time >= termination.max_seconds:
+            return TerminationReason.MAX_SECONDS
+        return None
+
+    def _checkpoint_if_due(self) -> None:
+        if self._checkpoint_config is None or self.epochs_completed >= self._epochs_number:
+            return
+
+        every_epochs = self._checkpoint_config.every_epochs
+        every_seconds = self._checkpoint_config.every_seconds
+        if (every_epochs is not None and self.epochs_completed % every_epochs == 0) or \
+                (every_seconds is not None and time.time() - self._last_checkpoint_time >= every_seconds):
+            self.save_checkpoint(self._checkpoint_config.path)
+
+    def _open_metrics_stream(self) -> None:
+        """Create the results folder up front and stream metrics into it while the simulation runs"""
+        self._results_saver = SimulationResultsSaver(self._results_dir)
+        self._results_saver.save_simulation_config(config_to_dict(self._config))
+
+        self._metrics_stream = self._results_saver.open_metrics_stream(self._results_config.flush_every_rows,
+                                                                       self._results_config.flush_interval_sec)
+        # a resumed run starts with the restored histories (just the latest values without keep_history)
+        rows = zip(self.history_epochs.tolist(), self.best_cost_history.tolist(),
+                   self.avg_cost_history.tolist(), self.std_cost_history.tolist())
+        for row in rows:
+            self._metrics_stream.write_row(*row)
+        self.results_dir = self._results_saver.get_simulation_dir()
+
+    def _save_results(self) -> None:
+        if self._results_saver is not None:
+            # config and metrics are already on disk
+            try:
+                self._results_saver.save_run_summary(self)
+                if self.stage_timer.enabled:
+                    self._results_saver.save_stage_timings(self.stage_timer.rows)
+                if not self._quiet:
+                    print(f"Results saved to: {self.results_dir}")
+            except Exception as e:
+                print(f"Error saving results: {e}")
+            return
 
-        # Save simulation results
         try:
-            saver = SimulationResultsSaver()
+            saver = SimulationResultsSaver(self._results_dir)
             config_dict = config_to_dict(self._config)
-            saver.save_results(self, config_dict)
-            print(f"Results saved to: {saver.get_simulation_dir()}")
+            saver.save_results(self, config_dict, self._results_config.results_format)
+            if self.stage_timer.enabled:
+                saver.save_stage_timings(self.stage_timer.rows)
+            self.results_dir = saver.get_simulation_dir()
+            if not self._quiet:
+                print(f"Results saved to: {self.results_dir}")
         except Exception as e:
             print(f"Error saving results: {e}")
 
+    def _create_fitness_cache(self) -> FitnessCache:
+        cache_config = self._config.fitness_cache_config
+        if cache_config is None:
+            return None
+
+        precision = self._config.general_config.repr_precision if cache_config.round_to_precision else None
+        return FitnessCache(self._config.evaluator_config.evaluate_func,
+                            cache_config.max_entries, cache_config.max_bytes, precision)
+
     def _calculate_selection_size(self) -> int:
         if SelectionMethodType.TOURNAMENT == self._config.selection_config.selection_type:
             return self._config.selection_config.tournament_size
@@ -95,74 +379,106 @@ class Simulation:
         return int(floor(self._population_size * selection_percentage))
 
     def _generate_init_population(self):
-        self._population = []
-        
-        lower_bounds = [self._bounds[0][i] for i in range(self._dimesions)]
-        upper_bounds = [self._bounds[1][i] for i in range(self._dimesions)]
-
-        for _ in range(self._population_size):
-            individual = []
-            for dim in range(self._dimesions):
-                val = random.uniform(lower_bounds[dim], upper_bounds[dim])
-                individual.append(val)
-            self._population.append(Unit(real_values=individual))
+        lower_bounds = self._bounds[0][:self._dimesions]
+        upper_bounds = self._bounds[1][:self._dimesions]
+
+        self._population = Population.random(self._population_size, lower_bounds, upper_bounds,
+                                             self._random.generator("population"))
+        self._fitness_order = None
             
     def _calculate_costs(self):
-        for unit in self._population:
-            unit.cost = self._cost_function(unit.real_values)
-
-    def _cross_selected_units(self, selected_units: list[Unit]):
-        new_population = []
+        invalid = self._population.invalid_indices()
+        if invalid.size:
+            with self.stage_timer.stage("evaluation"):
+                costs = self._batch_cost_function(self._population.genes[invalid])
+            self._population.set_costs(invalid, costs)
+            self._fitness_order = None
+        self.cost_evaluations += invalid.size
+        self.evaluations_saved += self._population.size - invalid.size
+
+    def _cross_selected_units(self, parent_indices: np.ndarray) -> Population:
         num_offspring = self._population_size - self._elite_units_count
+        pairs_count = -(-num_offspring // 2)
+        parents_count = parent_indices.shape[0]
+
+        # two distinct parents per pair, drawn uniformly
+        rng = self._random.generator("pairing")
+        first_parents = rng.integers(0, parents_count, size=pairs_count)
+        second_parents = (first_parents + rng.integers(1, parents_count, size=pairs_count)) % parents_count
+        first_parents = parent_indices[first_parents]
+        second_parents = parent_indices[second_parents]
+
+        candidates, crossed = self._crossing_batch_func(self._population.genes, first_parents, second_parents,
+                                                       self._random.generator("crossing"))
+
+        # parents that did not cross keep their known costs, missing candidate slots rank last
+        costs = np.full(candidates.shape[:2], -np.inf if self._is_maximim_case else np.inf)
+        kept = ~crossed
+        costs[kept, 0] = self._population.costs[first_parents[kept]]
+        costs[kept, 1] = self._population.costs[second_parents[kept]]
+        if crossed.any():
+            crossed_candidates = candidates[crossed].reshape(-1, self._dimesions)
+            with self.stage_timer.stage("evaluation"):
+                costs[crossed] = self._batch_cost_function(crossed_candidates).reshape(-1, candidates.shape[1])
+            self.cost_evaluations += crossed_candidates.shape[0]
+        self.evaluations_saved += 2 * int(kept.sum())
+
+        # keep the best two children of every pair
+        order = _best_two(-costs if self._is_maximim_case else costs)
+
+        children = np.take_along_axis(candidates, order[:, :, np.newaxis], axis=1)
+        children_costs = np.take_along_axis(costs, order, axis=1)
+        return Population(
+            children.reshape(-1, self._dimesions)[:num_offspring],
+            children_costs.reshape(-1)[:num_offspring]
+        )
+
+    def _mutate_units(self, crossed_units: Population) -> None:
+        mutated = self._mutation_batch_func(crossed_units.genes, self._random.generator("mutation"))
+        crossed_units.invalidate(mutated)
+
+    def _inverse_units(self, mutated_units: Population) -> None:
+        inverted = self._inversion_batch_func(mutated_units.genes, self._random.generator("inversion"))
+        mutated_units.invalidate(inverted)
+
+    def _update_metrics(self, final: bool = False) -> None:
+        costs = self._population.costs
+        current_best = float(costs[self._order().best()])
 
-        while len(new_population) < num_offspring:
-            parent1, parent2 = random.sample(selected_units, 2)
-            candidates = self._crossing_func(parent1, parent2)
-
-            if isinstance(candidates, tuple):
-                candidates = list(candidates)
-            for u in candidates:
-                u.cost = self._cost_function(u.real_values)
-
-            candidates.sort(key=lambda u: u.cost, reverse=self._is_maximim_case)
-            for child in candidates[:2]:
-                if len(new_population) < num_offspring:
-                    new_population.append(child)
-                else:
-                    break
-
-        return new_population
-
-    def _mutate_units(self, crossed_units: list[Unit]) -> list[Unit]:
-        return [self._mutation_func(unit) for unit in crossed_units]
-
-    def _inverse_units(self, mutated_units: list[Unit]) -> list[Unit]:
-        return [self._inversion_func(unit) for unit in mutated_units]
-
-    def _update_metrics(self) -> None:
         if self._is_maximim_case:
-            current_best = max(unit.cost for unit in self._population)
             if self._global_best_cost is None or current_best > self._global_best_cost:
                 self._global_best_cost = current_best
+                self._last_improvement_epoch = self._evaluated_epochs
             best_cost = self._global_best_cost
         else:
-            current_best = min(unit.cost for unit in self._population)
             if self._global_best_cost is None or current_best < self._global_best_cost:
                 self._global_best_cost = current_best
+                self._last_improvement_epoch = self._evaluated_epochs
             best_cost = self._global_best_cost
 
-        # Calculate average cost
-        avg_cost = sum(unit.cost for unit in self._population) / len(self._population) if self._population else float('nan')
+        # Calculate average cost and (sample) standard deviation
+        avg_cost = float(costs.mean())
+        std_dev = float(costs.std(ddof=1)) if costs.shape[0] > 1 else 0.0
+
+        epoch = self._evaluated_epochs
+        self._evaluated_epochs += 1
+
+        if final or epoch % self._record_every == 0:
+            self._history.append(epoch + 1, best_cost, avg_cost, std_dev)
+            if self._metrics_stream is not None:
+                self._metrics_stream.write_row(epoch + 1, best_cost, avg_cost, std_dev)
+
+        if self._progress_callback is not None:
+            self._progress_callback(epoch + 1, self._epochs_number, best_cost, avg_cost, std_dev)
 
-        # Calculate standard deviation
-        costs = [unit.cost for unit in self._population]
-        if len(costs) > 1:
-            mean = avg_cost
-            variance = sum((c - mean) ** 2 for c in costs) / (len(costs) - 1)
-            std_dev = variance ** 0.5
-        else:
-            std_dev = 0.0
 
-        self.std_cost_history.append(std_dev)
-        self.best_cost_history.append(best_cost)
-        self.avg_cost_history.append(avg_cost)
\ No newline at end of file
+def _best_two(keys: np.ndarray) -> np.ndarray:
+    """
+    Column indices of the two smallest keys in every row, smallest first.
+    Ties keep the lower column and NaN keys rank last, as with a stable argsort.
+    """
+    if keys.shape[1] == 2:
+        first, second = keys[:, 0], keys[:, 1]
+        swap = (second < first) | (np.isnan(first) & ~np.isnan(second))
+        return np.stack((swap, ~swap), axis=1).astype(np.intp)
+    return np.argsort(keys, axis=1, kind="stable")[:, :2]
@@ -0,0 +1,68 @@
+import time
+from contextlib import nullcontext
+from typing import Dict, List
+
+STAGES = ("selection", "crossing", "mutation", "inversion", "evaluation", "metrics")
+
+_DISABLED_STAGE = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("_timer", "_name", "_started", "_children")
+
+    def __init__(self, timer: "StageTimer", name: str) -> None:
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._children = 0.0
+        self._timer._stack.append(self)
+        self._started = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        elapsed = time.perf_counter() - self._started
+        stack = self._timer._stack
+        stack.pop()
+        # nested stages are exclusive: the parent does not count the time spent in its children
+        self._timer._current[self._name] += elapsed - self._children
+        if stack:
+            stack[-1]._children += elapsed
+
+
+class StageTimer:
+    """
+    Records the wall time of every pipeline stage, one row per epoch:
+    the epoch number, the seconds of every stage in STAGES and the number
+    of cost function evaluations in that epoch.
+    A disabled timer hands out a shared no-op context and records nothing.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.rows: List[List[float]] = []
+        self._current = dict.fromkeys(STAGES, 0.0)
+        self._stack = []
+        self._evaluations_before = 0
+
+    def stage(self, name: str):
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return _Stage(self, name)
+
+    def end_epoch(self, epoch: int, cost_evaluations: int) -> None:
+        """Close the current row of 1-based 'epoch'; 'cost_evaluations' is the simulation's running total"""
+        if not self.enabled:
+            return
+        self.rows.append([epoch] + [self._current[name] for name in STAGES] + [cost_evaluations - self._evaluations_before])
+        self._current = dict.fromkeys(STAGES, 0.0)
+        self._evaluations_before = cost_evaluations
+
+    def restore(self, cost_evaluations: int) -> None:
+        """Continue counting evaluations from a restored running total"""
+        self._evaluations_before = cost_evaluations
+
+    def totals(self) -> Dict[str, float]:
+        """Total seconds per stage plus the total number of evaluations"""
+        totals = {name: sum(row[i] for row in self.rows) for i, name in enumerate(STAGES, start=1)}
+        totals["evaluations"] = int(sum(row[-1] for row in self.rows))
+        return totals
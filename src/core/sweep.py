@@ -0,0 +1,307 @@
+import copy
+import csv
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List
+
+MANIFEST_FILENAME = "manifest.jsonl"
+FAILURES_FILENAME = "failures.jsonl"
+HISTORIES_FILENAME = "histories.csv"
+SUMMARY_FILENAME = "summary.csv"
+SAMPLE_SEED_FILENAME = "sample_seed.json"
+
+# A run that breaks this many pools of its own (its worker died) is recorded as failed
+MAX_POOL_ATTEMPTS = 2
+
+# set in every sweep worker: where it reports the id of each run it starts
+_started_runs = None
+
+
+def expand_grid(grid: Dict[str, List[Any]], samples: int = None, sample_seed: int = None) -> List[Dict[str, Any]]:
+    """
+    Expand a parameter grid into a list of override dictionaries.
+    Keys are dotted paths into the config_to_dict schema, e.g. "general_config.population_size".
+    With 'samples' set, that many distinct cells are drawn at random instead of the full product.
+    """
+    keys = sorted(grid)
+    cells = [dict(zip(keys, values)) for values in itertools.product(*(grid[key] for key in keys))]
+    if samples is not None and samples < len(cells):
+        cells = random.Random(sample_seed).sample(cells, samples)
+    return cells
+
+
+def apply_overrides(base_config: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Deep copy of 'base_config' with every dotted-path override applied"""
+    config = copy.deepcopy(base_config)
+    for path, value in overrides.items():
+        *parents, leaf = path.split(".")
+        node = config
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return config
+
+
+def cell_id(base_config: Dict[str, Any], overrides: Dict[str, Any], seed: int) -> str:
+    """
+    Stable identifier of one (base config, grid cell, seed) run, used to skip completed work on resume.
+    Editing the base config changes every id, so its runs are not mistaken for completed ones.
+    """
+    payload = json.dumps({"base_config": base_config, "overrides": overrides, "seed": seed}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def run_cell(config_dict: Dict[str, Any], seed: int, runs_dir: str) -> Dict[str, Any]:
+    """Run one simulation in a worker process and return its histories"""
+    from src.config.config_loader import config_from_dict
+    from src.core.simulation import Simulation
+
+    config_dict = copy.deepcopy(config_dict)
+    config_dict["general_config"]["seed"] = seed
+    # runs are short and resumable through the manifest; a shared checkpoint path would collide
+    config_dict.pop("checkpoint_config", None)
+    simulation = Simulation(config_from_dict(config_dict), results_dir=runs_dir, quiet=True)
+    simulation.start()
+    return {
+        "history_epochs": simulation.history_epochs.tolist(),
+        "best_cost_history": [float(cost) for cost in simulation.best_cost_history],
+        "avg_cost_history": [float(cost) for cost in simulation.avg_cost_history],
+        "std_cost_history": [float(cost) for cost in simulation.std_cost_history],
+        "elapsed_time": simulation.elapsed_time,
+        "results_dir": str(simulation.results_dir) if simulation.results_dir else None
+    }
+
+
+def _set_started_runs(started_runs) -> None:
+    global _started_runs
+    _started_runs = started_runs
+
+
+def _run_reporting_start(run_id: str, config_dict: Dict[str, Any], seed: int, runs_dir: str) -> Dict[str, Any]:
+    """run_cell, after telling the sweep that 'run_id' is now running in this worker"""
+    _started_runs.put(run_id)
+    return run_cell(config_dict, seed, runs_dir)
+
+
+class ParameterSweep:
+    """
+    Runs every grid cell x seed across a process pool.
+    Completed runs are appended to a manifest as they finish, so an interrupted
+    sweep resumes without redoing them. Failed runs are logged and retried on the next resume.
+    Without a 'sample_seed', sampled cells are drawn with a generated seed that is saved in
+    'output_dir', so a resumed sweep samples the same cells.
+    """
+
+    def __init__(self, base_config: Dict[str, Any], grid: Dict[str, List[Any]], seeds: List[int],
+                 output_dir: str, workers: int = None, samples: int = None, sample_seed: int = None,
+                 quiet: bool = False) -> None:
+        assert seeds
+        assert workers is None or workers > 0
+
+        self.base_config = base_config
+        self.seeds = list(seeds)
+        self.output_dir = Path(output_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.quiet = quiet
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._runs_dir = self.output_dir / "runs"
+        if samples is not None:
+            sample_seed = self._persist_sample_seed(sample_seed)
+        self.sample_seed = sample_seed
+        self.cells = expand_grid(grid, samples, sample_seed)
+
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any], output_dir: str = None, workers: int = None,
+                  quiet: bool = False) -> "ParameterSweep":
+        """
+        Build a sweep from a specification dictionary:
+        base_config, grid, seeds (count or list), and optionally samples, sample_seed,
+        workers and output_dir.
+        """
+        seeds = spec.get("seeds", 1)
+        if isinstance(seeds, int):
+            seeds = list(range(seeds))
+        return cls(
+            spec["base_config"],
+            spec.get("grid", {}),
+            seeds,
+            output_dir or spec.get("output_dir", "sweeps"),
+            workers or spec.get("workers"),
+            spec.get("samples"),
+            spec.get("sample_seed"),
+            quiet
+        )
+
+    def pending_runs(self) -> List[Dict[str, Any]]:
+        completed = self.completed_ids()
+        runs = []
+        for overrides in self.cells:
+            for seed in self.seeds:
+                run_id = cell_id(self.base_config, overrides, seed)
+                if run_id not in completed:
+                    runs.append({"id": run_id, "overrides": overrides, "seed": seed})
+        return runs
+
+    def completed_ids(self) -> set:
+        return {record["id"] for record in self._read_manifest()}
+
+    def run(self) -> Path:
+        """Run all pending cells, then rebuild the aggregated tables. Returns the histories table path."""
+        pending = self.pending_runs()
+        total = len(self.cells) * len(self.seeds)
+        self._log(f"Sweep: {total - len(pending)}/{total} runs already completed, {len(pending)} to go")
+
+        while pending:
+            isolated = [run for run in pending if run.get("isolated")]
+            pending = [run for run in pending if not run.get("isolated")]
+            retry = []
+            # a run suspected of killing its worker gets a pool of its own, so a crash is only charged to it
+            for run in isolated:
+                retry += self._run_batch([run], 1)
+            if pending:
+                retry += self._run_batch(pending, self.workers)
+            pending = retry
+
+        return self.write_tables()
+
+    def _run_batch(self, runs: List[Dict[str, Any]], workers: int) -> List[Dict[str, Any]]:
+        """
+        Run 'runs' on a fresh pool of 'workers' processes. If a worker dies and breaks the pool,
+        the runs lost with it are returned to be retried (see _triage_lost_runs).
+        """
+        lost = []
+        context = multiprocessing.get_context()
+        # a SimpleQueue writes synchronously, so a report sent just before a crash is not lost
+        started_runs = context.SimpleQueue()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                 initializer=_set_started_runs, initargs=(started_runs,)) as pool:
+            futures = {}
+            for run in runs:
+                config = apply_overrides(self.base_config, run["overrides"])
+                future = pool.submit(_run_reporting_start, run["id"], config, run["seed"], str(self._runs_dir))
+                futures[future] = run
+
+            remaining = set(futures)
+            while remaining:
+                done, remaining = wait(remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    run = futures[future]
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        lost.append(run)
+                        continue
+                    except Exception:
+                        self._record_failure(run, traceback.format_exc())
+                        continue
+                    self._record_success(run, result)
+
+        started = set()
+        while not started_runs.empty():
+            started.add(started_runs.get())
+        return self._triage_lost_runs(lost, started)
+
+    def _triage_lost_runs(self, lost: List[Dict[str, Any]], started: set) -> List[Dict[str, Any]]:
+        """
+        Runs lost with a broken pool, to be retried. Runs that were still queued are retried as they
+        are. Runs that were running become suspects and are retried isolated, on a pool of their own;
+        only a run that breaks its own pool is charged an attempt, and fails after MAX_POOL_ATTEMPTS.
+        """
+        running = {run["id"] for run in lost if run["id"] in started}
+        if not running:
+            # the worker died before reporting any run, so the crash cannot be pinned on one
+            running = {run["id"] for run in lost}
+
+        retry = []
+        for run in lost:
+            if run.get("isolated"):
+                run["attempts"] = run.get("attempts", 0) + 1
+                if run["attempts"] >= MAX_POOL_ATTEMPTS:
+                    self._record_failure(run, "worker process terminated abruptly")
+                    continue
+            elif run["id"] in running:
+                run["isolated"] = True
+            retry.append(run)
+        return retry
+
+    def write_tables(self) -> Path:
+        """Aggregate every completed run into one long-format histories table and a per-run summary"""
+        records = self._read_manifest()
+        param_keys = sorted({key for record in records for key in record["overrides"]})
+
+        histories_path = self.output_dir / HISTORIES_FILENAME
+        with open(histories_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["run_id", "seed", *param_keys, "epoch", "best_cost", "avg_cost", "deviation"])
+            for record in records:
+                params = [record["overrides"].get(key) for key in param_keys]
+                epochs = record.get("history_epochs") or range(1, len(record["best_cost_history"]) + 1)
+                rows = zip(epochs, record["best_cost_history"], record["avg_cost_history"], record["std_cost_history"])
+                for epoch, best, avg, std in rows:
+                    writer.writerow([record["id"], record["seed"], *params, epoch, best, avg, std])
+
+        with open(self.output_dir / SUMMARY_FILENAME, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["run_id", "seed", *param_keys, "final_best_cost", "elapsed_time", "results_dir"])
+            for record in records:
+                params = [record["overrides"].get(key) for key in param_keys]
+                final_best = record["best_cost_history"][-1] if record["best_cost_history"] else None
+                writer.writerow([record["id"], record["seed"], *params, final_best,
+                                 record["elapsed_time"], record["results_dir"]])
+
+        return histories_path
+
+    def _persist_sample_seed(self, sample_seed: int) -> int:
+        """The given seed, else the one a previous run of this sweep saved, else a new one; saved for resumes"""
+        path = self.output_dir / SAMPLE_SEED_FILENAME
+        if sample_seed is None and path.exists():
+            with open(path) as f:
+                return json.load(f)["sample_seed"]
+        if sample_seed is None:
+            sample_seed = random.SystemRandom().randrange(2 ** 32)
+        with open(path, "w") as f:
+            json.dump({"sample_seed": sample_seed}, f)
+        return sample_seed
+
+    def _record_success(self, run: Dict[str, Any], result: Dict[str, Any]) -> None:
+        record = {"id": run["id"], "overrides": run["overrides"], "seed": run["seed"], **result}
+        self._append_line(MANIFEST_FILENAME, record)
+        self._log(f"Run {run['id']} (seed {run['seed']}) finished: best cost {result['best_cost_history'][-1]}")
+
+    def _record_failure(self, run: Dict[str, Any], error: str) -> None:
+        self._append_line(FAILURES_FILENAME, {**run, "error": error})
+        self._log(f"Run {run['id']} (seed {run['seed']}) failed")
+
+    def _append_line(self, filename: str, record: Dict[str, Any]) -> None:
+        with open(self.output_dir / filename, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_manifest(self) -> List[Dict[str, Any]]:
+        path = self.output_dir / MANIFEST_FILENAME
+        if not path.exists():
+            return []
+        records = {}
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # a line cut short by a crash; that run simply counts as not completed
+                    continue
+                records[record["id"]] = record
+        return list(records.values())
+
+    def _log(self, message: str) -> None:
+        if not self.quiet:
+            print(message)
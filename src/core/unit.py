@@ -1,21 +1,81 @@
-from typing import List
-import random
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from src.core.random_service import default_service
 
 class Unit:
+    """
+    Single individual. Either owns its values or is a lightweight view
+    over one row of a Population's gene matrix and cost vector.
+    """
+    __slots__ = ("_real_values", "_cost", "_costs", "_index")
+
     def __init__(self, real_values: List[float], cost: float = None) -> None:
-        self.real_values = real_values
-        self.cost = cost
+        self._real_values = real_values
+        self._cost = cost
+        self._costs = None
+        self._index = None
+
+    @classmethod
+    def view(cls, genes: np.ndarray, costs: np.ndarray, index: int) -> "Unit":
+        """Create a unit backed by row 'index' of the given arrays (no copy)"""
+        unit = cls.__new__(cls)
+        unit._real_values = genes[index]
+        unit._cost = None
+        unit._costs = costs
+        unit._index = index
+        return unit
+
+    @property
+    def real_values(self):
+        return self._real_values
+
+    @real_values.setter
+    def real_values(self, values) -> None:
+        if self._costs is None:
+            self._real_values = values
+        else:
+            self._real_values[:] = values
+
+    @property
+    def cost(self) -> float:
+        if self._costs is None:
+            return self._cost
+        cost = self._costs[self._index]
+        return None if np.isnan(cost) else float(cost)
+
+    @cost.setter
+    def cost(self, value: float) -> None:
+        if self._costs is None:
+            self._cost = value
+        else:
+            self._costs[self._index] = np.nan if value is None else value
 
     def __repr__(self) -> str:
         return f"Unit(real_values={self.real_values}, cost={self.cost})"
 
 
 class UnitFactory:
-    def __init__(self, lower_bound: float, upper_bound: float) -> None:
+    """Bounds may be a single value shared by every dimension or one value per dimension."""
+    def __init__(self, lower_bound: Union[float, Sequence[float]], upper_bound: Union[float, Sequence[float]]) -> None:
         self._lower_bound = lower_bound
         self._upper_bound = upper_bound
 
+    def bounds(self, dimension: int) -> tuple[np.ndarray, np.ndarray]:
+        """Per-dimension (lower, upper) bound arrays of length 'dimension'"""
+        lower = np.broadcast_to(np.asarray(self._lower_bound, dtype=np.float64), (dimension,))
+        upper = np.broadcast_to(np.asarray(self._upper_bound, dtype=np.float64), (dimension,))
+        return lower, upper
+
     def create_random_unit(self, dimension: int) -> Unit:
         """Generate a random unit with 'dimension' real values within bounds"""
-        real_values = [random.uniform(self._lower_bound, self._upper_bound) for _ in range(dimension)]
-        return Unit(real_values=real_values)
\ No newline at end of file
+        lower, upper = self.bounds(dimension)
+        random_blocks = default_service().blocks("population")
+        real_values = [random_blocks.uniform(lower[i], upper[i]) for i in range(dimension)]
+        return Unit(real_values=real_values)
+
+    def create_random_genes(self, size: int, dimension: int, rng: np.random.Generator) -> np.ndarray:
+        """Generate a (size, dimension) gene matrix with values within bounds"""
+        lower, upper = self.bounds(dimension)
+        return rng.uniform(lower, upper, size=(size, dimension))
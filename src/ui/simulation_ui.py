@@ -1,5 +1,7 @@
 from math import isnan, nan
-import matplotlib.pyplot as plt
+import queue
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk
 from src.config.cost_function_config import CostFunctionConfig
@@ -37,6 +39,8 @@ class SimulationUI:
 
     __ELITE_STRATEGY_UNIT_COUNT = 1
 
+    __PROGRESS_POLL_INTERVAL_MS = 100
+
     def __init__(self, master):
         self.master = master
         self.master.title('Simulation Configuration')
@@ -222,8 +226,8 @@ class SimulationUI:
             # unit factory
             suggested_bounds = cost_function_config.cost_func.suggested_bounds()
 
-            lower_bound, upper_bound = suggested_bounds[0][0], suggested_bounds[1][0]
-            unit_factory = UnitFactory(lower_bound, upper_bound)
+            lower_bounds, upper_bounds = suggested_bounds[0], suggested_bounds[1]
+            unit_factory = UnitFactory(lower_bounds, upper_bounds)
 
             # selection function config
             tournament_size = None
@@ -310,43 +314,120 @@ class SimulationUI:
             self._reset_variables()
             return
 
-        # create simulation
+        # create simulation; it runs on a worker thread and streams progress back through a queue
+        self._progress_queue = queue.Queue()
+        self._simulation = Simulation(config, progress_callback=self._on_simulation_progress)
+        self._simulation_started_at = time.time()
         self._open_loading_window()
 
-        simulation = Simulation(config)
-        simulation.start()
+        worker = threading.Thread(target=self._run_simulation, args=(self._simulation,), daemon=True)
+        worker.start()
+        self.master.after(self.__PROGRESS_POLL_INTERVAL_MS, self._poll_simulation_progress)
 
-        self._close_loading_window()
-        self._switch_to_results_page(simulation)
+    def _run_simulation(self, simulation: Simulation):
+        # worker thread: never touch Tk widgets here
+        try:
+            simulation.start()
+            self._progress_queue.put(("done", None))
+        except Exception as e:
+            self._progress_queue.put(("error", e))
+
+    def _on_simulation_progress(self, epoch, epochs, best_cost, avg_cost, std_cost):
+        self._progress_queue.put(("progress", (epoch, epochs, best_cost, avg_cost, std_cost)))
+
+    def _poll_simulation_progress(self):
+        latest_progress = None
+        while True:
+            try:
+                kind, payload = self._progress_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                latest_progress = payload
+            elif kind == "done":
+                self._close_loading_window()
+                self._switch_to_results_page(self._simulation)
+                return
+            elif kind == "error":
+                self._close_loading_window()
+                self._display_simulation_error(payload)
+                return
+
+        if latest_progress is not None:
+            self._update_loading_window(*latest_progress)
+        self.master.after(self.__PROGRESS_POLL_INTERVAL_MS, self._poll_simulation_progress)
 
     def _open_loading_window(self):
         loading_window = tk.Toplevel(self.master)
         loading_window.title("Simulation Running")
-        loading_window.geometry("300x100")
+        loading_window.geometry("360x190")
         loading_window.grab_set()
+        loading_window.protocol("WM_DELETE_WINDOW", self._cancel_simulation)
+
         loading_label = ttk.Label(loading_window, text="Simulation is running...", anchor='center', font=("Arial", 14))
-        loading_label.place(relx=0.5, rely=0.5, anchor='center')
-        loading_window.update()
+        loading_label.pack(pady=(12, 6))
+
+        self.progress_var = tk.DoubleVar(value=0.0)
+        ttk.Progressbar(loading_window, variable=self.progress_var, maximum=100, length=300).pack(pady=4)
+
+        self.progress_label = ttk.Label(loading_window, text="Epoch 0 | ETA --", anchor='center')
+        self.progress_label.pack(pady=2)
+        self.progress_best_label = ttk.Label(loading_window, text="Best: -- | Avg: -- | Std: --", anchor='center')
+        self.progress_best_label.pack(pady=2)
+
+        self.cancel_button = ttk.Button(loading_window, text="Cancel", command=self._cancel_simulation)
+        self.cancel_button.pack(pady=(6, 10))
+
         self.loading_window = loading_window
 
+    def _update_loading_window(self, epoch, epochs, best_cost, avg_cost, std_cost):
+        # the evaluation of the last generation comes after epoch 'epochs' and also counts as done
+        epoch = min(epoch, epochs)
+        self.progress_var.set(100.0 * epoch / epochs)
+
+        eta = "--"
+        if epoch > 0:
+            elapsed = time.time() - self._simulation_started_at
+            eta = f"{elapsed / epoch * (epochs - epoch):.1f} s"
+        self.progress_label.config(text=f"Epoch {epoch}/{epochs} | ETA {eta}")
+        self.progress_best_label.config(text=f"Best: {best_cost:.6g} | Avg: {avg_cost:.6g} | Std: {std_cost:.6g}")
+
+    def _cancel_simulation(self):
+        self._simulation.request_stop()
+        self.cancel_button.config(state=tk.DISABLED, text="Cancelling...")
+
     def _close_loading_window(self):
         self.loading_window.destroy()
 
+    def _display_simulation_error(self, error: Exception):
+        error_window = tk.Toplevel(self.master)
+        error_window.title("Simulation Error")
+        error_window.grab_set()
+        error_label = ttk.Label(error_window, text=f"Simulation failed: {error}", padding=10)
+        error_label.pack(padx=20, pady=10)
+        close_button = ttk.Button(error_window, text="Close", command=error_window.destroy)
+        close_button.pack(pady=(0, 10))
+
     def _switch_to_results_page(self, simulation: Simulation):
         self._clear_page()
         self._draw_charts(simulation)
 
         elapsed_time_sec = simulation.elapsed_time
+        cancelled_note = f" (cancelled after {simulation.epochs_completed} epochs)" if simulation.cancelled else ""
         self.elapsed_label = ttk.Label(
             self.master,
-            text=f"Simulation run time: {elapsed_time_sec:.2f} seconds",
+            text=f"Simulation run time: {elapsed_time_sec:.2f} seconds{cancelled_note}",
             font=("Arial", 14)
         )
         self.elapsed_label.pack(pady=(10, 5))
 
     def _draw_charts(self, simulation: Simulation):
+        # matplotlib is slow to import, load it only once there is something to plot
+        import matplotlib.pyplot as plt
+
         # Prepare data
-        epochs = list(range(len(simulation.best_cost_history)))
+        epochs = (simulation.history_epochs - 1).tolist()
         best_cost = simulation.best_cost_history
         avg_cost = simulation.avg_cost_history
         std_cost = simulation.std_cost_history
@@ -0,0 +1,37 @@
+import pytest
+
+from src.config.cost_function_config import CostFunctionConfig
+from src.config.crossing_config import CrossingConfig
+from src.config.general_config import GeneralConfig
+from src.config.inversion_config import InversionConfig
+from src.config.mutation_config import MutationConfig
+from src.config.selection_config import SelectionConfig
+from src.config.simulation_config import SimulationConfiguration
+from src.core.cost_function import CostFunction
+from src.core.crossing import CrossingMethodType
+from src.core.mutation import MutationMethodType
+from src.core.selection import SelectionMethodType
+from src.core.unit import UnitFactory
+
+
+def make_simulation_config(population_size: int = 20, epochs_no: int = 10, seed: int = 1,
+                           **kwargs) -> SimulationConfiguration:
+    """Small minimization of Rastrigin in 3 dimensions; 'kwargs' go to SimulationConfiguration"""
+    cost_function_config = CostFunctionConfig(3, CostFunction.RASTRIGIN)
+    lower, upper = cost_function_config.cost_func.suggested_bounds()
+    unit_factory = UnitFactory(lower, upper)
+    return SimulationConfiguration(
+        unit_factory,
+        cost_function_config,
+        CrossingConfig(CrossingMethodType.ARITHMETIC, 80, unit_factory, 1),
+        GeneralConfig(population_size, epochs_no, 6, seed),
+        InversionConfig(unit_factory, 10),
+        MutationConfig(unit_factory, MutationMethodType.GAUSSIAN, 20),
+        SelectionConfig(SelectionMethodType.TOURNAMENT, 50, False, 3),
+        **kwargs
+    )
+
+
+@pytest.fixture
+def simulation_config() -> SimulationConfiguration:
+    return make_simulation_config()
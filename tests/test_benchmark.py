@@ -0,0 +1,31 @@
+from src.core.benchmark import compare_to_baseline
+
+
+def _report(*cases):
+    return {"cases": list(cases)}
+
+
+def test_slowdown_beyond_threshold_is_a_regression():
+    baseline = _report({"id": "a", "epochs_per_sec": 100.0}, {"id": "b", "epochs_per_sec": 100.0})
+    report = _report({"id": "a", "epochs_per_sec": 95.0}, {"id": "b", "epochs_per_sec": 80.0})
+
+    regressions = compare_to_baseline(report, baseline, 0.1)
+
+    assert [regression["id"] for regression in regressions] == ["b"]
+    assert regressions[0]["ratio"] == 0.8
+
+
+def test_newly_failing_case_is_a_regression():
+    baseline = _report({"id": "a", "epochs_per_sec": 100.0})
+    report = _report({"id": "a", "error": "ValueError: boom"})
+
+    assert compare_to_baseline(report, baseline) == [
+        {"id": "a", "baseline_epochs_per_sec": 100.0, "epochs_per_sec": None, "ratio": None, "error": "ValueError: boom"}
+    ]
+
+
+def test_cases_failing_in_baseline_or_missing_are_ignored():
+    baseline = _report({"id": "a", "error": "ValueError: boom"}, {"id": "b", "epochs_per_sec": 100.0})
+    report = _report({"id": "a", "error": "ValueError: boom"}, {"id": "c", "epochs_per_sec": 1.0})
+
+    assert compare_to_baseline(report, baseline) == []
@@ -0,0 +1,36 @@
+import importlib.util
+
+import numpy as np
+import pytest
+
+from src.config.cost_function_config import CostFunctionConfig
+from src.core.cec2014 import SUPPORTED_DIMENSIONS
+from src.core.cost_function import CostFunction
+
+pytestmark = pytest.mark.skipif(importlib.util.find_spec("opfunu") is None,
+                                reason="opfunu is the reference implementation and the data source")
+
+CEC2014_FUNCTIONS = [member for member in CostFunction if member.class_name.startswith("CEC2014_")]
+
+
+@pytest.mark.parametrize("dims", SUPPORTED_DIMENSIONS)
+@pytest.mark.parametrize("cost_function", CEC2014_FUNCTIONS, ids=lambda member: member.class_name)
+def test_matches_opfunu_reference(cost_function, dims):
+    native = CostFunctionConfig(dims, cost_function).cost_func
+    reference = CostFunctionConfig(dims, cost_function, reference_backend=True).cost_func
+    points = np.random.default_rng(dims).uniform(-100.0, 100.0, size=(8, dims))
+
+    expected = np.array([reference(point) for point in points])
+    np.testing.assert_allclose(native.evaluate_batch(points), expected, rtol=1e-10, atol=1e-8)
+    assert native(points[0]) == pytest.approx(expected[0], rel=1e-10, abs=1e-8)
+
+
+@pytest.mark.parametrize("dims", SUPPORTED_DIMENSIONS)
+@pytest.mark.parametrize("cost_function", CEC2014_FUNCTIONS, ids=lambda member: member.class_name)
+def test_optimum_costs_the_bias(cost_function, dims):
+    native = CostFunctionConfig(dims, cost_function).cost_func
+    optimum = CostFunctionConfig(dims, cost_function, reference_backend=True).cost_func.func_obj.x_global
+
+    # CEC2014 biases are 100 * function number; Schwefel's constant leaves a rounding residue
+    assert native.bias == 100.0 * int(cost_function.class_name.split("_F")[1])
+    assert native(optimum) == pytest.approx(native.bias, rel=1e-14, abs=1e-10)
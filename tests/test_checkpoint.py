@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from src.config.checkpoint_config import CheckpointConfig
+from src.config.fitness_cache_config import FitnessCacheConfig
+from src.core.simulation import Simulation
+from tests.conftest import make_simulation_config
+
+
+def _config(checkpoint_path=None, fitness_cache_config=None):
+    checkpoint_config = CheckpointConfig(checkpoint_path, every_epochs=1000) if checkpoint_path else None
+    # coarse rounding makes cache hits on nearby chromosomes frequent
+    config = make_simulation_config(population_size=40, epochs_no=30, checkpoint_config=checkpoint_config,
+                                    fitness_cache_config=fitness_cache_config)
+    config.general_config.repr_precision = 1
+    return config
+
+
+@pytest.mark.parametrize("fitness_cache_config", [
+    None,
+    FitnessCacheConfig(),
+    FitnessCacheConfig(round_to_precision=True),
+    FitnessCacheConfig(max_entries=50, round_to_precision=True)
+], ids=["no-cache", "exact-cache", "rounding-cache", "rounding-cache-evicting"])
+def test_resume_matches_uninterrupted_run(tmp_path, fitness_cache_config):
+    checkpoint_path = str(tmp_path / "checkpoint.npz")
+    uninterrupted = Simulation(_config(fitness_cache_config=fitness_cache_config),
+                               results_dir=str(tmp_path / "uninterrupted"), quiet=True)
+    uninterrupted.start()
+
+    def stop_at_epoch_12(epoch, total, best, avg, std):
+        if epoch == 12:
+            interrupted.request_stop()
+
+    interrupted = Simulation(_config(checkpoint_path, fitness_cache_config), results_dir=str(tmp_path / "interrupted"),
+                             quiet=True, progress_callback=stop_at_epoch_12)
+    interrupted.start()
+    assert interrupted.cancelled
+
+    resumed = Simulation(_config(checkpoint_path, fitness_cache_config), results_dir=str(tmp_path / "resumed"),
+                         quiet=True)
+    resumed.resume(checkpoint_path)
+
+    np.testing.assert_array_equal(resumed.best_cost_history, uninterrupted.best_cost_history)
+    np.testing.assert_array_equal(resumed.avg_cost_history, uninterrupted.avg_cost_history)
+    np.testing.assert_array_equal(resumed.std_cost_history, uninterrupted.std_cost_history)
+    assert resumed.cost_evaluations == uninterrupted.cost_evaluations
+    if fitness_cache_config is not None:
+        assert resumed.fitness_cache.stats() == uninterrupted.fitness_cache.stats()
@@ -0,0 +1,20 @@
+import pytest
+
+from src.config.cost_function_config import CostFunctionConfig
+from src.core.cost_function import CostFunction
+
+
+def test_native_functions_accept_any_dimensions():
+    assert CostFunction.RASTRIGIN.supported_dimensions is None
+    assert CostFunctionConfig(2, CostFunction.RASTRIGIN).dimensions == 2
+
+
+def test_cec2014_rejects_unsupported_dimensions_as_invalid_config():
+    # the UI and the CLI report AssertionError as an invalid configuration
+    with pytest.raises(AssertionError, match="supports"):
+        CostFunctionConfig(2, CostFunction.CEC2014_F1)
+
+
+def test_cec2014_accepts_supported_dimensions():
+    assert 10 in CostFunction.CEC2014_F1.supported_dimensions
+    assert len(CostFunctionConfig(10, CostFunction.CEC2014_F1).cost_func.suggested_bounds()[0]) == 10
@@ -0,0 +1,84 @@
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from src.config.cost_function_config import CostFunctionConfig
+from src.core import evaluator
+from src.core.cost_function import CostFunction
+from src.core.evaluator import EvaluatorType, create_evaluator, shutdown_pools
+
+COST_FUNCTIONS = [
+    CostFunction.RASTRIGIN,
+    pytest.param(CostFunction.CEC2014_F17, marks=pytest.mark.skipif(
+        importlib.util.find_spec("opfunu") is None, reason="opfunu builds the CEC2014 data cache"))
+]
+
+
+@pytest.fixture(autouse=True)
+def stop_pools():
+    yield
+    shutdown_pools()
+
+
+@pytest.mark.parametrize("evaluator_type", [EvaluatorType.THREAD_POOL, EvaluatorType.PROCESS_POOL])
+@pytest.mark.parametrize("cost_function", COST_FUNCTIONS)
+def test_pooled_costs_equal_serial(cost_function, evaluator_type):
+    cost_func = CostFunctionConfig(10, cost_function).cost_func
+    genes = np.random.default_rng(0).uniform(-100.0, 100.0, size=(37, 10))
+    serial = create_evaluator(EvaluatorType.SERIAL, cost_func)
+    pooled = create_evaluator(evaluator_type, cost_func, workers=2, chunk_size=8)
+    try:
+        expected = serial.evaluate(genes)
+        # twice: the second call reuses the shared block and the unpickled function
+        np.testing.assert_array_equal(pooled.evaluate(genes), expected)
+        np.testing.assert_array_equal(pooled.evaluate(genes[:20]), expected[:20])
+    finally:
+        pooled.close()
+
+
+def test_pools_are_shared_per_executor_and_worker_count():
+    cost_func = CostFunctionConfig(3, CostFunction.HYPERSPHERE).cost_func
+    genes = np.ones((6, 3))
+    first = create_evaluator(EvaluatorType.PROCESS_POOL, cost_func, workers=2, chunk_size=2)
+    second = create_evaluator(EvaluatorType.PROCESS_POOL, cost_func, workers=2, chunk_size=3)
+    try:
+        first.evaluate(genes)
+        second.evaluate(genes)
+        assert list(evaluator._pools) == [(ProcessPoolExecutor, 2)]
+
+        create_evaluator(EvaluatorType.PROCESS_POOL, cost_func, workers=3, chunk_size=2).evaluate(genes)
+        assert set(evaluator._pools) == {(ProcessPoolExecutor, 2), (ProcessPoolExecutor, 3)}
+    finally:
+        first.close()
+        second.close()
+
+
+def test_close_releases_shared_memory_and_shutdown_releases_pools():
+    cost_func = CostFunctionConfig(3, CostFunction.HYPERSPHERE).cost_func
+    process_evaluator = create_evaluator(EvaluatorType.PROCESS_POOL, cost_func, workers=2, chunk_size=2)
+    process_evaluator.evaluate(np.ones((6, 3)))
+    name = process_evaluator._shared_memory.name
+    pool = evaluator._pools[(ProcessPoolExecutor, 2)]
+
+    process_evaluator.close()
+
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+    # the pool is shared by every evaluator, so it outlives close() until shutdown_pools()
+    assert evaluator._pools[(ProcessPoolExecutor, 2)] is pool
+    shutdown_pools()
+    assert not evaluator._pools
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+
+
+def test_small_batches_are_evaluated_in_process():
+    cost_func = CostFunctionConfig(3, CostFunction.HYPERSPHERE).cost_func
+    process_evaluator = create_evaluator(EvaluatorType.PROCESS_POOL, cost_func, workers=2)
+
+    np.testing.assert_array_equal(process_evaluator.evaluate(np.ones((1, 3))), [3.0])
+    assert process_evaluator._shared_memory is None
+    assert not evaluator._pools
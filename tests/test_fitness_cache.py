@@ -0,0 +1,104 @@
+import numpy as np
+
+from src.core.fitness_cache import FitnessCache
+
+
+class _CountingFunction:
+    def __init__(self):
+        self.rows = 0
+
+    def __call__(self, matrix):
+        self.rows += matrix.shape[0]
+        return matrix.sum(axis=1)
+
+
+def test_hits_and_misses_are_counted_and_duplicates_evaluated_once():
+    func = _CountingFunction()
+    cache = FitnessCache(func, max_entries=10)
+    genes = np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+
+    np.testing.assert_array_equal(cache.evaluate(genes), [3.0, 7.0, 3.0])
+    assert (cache.hits, cache.misses, func.rows) == (1, 2, 2)
+
+    np.testing.assert_array_equal(cache.evaluate(genes[:2]), [3.0, 7.0])
+    assert (cache.hits, cache.misses, func.rows) == (3, 2, 2)
+    assert cache.stats()["hit_rate"] == 0.6
+    assert len(cache) == 2
+
+
+def test_least_recently_used_entry_is_evicted_at_capacity():
+    func = _CountingFunction()
+    cache = FitnessCache(func, max_entries=2)
+    a, b, c = np.array([[1.0]]), np.array([[2.0]]), np.array([[3.0]])
+
+    cache.evaluate(a)
+    cache.evaluate(b)
+    cache.evaluate(a)  # a is now more recent than b
+    cache.evaluate(c)  # evicts b
+
+    assert len(cache) == 2
+    keys, _ = cache.entries()
+    np.testing.assert_array_equal(keys, [[1.0], [3.0]])
+    cache.evaluate(b)
+    assert func.rows == 4
+
+
+def test_max_bytes_bounds_the_entries():
+    cache = FitnessCache(_CountingFunction(), max_bytes=1000)
+
+    cache.evaluate(np.arange(100.0).reshape(50, 2))
+
+    assert 0 < len(cache) < 50
+    assert cache.stats()["approx_bytes"] <= 1000
+
+
+def test_rounding_keys_collapse_nearby_rows():
+    func = _CountingFunction()
+    cache = FitnessCache(func, max_entries=10, precision=2)
+
+    costs = cache.evaluate(np.array([[0.1231, 1.0], [0.1229, 1.0], [0.0, -0.0], [-0.0, 0.0], [0.126, 1.0]]))
+
+    assert func.rows == 3
+    # a hit returns the cost of the first row that had the key
+    assert costs[1] == costs[0]
+    assert costs[3] == costs[2]
+    assert costs[4] != costs[0]
+
+
+def test_exact_keys_tell_nearby_rows_apart():
+    func = _CountingFunction()
+    cache = FitnessCache(func, max_entries=10)
+
+    cache.evaluate(np.array([[0.1231, 1.0], [0.1229, 1.0]]))
+
+    assert func.rows == 2
+
+
+def test_entries_and_restore_round_trip():
+    cache = FitnessCache(_CountingFunction(), max_entries=3, precision=1)
+    cache.evaluate(np.array([[1.04, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+    cache.evaluate(np.array([[3.0, 4.0]]))
+    keys, costs = cache.entries()
+
+    func = _CountingFunction()
+    restored = FitnessCache(func, max_entries=3, precision=1)
+    restored.restore(keys, costs)
+
+    np.testing.assert_array_equal(keys, [[1.0, 2.0], [5.0, 6.0], [3.0, 4.0]])
+    restored_keys, restored_costs = restored.entries()
+    np.testing.assert_array_equal(restored_keys, keys)
+    np.testing.assert_array_equal(restored_costs, costs)
+    np.testing.assert_array_equal(restored.evaluate(np.array([[1.01, 2.0]])), [3.04])
+    assert func.rows == 0
+    # the LRU order survived: the hit moved [1, 2] last, so [5, 6] is evicted first
+    restored.evaluate(np.array([[7.0, 8.0]]))
+    np.testing.assert_array_equal(restored.entries()[0], [[3.0, 4.0], [1.0, 2.0], [7.0, 8.0]])
+
+
+def test_empty_cache_round_trips():
+    keys, costs = FitnessCache(_CountingFunction(), max_entries=3).entries()
+    restored = FitnessCache(_CountingFunction(), max_entries=3)
+
+    restored.restore(keys, costs)
+
+    assert len(restored) == 0
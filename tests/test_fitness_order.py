@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from src.core.fitness_order import FitnessOrder, top_k
+
+
+def _stable_order(keys):
+    return np.argsort(keys, kind="stable")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_top_matches_stable_argsort_with_ties(seed):
+    rng = np.random.default_rng(seed)
+    keys = rng.integers(0, 4, size=30).astype(float)
+
+    for k in range(31):
+        np.testing.assert_array_equal(FitnessOrder(keys, False).top(k), _stable_order(keys)[:k])
+        np.testing.assert_array_equal(np.sort(FitnessOrder(keys, False).top(k, ordered=False)),
+                                      np.sort(_stable_order(keys)[:k]))
+        np.testing.assert_array_equal(top_k(keys, k), _stable_order(keys)[:k])
+
+
+def test_maximization_ties_keep_the_lower_index():
+    costs = np.array([1.0, 5.0, 3.0, 5.0, 5.0, 2.0])
+    order = FitnessOrder(costs, True)
+
+    np.testing.assert_array_equal(order.top(2), [1, 3])
+    np.testing.assert_array_equal(order.bottom(1), [0])
+    assert order.best() == 1
+
+
+def test_nan_keys_rank_last():
+    keys = np.array([np.nan, 2.0, np.nan, 1.0, 2.0])
+
+    np.testing.assert_array_equal(top_k(keys, 3), [3, 1, 4])
+    np.testing.assert_array_equal(top_k(keys, 4), [3, 1, 4, 0])
@@ -0,0 +1,47 @@
+import csv
+
+import pytest
+
+from src.config.config_loader import island_config_from_dict
+from src.config.results_config import ResultsConfig
+from src.config.termination_config import TerminationConfig
+from src.core.island import IslandModel
+from src.core.simulation import Simulation
+from tests.conftest import make_simulation_config
+
+
+ISLAND_SECTION = {"islands_count": 2, "migration_interval": 5, "migrants_count": 1, "topology": "RING"}
+
+
+def test_island_config_without_termination_is_accepted():
+    island_config = island_config_from_dict({"island_config": ISLAND_SECTION})
+
+    assert island_config.islands_count == 2
+
+
+def test_termination_config_is_rejected_by_the_loader():
+    with pytest.raises(AssertionError, match="termination_config"):
+        island_config_from_dict({"island_config": ISLAND_SECTION, "termination_config": {"stagnation_epochs": 10}})
+
+
+def test_termination_config_is_rejected_by_the_model(simulation_config):
+    simulation_config.termination_config = TerminationConfig(stagnation_epochs=10)
+
+    with pytest.raises(AssertionError, match="termination_config"):
+        IslandModel(simulation_config, island_config_from_dict({"island_config": ISLAND_SECTION}))
+
+
+def test_results_csv_numbers_the_recorded_epochs(tmp_path):
+    simulation_config = make_simulation_config(epochs_no=10, results_config=ResultsConfig(record_every=3))
+    model = IslandModel(simulation_config, island_config_from_dict({"island_config": ISLAND_SECTION}),
+                        results_dir=str(tmp_path), quiet=True)
+    model.start()
+
+    with open(model.results_dir / "results.csv", newline="") as f:
+        epochs = [int(row[0]) for row in list(csv.reader(f))[1:]]
+
+    single = Simulation(make_simulation_config(epochs_no=10, results_config=ResultsConfig(record_every=3)),
+                        results_dir=str(tmp_path / "single"), quiet=True)
+    single.start()
+    assert epochs == model.history_epochs == single.history_epochs.tolist()
+    assert epochs != list(range(1, len(epochs) + 1))
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from src.core import benchmark_functions_backend as reference
+from src.core import native_cost_functions as native
+
+FUNCTION_NAMES = ["Rastrigin", "Rosenbrock", "Ackley", "Hypersphere", "Hyperellipsoid"]
+DIMENSIONS = [1, 2, 5, 30]
+
+
+def _points(name: str, dims: int, count: int) -> np.ndarray:
+    lower, upper = getattr(reference, name)(dims).suggested_bounds()
+    return np.random.default_rng(dims).uniform(lower, upper, size=(count, dims))
+
+
+@pytest.mark.parametrize("opposite", [False, True])
+@pytest.mark.parametrize("dims", DIMENSIONS)
+@pytest.mark.parametrize("name", FUNCTION_NAMES)
+def test_single_points_match_reference(name, dims, opposite):
+    if name == "Rosenbrock" and dims == 1:
+        pytest.skip("Rosenbrock needs at least two dimensions")
+    native_func = getattr(native, name)(dims, opposite=opposite)
+    reference_func = getattr(reference, name)(dims, opposite=opposite)
+
+    for point in _points(name, dims, 20):
+        cost = native_func(point)
+        assert isinstance(cost, float)
+        assert cost == pytest.approx(reference_func(point.tolist()), rel=1e-12, abs=1e-12)
+
+
+@pytest.mark.parametrize("opposite", [False, True])
+@pytest.mark.parametrize("dims", DIMENSIONS)
+@pytest.mark.parametrize("name", FUNCTION_NAMES)
+def test_batches_match_reference(name, dims, opposite):
+    if name == "Rosenbrock" and dims == 1:
+        pytest.skip("Rosenbrock needs at least two dimensions")
+    native_func = getattr(native, name)(dims, opposite=opposite)
+    reference_func = getattr(reference, name)(dims, opposite=opposite)
+    points = _points(name, dims, 50)
+
+    costs = native_func(points)
+    assert costs.shape == (50,)
+    np.testing.assert_allclose(costs, [reference_func(point.tolist()) for point in points], rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(native_func.evaluate_batch(points), costs)
+
+
+@pytest.mark.parametrize("dims", DIMENSIONS)
+@pytest.mark.parametrize("name", FUNCTION_NAMES)
+def test_suggested_bounds_match_reference(name, dims):
+    lower, upper = getattr(native, name)(dims).suggested_bounds()
+    reference_lower, reference_upper = getattr(reference, name)(dims).suggested_bounds()
+    assert list(lower) == pytest.approx(list(reference_lower))
+    assert list(upper) == pytest.approx(list(reference_upper))
+
+
+def test_ackley_parameters_match_reference():
+    native_func = native.Ackley(4, a=15, b=0.3, c=np.pi)
+    reference_func = reference.Ackley(4, a=15, b=0.3, c=np.pi)
+    for point in _points("Ackley", 4, 10):
+        assert native_func(point) == pytest.approx(reference_func(point.tolist()), rel=1e-12, abs=1e-12)
+
+
+def test_batch_with_wrong_dimensions_is_rejected():
+    with pytest.raises(ValueError):
+        native.Rastrigin(3).evaluate_batch(np.zeros((4, 2)))
+
+
+def test_base_class_is_abstract():
+    with pytest.raises(TypeError):
+        native.NativeCostFunction(2)
@@ -0,0 +1,210 @@
+import numpy as np
+import pytest
+
+from src.core import random_service
+from src.core.crossing import (AlphaBetaBlendCrossing, AlphaBlendCrossing, ArithmeticCrossing, LinearCrossing,
+                               MeanCrossing)
+from src.core.inversion import StandardInversion
+from src.core.mutation import GaussianMutation, UniformMutation
+from src.core.unit import Unit, UnitFactory
+
+UNIT_FACTORY = UnitFactory([-5.0] * 4, [5.0] * 4)
+
+
+# the batch operators replace the per-unit ones, so seeded samples of both must agree in distribution
+SAMPLES = 4000
+
+
+def _unit():
+    return Unit(np.array([1.0, 2.0, 3.0, 4.0]), cost=7.0)
+
+
+@pytest.mark.parametrize("mutation", [UniformMutation(100, UNIT_FACTORY), GaussianMutation(100, UNIT_FACTORY, 1.0)],
+                         ids=["uniform", "gaussian"])
+def test_mutated_unit_has_no_cost(mutation):
+    random_service.seed(3)
+    unit = _unit()
+
+    mutated = mutation.mutate(unit)
+
+    assert not np.array_equal(mutated.real_values, unit.real_values)
+    assert mutated.cost is None
+    assert unit.cost == 7.0
+
+
+@pytest.mark.parametrize("mutation", [UniformMutation(0, UNIT_FACTORY), GaussianMutation(0, UNIT_FACTORY, 1.0)],
+                         ids=["uniform", "gaussian"])
+def test_unchanged_unit_keeps_its_cost(mutation):
+    random_service.seed(3)
+
+    mutated = mutation.mutate(_unit())
+
+    np.testing.assert_array_equal(mutated.real_values, _unit().real_values)
+    assert mutated.cost == 7.0
+
+
+def test_inverted_unit_has_no_cost():
+    random_service.seed(3)
+    inversion = StandardInversion(UNIT_FACTORY, 99)
+
+    inverted = inversion.invert(_unit())
+
+    assert not np.array_equal(inverted.real_values, _unit().real_values)
+    assert inverted.cost is None
+
+
+PARENTS = np.array([[-4.0, 0.0, 1.0, 2.5], [3.0, 0.5, 1.0, -2.5]])
+
+
+def _legacy_crossing(crossing):
+    """(crossed flags, children as (samples, children_count, dims)) of per-unit 'cross' on PARENTS"""
+    random_service.seed(5)
+    parent1, parent2 = Unit(PARENTS[0].copy()), Unit(PARENTS[1].copy())
+    flags, children = [], []
+    for _ in range(SAMPLES):
+        result = crossing.cross(parent1, parent2)
+        crossed = result[0] is not parent1
+        flags.append(crossed)
+        if crossed:
+            children.append([np.asarray(child.real_values) for child in result])
+    return np.array(flags), np.array(children)
+
+
+def _batch_crossing(crossing):
+    pairs = np.zeros(SAMPLES, dtype=np.intp)
+    candidates, crossed = crossing.cross_batch(PARENTS, pairs, pairs + 1, np.random.default_rng(6))
+    return crossed, candidates[crossed]
+
+
+@pytest.mark.parametrize("crossing", [LinearCrossing(70), ArithmeticCrossing(70, 0.3), MeanCrossing(70)],
+                         ids=["linear", "arithmetic", "mean"])
+def test_deterministic_crossings_match_cross(crossing):
+    legacy_flags, legacy_children = _legacy_crossing(crossing)
+    batch_flags, batch_children = _batch_crossing(crossing)
+
+    assert batch_flags.mean() == pytest.approx(legacy_flags.mean(), abs=0.04)
+    assert batch_children.shape[1] == crossing.children_count
+    np.testing.assert_allclose(batch_children, np.broadcast_to(legacy_children[0], batch_children.shape))
+    np.testing.assert_allclose(legacy_children, np.broadcast_to(legacy_children[0], legacy_children.shape))
+
+
+@pytest.mark.parametrize("crossing,alpha,beta", [
+    (AlphaBlendCrossing(70), 0.5, 0.5),
+    (AlphaBetaBlendCrossing(70), 0.3, 0.7)
+], ids=["alpha-blend", "alpha-beta-blend"])
+def test_blend_crossings_match_cross(crossing, alpha, beta):
+    legacy_flags, legacy_children = _legacy_crossing(crossing)
+    batch_flags, batch_children = _batch_crossing(crossing)
+
+    assert batch_flags.mean() == pytest.approx(legacy_flags.mean(), abs=0.04)
+    distance = np.abs(PARENTS[0] - PARENTS[1])
+    low = PARENTS.min(axis=0) - alpha * distance
+    high = PARENTS.max(axis=0) + beta * distance
+    for children in (legacy_children, batch_children):
+        assert (children >= low).all() and (children <= high).all()
+        # every child gene is uniform on its own dimension's range
+        spread = np.where(distance > 0, high - low, 1.0)
+        relative = (children - low) / spread
+        for dim in np.flatnonzero(distance > 0):
+            quantiles = np.quantile(relative[:, :, dim], [0.1, 0.5, 0.9])
+            np.testing.assert_allclose(quantiles, [0.1, 0.5, 0.9], atol=0.04)
+    # equal parent genes leave no room to blend
+    np.testing.assert_array_equal(batch_children[:, :, 2], 1.0)
+    np.testing.assert_array_equal(legacy_children[:, :, 2], 1.0)
+
+
+MUTATION_FACTORY = UnitFactory([-5.0, -1.0, 0.0, 10.0], [5.0, 1.0, 2.0, 20.0])
+MUTATION_GENES = np.array([0.0, 0.0, 1.0, 15.0])
+
+
+def _legacy_mutation(mutation):
+    random_service.seed(7)
+    return np.array([mutation.mutate(Unit(MUTATION_GENES.copy())).real_values for _ in range(SAMPLES)])
+
+
+def _batch_mutation(mutation):
+    genes = np.tile(MUTATION_GENES, (SAMPLES, 1))
+    changed_rows = mutation.mutate_population(genes, np.random.default_rng(8))
+    np.testing.assert_array_equal(changed_rows, (genes != MUTATION_GENES).any(axis=1))
+    return genes
+
+
+@pytest.mark.parametrize("mutation", [UniformMutation(30, MUTATION_FACTORY), GaussianMutation(30, MUTATION_FACTORY, 0.2)],
+                         ids=["uniform", "gaussian"])
+def test_batch_mutation_rate_per_gene_matches_mutate(mutation):
+    legacy = _legacy_mutation(mutation) != MUTATION_GENES
+    batch = _batch_mutation(mutation) != MUTATION_GENES
+
+    np.testing.assert_allclose(batch.mean(axis=0), 0.3, atol=0.03)
+    np.testing.assert_allclose(batch.mean(axis=0), legacy.mean(axis=0), atol=0.04)
+
+
+def test_batch_uniform_mutation_values_match_mutate():
+    mutation = UniformMutation(50, MUTATION_FACTORY)
+    lower, upper = MUTATION_FACTORY.bounds(4)
+
+    for genes in (_legacy_mutation(mutation), _batch_mutation(mutation)):
+        for dim in range(4):
+            mutated = genes[genes[:, dim] != MUTATION_GENES[dim], dim]
+            relative = (mutated - lower[dim]) / (upper[dim] - lower[dim])
+            assert (relative >= 0).all() and (relative <= 1).all()
+            np.testing.assert_allclose(np.quantile(relative, [0.1, 0.5, 0.9]), [0.1, 0.5, 0.9], atol=0.05)
+
+
+def test_batch_gaussian_mutation_steps_match_mutate():
+    mutation = GaussianMutation(50, MUTATION_FACTORY, 0.2)
+    lower, upper = MUTATION_FACTORY.bounds(4)
+
+    steps = []
+    for genes in (_legacy_mutation(mutation), _batch_mutation(mutation)):
+        assert (genes >= lower).all() and (genes <= upper).all()
+        # dimension 3 sits 25 sigmas from its bounds, so its steps are never clipped
+        steps.append(genes[genes[:, 3] != MUTATION_GENES[3], 3] - MUTATION_GENES[3])
+    for step in steps:
+        assert step.mean() == pytest.approx(0.0, abs=0.02)
+        assert step.std() == pytest.approx(0.2, rel=0.05)
+
+
+def test_batch_gaussian_mutation_clips_like_mutate():
+    # dimension 1 spans 1.67 sigmas either way, so about a tenth of its steps hit a bound
+    mutation = GaussianMutation(50, MUTATION_FACTORY, 0.6)
+
+    clipped = [np.mean(np.abs(genes[:, 1]) == 1.0) for genes in (_legacy_mutation(mutation), _batch_mutation(mutation))]
+
+    assert clipped[1] == pytest.approx(0.5 * 0.095, abs=0.015)
+    assert clipped[0] == pytest.approx(clipped[1], abs=0.02)
+
+
+INVERSION_GENES = np.arange(5.0)
+
+
+def _segments(genes):
+    """(left, right) of the reversed segment of every changed row; distinct genes always move both ends"""
+    changed = genes != INVERSION_GENES
+    rows = np.flatnonzero(changed.any(axis=1))
+    left = changed[rows].argmax(axis=1)
+    right = genes.shape[1] - 1 - changed[rows, ::-1].argmax(axis=1)
+    return rows, left, right
+
+
+def test_batch_inversion_segments_match_invert():
+    inversion = StandardInversion(UNIT_FACTORY, 60)
+    random_service.seed(9)
+    legacy = np.array([inversion.invert(Unit(INVERSION_GENES.copy())).real_values for _ in range(SAMPLES)])
+    batch = np.tile(INVERSION_GENES, (SAMPLES, 1))
+    inverted = inversion.invert_population(batch, np.random.default_rng(10))
+
+    frequencies = []
+    for genes in (legacy, batch):
+        rows, left, right = _segments(genes)
+        assert (left < right).all()
+        np.testing.assert_array_equal(genes[rows, left], INVERSION_GENES[right])
+        assert rows.shape[0] / SAMPLES == pytest.approx(0.6, abs=0.03)
+        table = np.zeros((5, 5))
+        np.add.at(table, (left, right), 1)
+        frequencies.append(table / rows.shape[0])
+    np.testing.assert_array_equal(np.flatnonzero(inverted), _segments(batch)[0])
+    np.testing.assert_allclose(frequencies[1], frequencies[0], atol=0.03)
+    # left is uniform over 0..3, then right over left+1..4
+    expected = np.array([[1 / 4 / (4 - left) if right > left else 0.0 for right in range(5)] for left in range(5)])
+    np.testing.assert_allclose(frequencies[1], expected, atol=0.02)
@@ -0,0 +1,122 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.core import random_service
+from src.core.fitness_order import FitnessOrder
+from src.core.selection import RouletteWheelSelection, TournamentSelection
+from src.core.unit import Unit
+
+SAMPLES = 5_000
+
+
+def _legacy_frequencies(selection, costs):
+    random_service.seed(1)
+    population = [Unit([float(cost)], float(cost)) for cost in costs]
+    positions = {id(unit): i for i, unit in enumerate(population)}
+    counts = np.zeros(len(costs))
+    for _ in range(SAMPLES):
+        for unit in selection.select(population, 0):
+            counts[positions[id(unit)]] += 1
+    return counts / SAMPLES
+
+
+def _batch_frequencies(selection, costs):
+    rng = np.random.default_rng(2)
+    counts = np.zeros(len(costs))
+    for _ in range(SAMPLES):
+        winners = selection.select_indices(costs, 0, rng)
+        assert np.unique(winners).shape == winners.shape
+        counts[winners] += 1
+    return counts / SAMPLES
+
+
+@pytest.mark.parametrize("size,tournament_size,is_maximization", [
+    (12, 3, False),
+    (12, 3, True),
+    (10, 4, False),
+    (7, 2, True),
+    (2, 3, False),
+    (20, 20, False),
+    (30, 20, True),
+    (11, 6, False)
+])
+def test_select_indices_matches_select(size, tournament_size, is_maximization):
+    selection = TournamentSelection(tournament_size, is_maximization)
+    costs = np.random.default_rng(size).permutation(size).astype(float)
+
+    batch = _batch_frequencies(selection, costs)
+
+    assert batch.sum() == pytest.approx(-(-size // tournament_size))
+    np.testing.assert_allclose(batch, _legacy_frequencies(selection, costs), atol=0.04)
+
+
+def test_best_individual_can_lose_every_tournament():
+    # 12 individuals in tournaments of 3: the best one is drawn into one of them with probability 0.75
+    best_picked = _batch_frequencies(TournamentSelection(3, False), np.arange(12.0))[0]
+
+    assert best_picked == pytest.approx(0.75, abs=0.03)
+
+
+@pytest.mark.parametrize("size,tournament_size", [(20, 20), (30, 20), (100, 50), (100, 99)])
+def test_large_tournaments_do_not_stall(size, tournament_size):
+    selection = TournamentSelection(tournament_size, False)
+    costs = np.random.default_rng(0).random(size)
+    rng = np.random.default_rng(1)
+
+    started = time.perf_counter()
+    for _ in range(100):
+        winners = selection.select_indices(costs, 0, rng)
+    # generous: a rejection sampler of distinct contenders needed seconds per call here
+    assert time.perf_counter() - started < 5.0
+    assert winners.shape == (-(-size // tournament_size),)
+    assert np.unique(winners).shape == winners.shape
+
+
+def test_whole_population_tournament_always_picks_the_best():
+    costs = np.random.default_rng(0).random(20)
+
+    winners = TournamentSelection(20, False).select_indices(costs, 0, np.random.default_rng(1))
+
+    np.testing.assert_array_equal(winners, [np.argmin(costs)])
+
+
+class _RecordingOrder(FitnessOrder):
+    def __init__(self, costs, maximize):
+        super().__init__(costs, maximize)
+        self.requested = []
+
+    def top(self, k, ordered=True):
+        self.requested.append(k)
+        return super().top(k, ordered)
+
+
+def test_only_the_needed_prefix_of_the_shared_ranking_is_built():
+    costs = np.random.default_rng(0).random(1000)
+    order = _RecordingOrder(costs, False)
+
+    winners = TournamentSelection(50, False).select_indices(costs, 0, np.random.default_rng(1), order)
+
+    assert max(order.requested) < costs.shape[0]
+    assert np.isin(winners, np.argsort(costs, kind="stable")[:max(order.requested)]).all()
+
+
+@pytest.mark.parametrize("is_maximization", [True, False])
+def test_roulette_with_negative_costs_matches_select(is_maximization):
+    selection = RouletteWheelSelection(is_maximization)
+    costs = np.array([-5.0, -1.0, 2.0, -3.0, 0.5])
+    rng = np.random.default_rng(3)
+
+    counts = np.zeros(costs.shape[0])
+    for _ in range(SAMPLES):
+        np.add.at(counts, selection.select_indices(costs, 4, rng), 1)
+    batch = counts / (SAMPLES * 4)
+
+    weights = costs - costs.min() if is_maximization else costs.max() - costs + 1e-9
+    np.testing.assert_allclose(batch, weights / weights.sum(), atol=0.02)
+    random_service.seed(1)
+    population = [Unit([float(cost)], float(cost)) for cost in costs]
+    picked = [unit.cost for _ in range(SAMPLES // 10) for unit in selection.select(population, 4)]
+    legacy = np.array([picked.count(cost) for cost in costs]) / len(picked)
+    np.testing.assert_allclose(batch, legacy, atol=0.04)
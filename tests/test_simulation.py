@@ -0,0 +1,15 @@
+from src.config.results_config import ResultsConfig
+from src.core.simulation import Simulation
+from tests.conftest import make_simulation_config
+
+
+def test_progress_callback_counts_epochs_from_one(tmp_path):
+    reported = []
+    simulation = Simulation(make_simulation_config(epochs_no=5, results_config=ResultsConfig(record_every=2)),
+                            results_dir=str(tmp_path), quiet=True,
+                            progress_callback=lambda epoch, total, best, avg, std: reported.append((epoch, total)))
+    simulation.start()
+
+    # every evaluation is reported, including those record_every leaves out of the history
+    assert reported == [(epoch, 5) for epoch in range(1, 7)]
+    assert set(simulation.history_epochs.tolist()) <= {epoch for epoch, _ in reported}
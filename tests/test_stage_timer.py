@@ -0,0 +1,46 @@
+import csv
+
+from src.config.checkpoint_config import CheckpointConfig
+from src.config.results_config import ResultsConfig
+from src.core.simulation import Simulation
+from tests.conftest import make_simulation_config
+
+
+def _timed_config(**kwargs):
+    return make_simulation_config(epochs_no=10, results_config=ResultsConfig(record_stage_timings=True), **kwargs)
+
+
+def _csv_epochs(path):
+    with open(path, newline="") as f:
+        return [int(row[0]) for row in list(csv.reader(f))[1:]]
+
+
+def test_rows_are_numbered_like_results_csv(tmp_path):
+    simulation = Simulation(_timed_config(), results_dir=str(tmp_path), quiet=True)
+    simulation.start()
+
+    epochs = [row[0] for row in simulation.stage_timer.rows]
+    assert epochs == simulation.history_epochs.tolist() == list(range(1, 12))
+    assert _csv_epochs(simulation.results_dir / "stage_timings.csv") == epochs
+    assert simulation.stage_timer.totals()["evaluations"] == simulation.cost_evaluations
+
+
+def test_rows_after_resume_continue_the_epoch_numbering(tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.npz")
+
+    def stop_at_epoch_4(epoch, total, best, avg, std):
+        if epoch == 4:
+            interrupted.request_stop()
+
+    interrupted = Simulation(_timed_config(checkpoint_config=CheckpointConfig(checkpoint_path, every_epochs=1000)),
+                             results_dir=str(tmp_path / "interrupted"), quiet=True, progress_callback=stop_at_epoch_4)
+    interrupted.start()
+    assert interrupted.cancelled
+
+    resumed = Simulation(_timed_config(checkpoint_config=CheckpointConfig(checkpoint_path, every_epochs=1000)),
+                         results_dir=str(tmp_path / "resumed"), quiet=True)
+    resumed.resume(checkpoint_path)
+
+    epochs = _csv_epochs(resumed.results_dir / "stage_timings.csv")
+    assert epochs == [row[0] for row in resumed.stage_timer.rows]
+    assert epochs == list(range(interrupted.epochs_completed + 1, 12))
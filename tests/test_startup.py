@@ -0,0 +1,33 @@
+import math
+
+import pytest
+
+from src.core.benchmark import HEAVY_MODULES, IMPORT_CHECKS, measure_imports
+
+# far above DEFAULT_IMPORT_BUDGET_SEC: only a gross slowdown should fail on a loaded machine
+SMOKE_BUDGET_SEC = 5.0
+
+
+@pytest.fixture(scope="module")
+def imports():
+    # no time budget here; the timing smoke check below is separate
+    return measure_imports(budget_sec=math.inf)
+
+
+def test_every_entry_point_is_probed(imports):
+    assert [result["module"] for result in imports] == list(IMPORT_CHECKS)
+
+
+@pytest.mark.parametrize("module", IMPORT_CHECKS)
+def test_entry_point_loads_no_heavy_module(imports, module):
+    result = next(result for result in imports if result["module"] == module)
+
+    assert "error" not in result, result["error"]
+    assert result["heavy_modules"] == [], f"{module} loads {result['heavy_modules']} (any of {HEAVY_MODULES})"
+
+
+@pytest.mark.parametrize("module", IMPORT_CHECKS)
+def test_entry_point_imports_quickly(imports, module):
+    result = next(result for result in imports if result["module"] == module)
+
+    assert result.get("seconds", 0.0) < SMOKE_BUDGET_SEC
@@ -0,0 +1,65 @@
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.core import sweep
+from src.core.results_saver import config_to_dict
+from src.core.sweep import FAILURES_FILENAME, SAMPLE_SEED_FILENAME, ParameterSweep, cell_id
+from tests.conftest import make_simulation_config
+
+GRID = {"general_config.population_size": [10, 12, 14, 16], "general_config.epochs_no": [2, 3]}
+
+
+@pytest.fixture
+def base_config():
+    return config_to_dict(make_simulation_config(epochs_no=2))
+
+
+def test_cell_id_depends_on_base_config(base_config):
+    changed = json.loads(json.dumps(base_config))
+    changed["general_config"]["chromosome_precision"] += 1
+
+    assert cell_id(base_config, {"a": 1}, 0) == cell_id(json.loads(json.dumps(base_config)), {"a": 1}, 0)
+    assert cell_id(base_config, {"a": 1}, 0) != cell_id(changed, {"a": 1}, 0)
+
+
+def test_generated_sample_seed_is_reused_on_resume(tmp_path, base_config):
+    first = ParameterSweep(base_config, GRID, [0], str(tmp_path), samples=3, quiet=True)
+    resumed = ParameterSweep(base_config, GRID, [0], str(tmp_path), samples=3, quiet=True)
+
+    assert (tmp_path / SAMPLE_SEED_FILENAME).exists()
+    assert resumed.sample_seed == first.sample_seed
+    assert resumed.cells == first.cells
+
+
+def test_given_sample_seed_is_used(tmp_path, base_config):
+    seeded = ParameterSweep(base_config, GRID, [0], str(tmp_path), samples=3, sample_seed=5, quiet=True)
+
+    assert seeded.sample_seed == 5
+    assert seeded.cells == sweep.expand_grid(GRID, 3, 5)
+
+
+def _crash_on_population_14(config_dict, seed, runs_dir):
+    if config_dict["general_config"]["population_size"] == 14:
+        os._exit(1)
+    return _run_cell(config_dict, seed, runs_dir)
+
+
+_run_cell = sweep.run_cell
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched run_cell")
+def test_worker_crash_is_charged_to_the_crashing_run_only(tmp_path, base_config, monkeypatch):
+    monkeypatch.setattr(sweep, "run_cell", _crash_on_population_14)
+    parameter_sweep = ParameterSweep(base_config, {"general_config.population_size": [10, 12, 14, 16]}, [0, 1],
+                                     str(tmp_path), workers=4, quiet=True)
+    parameter_sweep.run()
+
+    with open(tmp_path / FAILURES_FILENAME) as f:
+        failures = [json.loads(line) for line in f]
+    assert sorted(failure["seed"] for failure in failures) == [0, 1]
+    assert all(failure["overrides"] == {"general_config.population_size": 14} for failure in failures)
+    assert all(failure["attempts"] == sweep.MAX_POOL_ATTEMPTS for failure in failures)
+    assert len(parameter_sweep.completed_ids()) == 6